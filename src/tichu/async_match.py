@@ -0,0 +1,28 @@
+import asyncio
+from collections.abc import Sequence
+
+from tichu.tichu import Tichu, TichuHooks
+
+
+async def play_matches(
+    games: Sequence[Tichu],
+    hooks: TichuHooks | None = None,
+    max_rounds: int | None = None,
+    max_invalid_plays: int | None = 3,
+    max_concurrency: int | None = None,
+) -> list[list[int]]:
+    """Play the matches of games set up with new_game concurrently.
+
+    While one game waits for an async player, the others keep playing. At
+    most max_concurrency matches run at the same time if it is set. Returns
+    the final scores of every game.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def play_match(game: Tichu) -> list[int]:
+        if semaphore is None:
+            return await game.play_match_async(hooks, max_rounds, max_invalid_plays)
+        async with semaphore:
+            return await game.play_match_async(hooks, max_rounds, max_invalid_plays)
+
+    return list(await asyncio.gather(*(play_match(game) for game in games)))
@@ -1,8 +1,13 @@
+from collections.abc import Iterable
 from enum import Enum
 from functools import reduce
 
 NORMAL_CARD_VALUES = range(2, 15)
 SPECIAL_CARD_VALUES = [0, 1, 50, 100]
+NUM_COLORS = 4
+NUM_CARDS = len(NORMAL_CARD_VALUES) * NUM_COLORS + len(SPECIAL_CARD_VALUES)
+
+type CardMask = int
 
 
 class Color(Enum):
@@ -14,18 +19,63 @@ class Color(Enum):
 
 
 class Card:
-    def __init__(self, color: Color, value: int):
-        self.color = color
+    """A playing card.
+
+    Cards are interned: the 56 instances are created once at import and
+    ``Card(color, value)`` returns the existing instance, so cards compare
+    by identity.
+    """
+
+    __slots__ = ("color", "value", "index", "mask", "_score", "_name")
+    _instances: dict[tuple[Color, int], "Card"] = {}
+
+    color: Color
+    value: int
+    index: int
+    mask: CardMask
+    _score: int
+    _name: str
+
+    def __new__(cls, color: Color, value: int) -> "Card":
+        card = cls._instances.get((color, value))
+        if card is not None:
+            return card
         if color != Color.SPECIAL and value not in NORMAL_CARD_VALUES:
             msg = "Card value for normal cards must be between 2 and 14."
             raise ValueError(msg)
         if color == Color.SPECIAL and value not in SPECIAL_CARD_VALUES:
             msg = "Special cards can only have values 0 (Dog), 1, 50 (Phoenix), or 100 (Dragon)."
             raise ValueError(msg)
-        self.value = value
+        card = super().__new__(cls)
+        card.color = color
+        card.value = value
+        card.index = Card.get_index(color, value)
+        card.mask = 1 << card.index
+        card._score = Card._compute_score(value)
+        card._name = Card._compute_name(color, value)
+        cls._instances[(color, value)] = card
+        return card
 
-    def get_score(self) -> int:
-        match self.value:
+    @staticmethod
+    def from_index(index: int) -> "Card":
+        return CARDS_BY_INDEX[index]
+
+    @staticmethod
+    def get_index(color: Color, value: int) -> int:
+        """Bit position of a card in a CardMask, ordered by value then color."""
+        match value:
+            case 0 | 1:
+                return value
+            case 50:
+                return NUM_CARDS - 2
+            case 100:
+                return NUM_CARDS - 1
+            case _:
+                return 2 + (value - NORMAL_CARD_VALUES[0]) * NUM_COLORS + color.value
+
+    @staticmethod
+    def _compute_score(value: int) -> int:
+        match value:
             case 50:
                 return -25
             case 100:
@@ -38,41 +88,91 @@ class Card:
                 return 0
 
     @staticmethod
-    def count_card_scores(cards: list["Card"]) -> int:
-        return reduce(lambda total, card: total + card.get_score(), cards, 0)
-
-    def __str__(self):
-        match self.value:
+    def _compute_name(color: Color, value: int) -> str:
+        match value:
             case 0:
-                return f"Dog"
+                return "Dog"
             case 1:
-                return f"Mah Jong"
+                return "Mah Jong"
             case 50:
-                return f"Phoenix"
+                return "Phoenix"
             case 100:
-                return f"Dragon"
+                return "Dragon"
             case 11:
-                return f"{self.color.name} Jack"
+                return f"{color.name} Jack"
             case 12:
-                return f"{self.color.name} Queen"
+                return f"{color.name} Queen"
             case 13:
-                return f"{self.color.name} King"
+                return f"{color.name} King"
             case 14:
-                return f"{self.color.name} Ace"
+                return f"{color.name} Ace"
             case _:
-                return f"{self.color.name} {self.value}"
+                return f"{color.name} {value}"
+
+    def get_score(self) -> int:
+        return self._score
+
+    @staticmethod
+    def count_card_scores(cards: list["Card"]) -> int:
+        return reduce(lambda total, card: total + card._score, cards, 0)
+
+    def __str__(self):
+        return self._name
 
     def __repr__(self):
         return f"Card(color={self.color}, value={self.value})"
 
-    def __eq__(self, value):
-        return self.color == value.color and self.value == value.value
-
     def __hash__(self):
-        return hash((self.color, self.value))
+        return self.index
+
+    def __reduce__(self):
+        return Card, (self.color, self.value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def to_mask(cards: Iterable[Card] | CardMask) -> CardMask:
+    """Encode cards as a bitmask with one bit per card."""
+    if isinstance(cards, int):
+        return cards
+    mask = 0
+    for card in cards:
+        mask |= card.mask
+    return mask
+
+
+def from_mask(mask: CardMask) -> list[Card]:
+    """Decode a bitmask into its cards, sorted by value."""
+    cards = []
+    while mask:
+        low_bit = mask & -mask
+        cards.append(CARDS_BY_INDEX[low_bit.bit_length() - 1])
+        mask ^= low_bit
+    return cards
+
+
+def count_mask_scores(mask: CardMask) -> int:
+    return sum(card.get_score() for card in from_mask(mask & SCORING_MASK))
 
 
 DOG = Card(Color.SPECIAL, 0)
 MAH_JONG = Card(Color.SPECIAL, 1)
 PHOENIX = Card(Color.SPECIAL, 50)
 DRAGON = Card(Color.SPECIAL, 100)
+
+DECK = tuple(
+    [
+        Card(color, value)
+        for color in Color
+        if color != Color.SPECIAL
+        for value in NORMAL_CARD_VALUES
+    ]
+    + [DOG, MAH_JONG, PHOENIX, DRAGON]
+)
+CARDS_BY_INDEX = tuple(sorted(DECK, key=lambda c: c.index))
+SCORING_MASK = to_mask(card for card in DECK if card.get_score() != 0)
+FULL_MASK: CardMask = (1 << NUM_CARDS) - 1
@@ -1,9 +1,27 @@
+import math
+import random
 from collections import defaultdict
+from collections.abc import Iterator
 from enum import Enum
 from functools import reduce
-from itertools import combinations
+from itertools import combinations, islice, product
+from dataclasses import dataclass, field
+from typing import NamedTuple
 
-from tichu.card import Card, Color, DOG, MAH_JONG, PHOENIX, DRAGON
+from tichu.card import (
+    CARDS_BY_INDEX,
+    NORMAL_CARD_VALUES,
+    NUM_CARDS,
+    NUM_COLORS,
+    Card,
+    CardMask,
+    Color,
+    DOG,
+    MAH_JONG,
+    PHOENIX,
+    DRAGON,
+    from_mask,
+)
 
 
 class CombinationType(Enum):
@@ -26,6 +44,94 @@ class CombinationType(Enum):
                 return 0
 
 
+# A combination key stores one 4-bit count per value slot (Dog, Mah Jong,
+# the 13 normal values, Phoenix and Dragon) plus a flag for single-colored
+# card sets. Combination.from_cards only depends on this information.
+KEY_SLOT_BITS = 4
+KEY_NORMAL_SHIFT = 2 * KEY_SLOT_BITS
+KEY_PHOENIX_SHIFT = 15 * KEY_SLOT_BITS
+KEY_DRAGON_SHIFT = 16 * KEY_SLOT_BITS
+KEY_FLUSH_FLAG = 1 << (17 * KEY_SLOT_BITS)
+_NORMAL_BITS = (1 << (len(NORMAL_CARD_VALUES) * NUM_COLORS)) - 1
+_COLOR_MASKS = [
+    sum(1 << (i * NUM_COLORS + color) for i in range(len(NORMAL_CARD_VALUES)))
+    for color in range(NUM_COLORS)
+]
+_NIBBLE_MASK_1 = int("5" * 13, 16)
+_NIBBLE_MASK_2 = int("3" * 13, 16)
+
+
+def _get_key_slot(card: Card) -> int:
+    match card.value:
+        case 0 | 1:
+            return card.value
+        case 50:
+            return KEY_PHOENIX_SHIFT // KEY_SLOT_BITS
+        case 100:
+            return KEY_DRAGON_SHIFT // KEY_SLOT_BITS
+        case _:
+            return card.value
+
+
+_KEY_INCREMENTS = [
+    1 << (_get_key_slot(card) * KEY_SLOT_BITS) for card in CARDS_BY_INDEX
+]
+
+
+def get_combination_key(cards: list[Card] | CardMask) -> int:
+    """Canonical encoding of a card set's value multiset and flush flag."""
+    if isinstance(cards, int):
+        normal = (cards >> 2) & _NORMAL_BITS
+        # Count the cards of each value in parallel, one nibble per value.
+        counts = normal - ((normal >> 1) & _NIBBLE_MASK_1)
+        counts = (counts & _NIBBLE_MASK_2) + ((counts >> 2) & _NIBBLE_MASK_2)
+        key = (
+            (counts << KEY_NORMAL_SHIFT)
+            | (cards & 1)
+            | (cards >> 1 & 1) << KEY_SLOT_BITS
+            | (cards >> (NUM_CARDS - 2) & 1) << KEY_PHOENIX_SHIFT
+            | (cards >> (NUM_CARDS - 1) & 1) << KEY_DRAGON_SHIFT
+        )
+        is_flush = normal == 0 or (
+            cards == normal << 2
+            and (
+                normal & _COLOR_MASKS[0] == normal
+                or normal & _COLOR_MASKS[1] == normal
+                or normal & _COLOR_MASKS[2] == normal
+                or normal & _COLOR_MASKS[3] == normal
+            )
+        )
+    else:
+        key = 0
+        for card in cards:
+            key += _KEY_INCREMENTS[card.index]
+        is_flush = all(card.color == cards[0].color for card in cards)
+    return key | KEY_FLUSH_FLAG if is_flush else key
+
+
+def _cards_from_key(key: int) -> list[Card]:
+    """Build a representative card list for a combination key."""
+    is_flush = bool(key & KEY_FLUSH_FLAG)
+    cards = []
+    for _ in range(key & 0xF):
+        cards.append(DOG)
+    for _ in range(key >> KEY_SLOT_BITS & 0xF):
+        cards.append(MAH_JONG)
+    for value in NORMAL_CARD_VALUES:
+        for i in range(key >> (value * KEY_SLOT_BITS) & 0xF):
+            color = Color.JADE if is_flush else Color(i % NUM_COLORS)
+            cards.append(Card(color, value))
+    for _ in range(key >> KEY_PHOENIX_SHIFT & 0xF):
+        cards.append(PHOENIX)
+    for _ in range(key >> KEY_DRAGON_SHIFT & 0xF):
+        cards.append(DRAGON)
+    if not is_flush and len(cards) > 1 and all(c.color == Color.JADE for c in cards):
+        cards[-1] = Card(Color.SWORDS, cards[-1].value)
+    return cards
+
+
+_COMBINATION_TABLE: dict[int, tuple[CombinationType, int | float, int] | None] = {}
+
 PAIR_SIZE = 2
 TRIPLE_SIZE = 3
 BOMB_SIZE = 4
@@ -68,8 +174,28 @@ class Combination:
         return hash((self.combination_type, self.value, self.length))
 
     @classmethod
-    def from_cards(cls, cards: list[Card]) -> "Combination | None":
-        cards.sort(key=lambda c: c.value)
+    def from_cards(cls, cards: list[Card] | CardMask) -> "Combination | None":
+        key = get_combination_key(cards)
+        if key not in _COMBINATION_TABLE:
+            _COMBINATION_TABLE[key] = Combination._classify(_cards_from_key(key))
+        entry = _COMBINATION_TABLE[key]
+        if entry is None:
+            return None
+        return cls(*entry)
+
+    @staticmethod
+    def _classify(
+        cards: list[Card],
+    ) -> tuple[CombinationType, int | float, int] | None:
+        combination = Combination._from_sorted_cards(
+            sorted(cards, key=lambda c: c.value)
+        )
+        if combination is None:
+            return None
+        return combination.combination_type, combination.value, combination.length
+
+    @classmethod
+    def _from_sorted_cards(cls, cards: list[Card]) -> "Combination | None":
         if len(cards) <= TRIPLE_SIZE and all(
             card.value == cards[0].value or card == PHOENIX for card in cards
         ):
@@ -173,8 +299,12 @@ class Combination:
 
     @staticmethod
     def can_fulfill_wish(
-        combination: "Combination | None", wish_value: int, cards: list[Card]
+        combination: "Combination | None",
+        wish_value: int,
+        cards: list[Card] | CardMask,
     ) -> bool:
+        if isinstance(cards, int):
+            cards = from_mask(cards)
         card_count = Combination.get_card_count(cards)
         straight_values = sorted(card_count.keys())
         wish_card_count = card_count.get(wish_value, 0)
@@ -314,295 +444,392 @@ class Combination:
             combination
         )
 
+    @staticmethod
+    def get_card_buckets(cards: list[Card]) -> dict[int, list[Card]]:
+        """Group the cards that can take part in sequences by value."""
+        card_buckets: dict[int, list[Card]] = defaultdict(list)
+        for card in cards:
+            if card.color != Color.SPECIAL or card == MAH_JONG:
+                card_buckets[card.value].append(card)
+        return card_buckets
+
     @staticmethod
     def possible_plays(
         combination: "Combination | None",
-        cards: list[Card],
+        cards: list[Card] | CardMask,
         wish_value: int | None = None,
     ) -> list[set[Card]]:
-        min_value = round(combination.value + 1) if combination else 0
-        card_buckets: dict[int, set[Card]] = defaultdict(set)
-        for card in cards:
-            if card.color != Color.SPECIAL or card == MAH_JONG:
-                card_buckets[card.value].add(card)
-        straight_values = sorted(card_buckets.keys())
-        has_phoenix = PHOENIX in cards
-        has_dragon = DRAGON in cards
-        has_dog = DOG in cards
-        possible_combinations: list[set[Card]] = []
+        return list(Combination.iter_plays(combination, cards, wish_value))
 
-        if (
-            combination is None
-            or combination.combination_type == CombinationType.SINGLE
+    @staticmethod
+    def random_play(
+        combination: "Combination | None",
+        cards: list[Card] | CardMask,
+        wish_value: int | None = None,
+        rng: random.Random | None = None,
+    ) -> set[Card] | None:
+        """Pick a uniformly random play without materialising all plays."""
+        randrange = rng.randrange if rng else random.randrange
+        card_buckets: dict[int, list[Card]] = {}
+        patterns = list(
+            Combination._iter_play_patterns(
+                combination, cards, wish_value, card_buckets
+            )
+        )
+        counts = [pattern.count(card_buckets) for pattern in patterns]
+        play_count = sum(counts)
+        if play_count == 0:
+            return None
+        play_idx = randrange(play_count)
+        for pattern, count in zip(patterns, counts):
+            if play_idx < count:
+                return next(islice(pattern.expand(card_buckets), play_idx, None))
+            play_idx -= count
+        return None
+
+    @staticmethod
+    def iter_plays(
+        combination: "Combination | None",
+        cards: list[Card] | CardMask,
+        wish_value: int | None = None,
+    ) -> Iterator[set[Card]]:
+        """Lazily yield every play that can be made on a combination.
+
+        Plays are yielded grouped by type: singles, pairs, triples, bombs,
+        straights (or straight bombs), full houses and stairs. If the wish
+        can be fulfilled, only plays containing the wished value are built.
+        """
+        card_buckets: dict[int, list[Card]] = {}
+        for pattern in Combination._iter_play_patterns(
+            combination, cards, wish_value, card_buckets
         ):
-            for value in card_buckets.keys():
-                if value >= min_value:
-                    possible_combinations.extend(
-                        [{card} for card in card_buckets[value]]
-                    )
-            if has_phoenix and min_value < DRAGON.value:
-                possible_combinations.append({PHOENIX})
-            if has_dragon:
-                possible_combinations.append({DRAGON})
-            if has_dog and min_value == 0:
-                possible_combinations.append({DOG})
-
-        if combination is None or combination.combination_type == CombinationType.PAIR:
-            for value in card_buckets.keys():
-                if value >= min_value:
-                    if len(card_buckets[value]) >= 2:
-                        possible_combinations.extend(
-                            [
-                                set(combo)
-                                for combo in combinations(card_buckets[value], 2)
-                            ]
-                        )
-                    elif len(card_buckets[value]) == 1 and has_phoenix:
-                        possible_combinations.extend(
-                            [
-                                set(combo) | {PHOENIX}
-                                for combo in combinations(card_buckets[value], 1)
-                            ]
-                        )
-        if (
-            combination is None
-            or combination.combination_type == CombinationType.TRIPLE
+            yield from pattern.expand(card_buckets)
+
+    @staticmethod
+    def count_plays(
+        combination: "Combination | None",
+        cards: list[Card] | CardMask,
+        wish_value: int | None = None,
+    ) -> int:
+        """Number of plays possible_plays would return, without building them."""
+        card_buckets: dict[int, list[Card]] = {}
+        return sum(
+            pattern.count(card_buckets)
+            for pattern in Combination._iter_play_patterns(
+                combination, cards, wish_value, card_buckets
+            )
+        )
+
+    @staticmethod
+    def has_any_play(
+        combination: "Combination | None",
+        cards: list[Card] | CardMask,
+        wish_value: int | None = None,
+    ) -> bool:
+        patterns = Combination._iter_play_patterns(combination, cards, wish_value)
+        return next(patterns, None) is not None
+
+    @staticmethod
+    def play_classes(
+        combination: "Combination | None",
+        cards: list[Card] | CardMask,
+        wish_value: int | None = None,
+    ) -> list["PlayClass"]:
+        """The strategically distinct plays, grouped by rank signature.
+
+        Every play of possible_plays belongs to exactly one class, and
+        plays that possible_plays yields more than once are merged.
+        """
+        card_buckets: dict[int, list[Card]] = {}
+        play_classes: dict[tuple[tuple[int, ...], bool], PlayClass] = {}
+        for pattern in Combination._iter_play_patterns(
+            combination, cards, wish_value, card_buckets
         ):
-            for value in card_buckets.keys():
-                if value >= min_value:
-                    if len(card_buckets[value]) >= 3:
-                        possible_combinations.extend(
-                            [
-                                set(combo)
-                                for combo in combinations(card_buckets[value], 3)
-                            ]
-                        )
-                    elif len(card_buckets[value]) == 2 and has_phoenix:
-                        possible_combinations.extend(
-                            [
-                                set(combo) | {PHOENIX}
-                                for combo in combinations(card_buckets[value], 2)
-                            ]
-                        )
-        if (
-            combination is None
-            or combination.combination_type is not CombinationType.STRAIGHT_BOMB
+            signature = pattern.get_signature()
+            if (signature, pattern.same_color) in play_classes:
+                continue
+            can_be_straight_bomb = pattern.same_color or (
+                len(pattern.parts) >= STRAIGHT_MIN_SIZE
+                and not pattern.extra_cards
+                and all(size == 1 for _, size in pattern.parts)
+                and len(pattern._get_common_colors(card_buckets)) > 0
+            )
+            play_classes[(signature, pattern.same_color)] = PlayClass(
+                signature, can_be_straight_bomb, pattern, card_buckets
+            )
+        return list(play_classes.values())
+
+    @staticmethod
+    def _has_color_run(cards: list[Card]) -> bool:
+        """Whether some color has STRAIGHT_MIN_SIZE consecutive values."""
+        value_bits = [0] * NUM_COLORS
+        for card in cards:
+            if card.color != Color.SPECIAL:
+                value_bits[card.color.value] |= 1 << card.value
+        for bits in value_bits:
+            for _ in range(STRAIGHT_MIN_SIZE - 1):
+                bits &= bits >> 1
+            if bits:
+                return True
+        return False
+
+    @staticmethod
+    def _iter_play_patterns(
+        combination: "Combination | None",
+        cards: list[Card] | CardMask,
+        wish_value: int | None,
+        card_buckets: dict[int, list[Card]] | None = None,
+    ) -> Iterator["_PlayPattern"]:
+        """Yield the non-empty play patterns that can be played on a combination.
+
+        If card_buckets is given, it is filled with the value buckets the
+        patterns refer to before the first pattern is yielded.
+        """
+        if isinstance(cards, int):
+            cards = from_mask(cards)
+        if wish_value is not None and not Combination.can_fulfill_wish(
+            combination, wish_value, cards
         ):
-            for value in card_buckets.keys():
-                if value >= min_value:
-                    if len(card_buckets[value]) >= 4:
-                        possible_combinations.extend(
-                            [
-                                set(combo)
-                                for combo in combinations(card_buckets[value], 4)
-                            ]
-                        )
-        if (
-            combination is None
-            or combination.combination_type == CombinationType.STRAIGHT
+            wish_value = None
+        if card_buckets is None:
+            card_buckets = {}
+        card_buckets.update(Combination.get_card_buckets(cards))
+        bucket_sizes = [len(card_buckets.get(value, ())) for value in range(15)]
+        min_value = round(combination.value + 1) if combination else 0
+        has_phoenix = PHOENIX in cards
+        phoenix = (PHOENIX,)
+        combination_type = combination.combination_type if combination else None
+        values = [
+            value
+            for value in range(max(min_value, 1), 15)
+            if bucket_sizes[value] > 0 and wish_value in (None, value)
+        ]
+
+        if combination_type in (None, CombinationType.SINGLE):
+            for value in values:
+                yield _PlayPattern(((value, 1),))
+            if wish_value is None:
+                if has_phoenix and min_value < DRAGON.value:
+                    yield _PlayPattern((), phoenix)
+                if DRAGON in cards:
+                    yield _PlayPattern((), (DRAGON,))
+                if DOG in cards and min_value == 0:
+                    yield _PlayPattern((), (DOG,))
+        for size, same_value_type in (
+            (PAIR_SIZE, CombinationType.PAIR),
+            (TRIPLE_SIZE, CombinationType.TRIPLE),
         ):
+            if combination_type in (None, same_value_type):
+                for value in values:
+                    if bucket_sizes[value] >= size:
+                        yield _PlayPattern(((value, size),))
+                    elif bucket_sizes[value] == size - 1 and has_phoenix:
+                        yield _PlayPattern(((value, size - 1),), phoenix)
+        if combination_type is not CombinationType.STRAIGHT_BOMB:
+            # Bombs beat every other combination, whatever its value.
+            bomb_min_value = (
+                min_value if combination_type == CombinationType.BOMB else 0
+            )
+            for value in range(max(bomb_min_value, 2), 15):
+                if bucket_sizes[value] >= BOMB_SIZE and wish_value in (None, value):
+                    yield _PlayPattern(((value, BOMB_SIZE),))
+
+        present_counts = [0] * 15
+        for value in range(1, 15):
+            present_counts[value] = present_counts[value - 1] + (
+                bucket_sizes[value] > 0
+            )
+        if combination_type in (None, CombinationType.STRAIGHT):
             for length in range(
                 combination.length if combination else STRAIGHT_MIN_SIZE,
                 combination.length + 1 if combination else 14,
             ):
                 for i in range(14, max(min_value, length) - 1, -1):
-                    window_start = i - (length - 1)
-                    window_end = i
-                    window = [
-                        val
-                        for val in straight_values
-                        if window_start <= val <= window_end
-                    ]
-                    if len(window) == length or (
-                        len(window) == length - 1 and has_phoenix
+                    window = range(i - (length - 1), i + 1)
+                    present = present_counts[i] - present_counts[window.start - 1]
+                    if (wish_value is not None and wish_value not in window) or (
+                        present < length - int(has_phoenix)
                     ):
-
-                        straight_plays: list[set[Card]] = []
-                        for val in range(window_start, window_end + 1):
-                            new_plays = []
-                            for card in card_buckets[val]:
-                                new_plays.extend(
-                                    [
-                                        play | {card}
-                                        for play in (
-                                            straight_plays
-                                            if len(straight_plays) > 0
-                                            else [set()]
-                                        )
-                                    ]
-                                )
-                            if len(card_buckets[val]) == 0:
-                                new_plays.extend(
-                                    [
-                                        play | {PHOENIX}
-                                        for play in (
-                                            straight_plays
-                                            if len(straight_plays) > 0
-                                            else [set()]
-                                        )
-                                    ]
-                                )
-                            if has_phoenix and len(window) == length:
-                                new_plays.extend(
-                                    [
-                                        play | {PHOENIX}
-                                        for play in (
-                                            straight_plays
-                                            if len(straight_plays) > 0
-                                            else [set()]
-                                        )
-                                        if PHOENIX not in play
-                                    ]
-                                )
-                            straight_plays = new_plays
-                        possible_combinations.extend(straight_plays)
-        else:
-            for length in range(
-                (
-                    combination.length
-                    if combination.combination_type == CombinationType.STRAIGHT_BOMB
-                    else STRAIGHT_MIN_SIZE
-                ),
-                14,
-            ):
+                        continue
+                    parts = tuple((val, 1) for val in window if bucket_sizes[val])
+                    if present < length:
+                        if wish_value is None or bucket_sizes[wish_value]:
+                            yield _PlayPattern(parts, phoenix)
+                        continue
+                    yield _PlayPattern(parts)
+                    if has_phoenix:
+                        for j, val in enumerate(window):
+                            if val != wish_value:
+                                yield _PlayPattern(parts[:j] + parts[j + 1 :], phoenix)
+        elif Combination._has_color_run(cards):
+            is_straight_bomb = combination_type == CombinationType.STRAIGHT_BOMB
+            min_length = STRAIGHT_MIN_SIZE
+            if combination is not None and is_straight_bomb:
+                min_length = combination.length
+            for length in range(min_length, 14):
                 for i in range(
-                    14,
-                    max(
-                        (
-                            min_value
-                            if combination.combination_type
-                            == CombinationType.STRAIGHT_BOMB
-                            else length
-                        ),
-                        length,
-                    )
-                    - 1,
-                    -1,
+                    14, max(min_value if is_straight_bomb else length, length) - 1, -1
                 ):
-                    window_start = i - (length - 1)
-                    window_end = i
-                    window = [
-                        val
-                        for val in straight_values
-                        if window_start <= val <= window_end
-                    ]
-                    if len(window) == length:
-                        straight_bomb_plays: list[list[Card]] = []
-                        for val in range(window_start, window_end + 1):
-                            new_bomb_plays: list[list[Card]] = []
-                            for card in card_buckets[val]:
-                                new_bomb_plays.extend(
-                                    [
-                                        play + [card]
-                                        for play in (
-                                            straight_bomb_plays
-                                            if len(straight_bomb_plays) > 0
-                                            else [[]]
-                                        )
-                                        if val == window_start
-                                        or (
-                                            len(play) > 0
-                                            and play[-1].color == card.color
-                                        )
-                                    ]
-                                )
-                            straight_bomb_plays = new_bomb_plays
-                        possible_combinations.extend(
-                            [set(play) for play in straight_bomb_plays]
-                        )
-        if (
-            combination is None
-            or combination.combination_type == CombinationType.FULL_HOUSE
-        ):
-            triple_combos = {
-                val: [set(combo) for combo in combinations(bucket, 3)]
-                for val, bucket in card_buckets.items()
-                if len(bucket) >= 3 and val >= min_value
-            }
-            pair_combos = {
-                val: [set(combo) for combo in combinations(bucket, 2)]
-                for val, bucket in card_buckets.items()
-                if len(bucket) >= 2
-            }
-            single_combos = {
-                val: [{card} for card in bucket]
-                for val, bucket in card_buckets.items()
-                if len(bucket) >= 1
-            }
-
-            for triple_val, triple_combo in triple_combos.items():
-                for pair_val, pair_combo in pair_combos.items():
-                    if triple_val != pair_val:
-                        possible_combinations.extend(
-                            [
-                                triple | pair
-                                for triple in triple_combo
-                                for pair in pair_combo
-                            ]
-                        )
+                    window = range(i - (length - 1), i + 1)
+                    if (wish_value is not None and wish_value not in window) or (
+                        present_counts[i] - present_counts[window.start - 1] < length
+                    ):
+                        continue
+                    pattern = _PlayPattern(
+                        tuple((val, 1) for val in window), same_color=True
+                    )
+                    if pattern.count(card_buckets) > 0:
+                        yield pattern
+
+        if combination_type in (None, CombinationType.FULL_HOUSE):
+            triple_values = [
+                val
+                for val in range(max(min_value, 1), 15)
+                if bucket_sizes[val] >= TRIPLE_SIZE
+            ]
+            pair_values = [val for val in range(1, 15) if bucket_sizes[val] >= 2]
+            single_values = [val for val in range(1, 15) if bucket_sizes[val] >= 1]
+            for triple_val in triple_values:
+                for pair_val in pair_values:
+                    if triple_val != pair_val and wish_value in (
+                        None,
+                        triple_val,
+                        pair_val,
+                    ):
+                        yield _PlayPattern(((triple_val, 3), (pair_val, 2)))
                 if has_phoenix:
-                    for single_val, single_combo in single_combos.items():
-                        if triple_val != single_val:
-                            possible_combinations.extend(
-                                [
-                                    triple | single | {PHOENIX}
-                                    for triple in triple_combo
-                                    for single in single_combo
-                                ]
+                    for single_val in single_values:
+                        if triple_val != single_val and wish_value in (
+                            None,
+                            triple_val,
+                            single_val,
+                        ):
+                            yield _PlayPattern(
+                                ((triple_val, 3), (single_val, 1)), phoenix
                             )
             if has_phoenix:
-                for pair_val, pair_combo in pair_combos.items():
-                    for pair_val_2, pair_combo_2 in pair_combos.items():
-                        if pair_val > pair_val_2 and (
-                            pair_val >= min_value or pair_val_2 >= min_value
+                for pair_val in pair_values:
+                    for pair_val_2 in pair_values:
+                        if (
+                            pair_val > pair_val_2
+                            and (pair_val >= min_value or pair_val_2 >= min_value)
+                            and wish_value in (None, pair_val, pair_val_2)
                         ):
-                            possible_combinations.extend(
-                                [
-                                    pair | pair_2 | {PHOENIX}
-                                    for pair in pair_combo
-                                    for pair_2 in pair_combo_2
-                                ]
+                            yield _PlayPattern(
+                                ((pair_val, 2), (pair_val_2, 2)), phoenix
                             )
-        if combination is None or combination.combination_type == CombinationType.STAIR:
-            stair_plays: list[set[Card]] = []
-            for i in range(min_value, 15):
-                if len(card_buckets[i]) >= 2 or (
-                    has_phoenix and len(card_buckets[i]) >= 1
-                ):
-                    new_plays = [
-                        play | set(pair)
-                        for play in stair_plays + [set()]
-                        for pair in combinations(card_buckets[i], 2)
-                    ]
-                    phoenix_plays = []
+
+        if combination_type in (None, CombinationType.STAIR):
+            for start in range(max(min_value, 1), 15):
+                singles: list[int] = []
+                for end in range(start, 15):
+                    if bucket_sizes[end] < 2 and not (
+                        has_phoenix and bucket_sizes[end] == 1
+                    ):
+                        break
+                    if bucket_sizes[end] == 1:
+                        singles.append(end)
+                    length = end - start + 1
+                    if len(singles) > 1 or (
+                        combination is not None and length > combination.length
+                    ):
+                        break
+                    if (
+                        length < STAIR_SIZE
+                        or (combination is not None and length != combination.length)
+                        or (wish_value is not None and not start <= wish_value <= end)
+                    ):
+                        continue
+                    window = range(start, end + 1)
+                    parts = tuple((val, 2) for val in window)
+                    if singles:
+                        j = singles[0] - start
+                        yield _PlayPattern(
+                            parts[:j] + ((singles[0], 1),) + parts[j + 1 :], phoenix
+                        )
+                        continue
+                    yield _PlayPattern(parts)
                     if has_phoenix:
-                        phoenix_plays = [
-                            play | {card} | {PHOENIX}
-                            for play in stair_plays + [set()]
-                            if PHOENIX not in play
-                            for card in card_buckets[i]
-                        ]
-                    stair_plays = new_plays + phoenix_plays
-                    possible_combinations.extend(
-                        [
-                            play
-                            for play in stair_plays
-                            if (combination is None and len(play) >= 4)
-                            or (
-                                combination is not None
-                                and len(play) == combination.length * 2
+                        for j, val in enumerate(window):
+                            yield _PlayPattern(
+                                parts[:j] + ((val, 1),) + parts[j + 1 :], phoenix
                             )
-                        ]
-                    )
-                else:
-                    stair_plays = []
 
-        if wish_value is not None and Combination.can_fulfill_wish(
-            combination, wish_value, cards
+
+class _PlayPattern(NamedTuple):
+    """A group of plays that only differ in the colors of their cards.
+
+    parts holds (value, number of cards of that value) pairs. extra_cards are
+    added to every play. With same_color, all parts must share one color,
+    which is how straight bombs are built.
+    """
+
+    parts: tuple[tuple[int, int], ...]
+    extra_cards: tuple[Card, ...] = ()
+    same_color: bool = False
+
+    def count(self, card_buckets: dict[int, list[Card]]) -> int:
+        if self.same_color:
+            return len(self._get_common_colors(card_buckets))
+        count = 1
+        for value, size in self.parts:
+            count *= math.comb(len(card_buckets[value]), size)
+        return count
+
+    def expand(self, card_buckets: dict[int, list[Card]]) -> Iterator[set[Card]]:
+        if self.same_color:
+            for color in self._get_common_colors(card_buckets):
+                yield {Card(color, value) for value, _ in self.parts}
+            return
+        if all(size == 1 for _, size in self.parts):
+            for choice in product(*(card_buckets[value] for value, _ in self.parts)):
+                yield {*self.extra_cards, *choice}
+            return
+        for choices in product(
+            *(combinations(card_buckets[value], size) for value, size in self.parts)
         ):
-            possible_combinations = [
-                combo
-                for combo in possible_combinations
-                if wish_value in [card.value for card in combo]
-            ]
-        return possible_combinations
+            yield set(self.extra_cards).union(*choices)
+
+    def _get_common_colors(self, card_buckets: dict[int, list[Card]]) -> list[Color]:
+        colors = [card.color for card in card_buckets[self.parts[0][0]]]
+        for value, _ in self.parts[1:]:
+            bucket_colors = {card.color for card in card_buckets[value]}
+            colors = [color for color in colors if color in bucket_colors]
+        return colors
+
+    def get_signature(self) -> tuple[int, ...]:
+        values = [value for value, size in self.parts for _ in range(size)]
+        values.extend(card.value for card in self.extra_cards)
+        return tuple(sorted(values))
+
+
+@dataclass(frozen=True)
+class PlayClass:
+    """Plays that share a rank signature and only differ in card colors.
+
+    The signature lists the values of all cards in the play, with the
+    special cards contributing their own values (e.g. 50 for the Phoenix).
+    """
+
+    signature: tuple[int, ...]
+    can_be_straight_bomb: bool
+    _pattern: _PlayPattern = field(repr=False, compare=False)
+    _card_buckets: dict[int, list[Card]] = field(repr=False, compare=False)
+
+    @property
+    def has_phoenix(self) -> bool:
+        return PHOENIX.value in self.signature
+
+    def count(self) -> int:
+        return self._pattern.count(self._card_buckets)
+
+    def expand(self) -> Iterator[set[Card]]:
+        """Lazily yield the concrete plays of this class."""
+        return self._pattern.expand(self._card_buckets)
+
+    def get_representative(self) -> set[Card]:
+        """A concrete play of this class, preferring a straight bomb."""
+        if self.can_be_straight_bomb:
+            colors = self._pattern._get_common_colors(self._card_buckets)
+            return {Card(colors[0], value) for value, _ in self._pattern.parts}
+        return next(self.expand())
@@ -0,0 +1,79 @@
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from tichu.card import CardMask, from_mask
+
+if TYPE_CHECKING:
+    from tichu.tichu import Tichu
+
+
+class EventType(Enum):
+    PASSED = "passed"
+    TRICK_ENDED = "trick_ended"
+    DRAGON_TRICK_WON = "dragon_trick_won"
+    TICHU_CALLED = "tichu_called"
+    CARDS_PLAYED = "cards_played"
+    WISH_MADE = "wish_made"
+    WISH_FULFILLED = "wish_fulfilled"
+    DOG_PLAYED = "dog_played"
+    PLAYER_FINISHED = "player_finished"
+    TEAM_SCORED = "team_scored"
+
+
+@dataclass(frozen=True, slots=True)
+class TichuEvent:
+    """Structured record of something that happened in the game.
+
+    Events only hold indices, masks and numbers; messages are built on demand
+    by format().
+    """
+
+    event_type: EventType
+    player_idx: int | None = None
+    team_idx: int | None = None
+    cards: CardMask = 0
+    value: int | None = None
+    total: int | None = None
+
+    def format(self, player_name: str = "") -> str:
+        match self.event_type:
+            case EventType.PASSED:
+                return f"{player_name} has passed."
+            case EventType.TRICK_ENDED:
+                return "All other players have passed. Resetting current combination."
+            case EventType.DRAGON_TRICK_WON:
+                return f"{player_name} wins the single card round and collects the card stack."
+            case EventType.TICHU_CALLED:
+                return f"{player_name} has called Tichu!"
+            case EventType.CARDS_PLAYED:
+                return ", ".join(str(card) for card in from_mask(self.cards))
+            case EventType.WISH_MADE:
+                return f"{player_name} wishes for card value {self.value}."
+            case EventType.WISH_FULFILLED:
+                return (
+                    f"{player_name} has fulfilled the wish for card value {self.value}."
+                )
+            case EventType.DOG_PLAYED:
+                return f"{player_name} played the Dog and passes the turn to their teammate."
+            case EventType.PLAYER_FINISHED:
+                return (
+                    f"{player_name} has played all their cards and finished the round!"
+                )
+            case EventType.TEAM_SCORED:
+                return f"Team {self.team_idx} scored {self.value} points this round. Total score: {self.total}"
+
+
+type EventListener = Callable[["Tichu", TichuEvent], None]
+
+
+def log_event(game: "Tichu", event: TichuEvent):
+    """Listener writing events to the logging module, formatted only if enabled."""
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    player_name = ""
+    if event.player_idx is not None:
+        player_name = game.players[event.player_idx].name
+    logging.info(event.format(player_name))
@@ -0,0 +1,194 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from tichu import NUM_PLAYERS
+from tichu.card import Card, to_mask
+from tichu.tichu_state import CardPlay
+
+MAGIC = b"TCHR\x01"
+# The first byte of a record holds the player in its low bits and the kind
+# of record above them. Card plays with an argument also set ARGUMENT_FLAG.
+PLAYER_BITS = 2
+PLAYER_MASK = (1 << PLAYER_BITS) - 1
+KIND_PASS = 0
+KIND_TICHU = 1
+KIND_CARDS = 2
+KIND_ROUND = 3
+KIND_MASK = 0b11 << PLAYER_BITS
+ARGUMENT_FLAG = 1 << (PLAYER_BITS + 2)
+PUSH_SIZE = NUM_PLAYERS - 1
+
+
+class GameRecordError(Exception):
+    """Raised when a game record cannot be written or read."""
+
+
+@dataclass(frozen=True, slots=True)
+class RoundHeader:
+    """How a round started. Tichu.shuffle_deck(seed) gives the dealt deck.
+
+    pushes holds the cards each player pushed to the left player, their
+    partner and the right player.
+    """
+
+    seed: int
+    round_number: int
+    grand_tichu_calls: tuple[bool, ...]
+    pushes: tuple[tuple[Card, ...], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PlayRecord:
+    player_idx: int
+    card_play: CardPlay
+
+
+def _encode_varint(value: int, out: bytearray):
+    """Append a non-negative integer in LEB128, 7 bits per byte."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _encode_signed(value: int, out: bytearray):
+    # Zigzag encoding keeps small negative values short.
+    _encode_varint(value * 2 if value >= 0 else -value * 2 - 1, out)
+
+
+def _decode_signed(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+class GameRecordWriter:
+    """Writes rounds and plays to a binary stream as they happen.
+
+    Every card is stored as one byte holding its index. Pass a writer as
+    recorder to Tichu to record its games.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        stream.write(MAGIC)
+
+    def write_round(
+        self,
+        seed: int,
+        round_number: int,
+        grand_tichu_calls: list[bool],
+        pushes: list[list[Card]],
+    ):
+        out = bytearray([KIND_ROUND << PLAYER_BITS])
+        _encode_signed(seed, out)
+        _encode_varint(round_number, out)
+        out.append(sum(called << idx for idx, called in enumerate(grand_tichu_calls)))
+        for pushed in pushes:
+            out.extend(card.index for card in pushed)
+        self.stream.write(out)
+
+    def write_play(self, player_idx: int, card_play: CardPlay):
+        if card_play == "pass":
+            self.stream.write(bytes([KIND_PASS << PLAYER_BITS | player_idx]))
+            return
+        if card_play == "tichu":
+            self.stream.write(bytes([KIND_TICHU << PLAYER_BITS | player_idx]))
+            return
+        cards, argument = card_play
+        mask = to_mask(cards)
+        indices = [idx for idx in range(mask.bit_length()) if mask >> idx & 1]
+        out = bytearray(
+            [
+                KIND_CARDS << PLAYER_BITS
+                | player_idx
+                | (ARGUMENT_FLAG if argument is not None else 0),
+                len(indices),
+            ]
+        )
+        out.extend(indices)
+        if argument is not None:
+            _encode_signed(argument, out)
+        self.stream.write(out)
+
+
+class _Reader:
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+
+    def read(self, size: int) -> bytes:
+        data = self.stream.read(size)
+        if len(data) != size:
+            msg = "Game record ends in the middle of a record."
+            raise GameRecordError(msg)
+        return data
+
+    def read_varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.read(1)[0]
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+
+def iter_records(stream: BinaryIO) -> Iterator[RoundHeader | PlayRecord]:
+    """Read the records of a stream written by GameRecordWriter one at a time."""
+    reader = _Reader(stream)
+    if stream.read(len(MAGIC)) != MAGIC:
+        msg = "Not a game record."
+        raise GameRecordError(msg)
+    while first := stream.read(1):
+        byte = first[0]
+        player_idx = byte & PLAYER_MASK
+        kind = (byte & KIND_MASK) >> PLAYER_BITS
+        if byte & ~(PLAYER_MASK | KIND_MASK | ARGUMENT_FLAG) or (
+            byte & ARGUMENT_FLAG and kind != KIND_CARDS
+        ):
+            msg = f"Unknown game record byte {byte:#04x}."
+            raise GameRecordError(msg)
+        if kind == KIND_PASS:
+            yield PlayRecord(player_idx, "pass")
+        elif kind == KIND_TICHU:
+            yield PlayRecord(player_idx, "tichu")
+        elif kind == KIND_CARDS:
+            num_cards = reader.read(1)[0]
+            cards = {Card.from_index(idx) for idx in reader.read(num_cards)}
+            argument = (
+                _decode_signed(reader.read_varint()) if byte & ARGUMENT_FLAG else None
+            )
+            yield PlayRecord(player_idx, (cards, argument))
+        else:
+            seed = _decode_signed(reader.read_varint())
+            round_number = reader.read_varint()
+            calls = reader.read(1)[0]
+            pushed = reader.read(NUM_PLAYERS * PUSH_SIZE)
+            yield RoundHeader(
+                seed,
+                round_number,
+                tuple(bool(calls >> idx & 1) for idx in range(NUM_PLAYERS)),
+                tuple(
+                    tuple(map(Card.from_index, pushed[start : start + PUSH_SIZE]))
+                    for start in range(0, len(pushed), PUSH_SIZE)
+                ),
+            )
+
+
+def iter_rounds(
+    stream: BinaryIO,
+) -> Iterator[tuple[RoundHeader, list[PlayRecord]]]:
+    """Read a stream round by round, each with its plays in order."""
+    header: RoundHeader | None = None
+    plays: list[PlayRecord] = []
+    for record in iter_records(stream):
+        if isinstance(record, RoundHeader):
+            if header is not None:
+                yield header, plays
+            header, plays = record, []
+        elif header is None:
+            msg = "Game record has plays before the first round."
+            raise GameRecordError(msg)
+        else:
+            plays.append(record)
+    if header is not None:
+        yield header, plays
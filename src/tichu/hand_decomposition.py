@@ -0,0 +1,208 @@
+from collections.abc import Iterator
+from functools import lru_cache
+from operator import itemgetter
+
+from tichu.card import (
+    NORMAL_CARD_VALUES,
+    Card,
+    CardMask,
+    DOG,
+    PHOENIX,
+    DRAGON,
+    from_mask,
+)
+from tichu.combination import (
+    BOMB_SIZE,
+    PAIR_SIZE,
+    STAIR_SIZE,
+    STRAIGHT_MIN_SIZE,
+    TRIPLE_SIZE,
+    Combination,
+)
+
+# Number of cards of each value from the Mah Jong (1) to the ace (14), packed
+# into COUNT_BITS bits per value. Colors do not matter: a straight bomb is
+# a straight.
+type RankKey = int
+# The rank key of the cards of a combination and whether it uses the Phoenix.
+type Part = tuple[RankKey, bool]
+
+MIN_VALUE = 1
+MAX_VALUE = NORMAL_CARD_VALUES[-1]
+COUNT_BITS = 3
+COUNT_MASK = (1 << COUNT_BITS) - 1
+# Partial hands are shared between hands, so the cache is kept across calls.
+CACHE_SIZE = 1 << 18
+
+
+def get_count(key: RankKey, value: int) -> int:
+    return key >> (COUNT_BITS * value) & COUNT_MASK
+
+
+def get_rank_key(cards: list[Card]) -> RankKey:
+    key = 0
+    for value, count in Combination.get_card_count(cards).items():
+        key += count << (COUNT_BITS * value)
+    return key
+
+
+def _single(value: int, count: int = 1) -> RankKey:
+    return count << (COUNT_BITS * value)
+
+
+def _iter_straights(key: RankKey, phoenix: bool, value: int) -> Iterator[Part]:
+    """Straights whose lowest real card is of the value."""
+    taken = 0
+    gap_filled = False
+    for end in range(value, MAX_VALUE + 1):
+        if get_count(key, end):
+            taken += _single(end)
+        elif phoenix and not gap_filled:
+            gap_filled = True
+        else:
+            break
+        length = end - value + 1
+        if length >= STRAIGHT_MIN_SIZE:
+            yield taken, gap_filled
+        # Otherwise the Phoenix can extend the straight below or above.
+        if (
+            phoenix
+            and not gap_filled
+            and length + 1 >= STRAIGHT_MIN_SIZE
+            and (end < MAX_VALUE or value > NORMAL_CARD_VALUES[0])
+        ):
+            yield taken, True
+
+
+def _iter_stairs(key: RankKey, phoenix: bool, value: int) -> Iterator[Part]:
+    """Stairs starting at the value."""
+    taken = 0
+    uses_phoenix = False
+    for end in range(value, MAX_VALUE + 1):
+        count = get_count(key, end)
+        if count >= PAIR_SIZE:
+            taken += _single(end, PAIR_SIZE)
+        elif count and phoenix and not uses_phoenix:
+            taken += _single(end)
+            uses_phoenix = True
+        else:
+            break
+        if end - value + 1 >= STAIR_SIZE:
+            yield taken, uses_phoenix
+
+
+def _get_group_options(
+    count: int, phoenix: bool
+) -> tuple[tuple[tuple[int, bool], ...], tuple[tuple[int, bool], ...]]:
+    """Ways to take a pair and a triple of count cards: (real cards, uses Phoenix)."""
+    pairs = [(PAIR_SIZE, False)] if count >= PAIR_SIZE else []
+    triples = [(TRIPLE_SIZE, False)] if count >= TRIPLE_SIZE else []
+    if phoenix and count:
+        pairs.append((PAIR_SIZE - 1, True))
+        if count >= TRIPLE_SIZE - 1:
+            triples.append((TRIPLE_SIZE - 1, True))
+    return tuple(pairs), tuple(triples)
+
+
+_GROUP_OPTIONS = {
+    (count, phoenix): _get_group_options(count, phoenix)
+    for count in range(BOMB_SIZE + 1)
+    for phoenix in (False, True)
+}
+
+
+def _iter_groups(key: RankKey, phoenix: bool, value: int) -> Iterator[Part]:
+    """Pairs, triples, bombs and full houses using cards of the value."""
+    count = get_count(key, value)
+    pairs, triples = _GROUP_OPTIONS[count, phoenix]
+    for taken, uses_phoenix in pairs + triples:
+        yield _single(value, taken), uses_phoenix
+    if count == BOMB_SIZE:
+        yield _single(value, BOMB_SIZE), False
+    if not pairs:
+        return
+    higher = key >> (COUNT_BITS * (value + 1))
+    other = value
+    while higher:
+        other_count = higher & COUNT_MASK
+        higher >>= COUNT_BITS
+        other += 1
+        if not other_count:
+            continue
+        other_pairs, other_triples = _GROUP_OPTIONS[other_count, phoenix]
+        for own, others in ((triples, other_pairs), (pairs, other_triples)):
+            for taken, uses_phoenix in own:
+                for other_taken, other_uses_phoenix in others:
+                    if not (uses_phoenix and other_uses_phoenix):
+                        yield (
+                            _single(value, taken) + _single(other, other_taken),
+                            uses_phoenix or other_uses_phoenix,
+                        )
+
+
+def _iter_parts(key: RankKey, phoenix: bool, value: int) -> Iterator[Part]:
+    """Combinations containing a card of the lowest value left in the hand."""
+    yield _single(value), False
+    if value in NORMAL_CARD_VALUES:
+        yield from _iter_groups(key, phoenix, value)
+        yield from _iter_stairs(key, phoenix, value)
+    yield from _iter_straights(key, phoenix, value)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _solve(key: RankKey, phoenix: bool) -> tuple[int, Part | None]:
+    """Fewest combinations for the cards and the first one of a best partition.
+
+    The lowest card must be in some combination, so only combinations
+    containing it are tried.
+    """
+    if not key:
+        return (1, (0, True)) if phoenix else (0, None)
+    value = ((key & -key).bit_length() - 1) // COUNT_BITS
+    # The lowest card can always be played as a single, so there is a part.
+    return min(
+        (
+            (1 + _solve(key - part[0], phoenix and not part[1])[0], part)
+            for part in _iter_parts(key, phoenix, value)
+        ),
+        key=itemgetter(0),
+    )
+
+
+def count_min_plays(key: RankKey, phoenix: bool) -> int:
+    """The fewest combinations for cards given by their rank key and the Phoenix."""
+    return _solve(key, phoenix)[0]
+
+
+def get_min_plays(cards: list[Card] | CardMask) -> int:
+    """The fewest combinations the cards can be played as."""
+    if isinstance(cards, int):
+        cards = from_mask(cards)
+    # The Dog and the Dragon are always played on their own.
+    num_singles = sum(card in (DOG, DRAGON) for card in cards)
+    return num_singles + count_min_plays(get_rank_key(cards), PHOENIX in cards)
+
+
+def decompose(cards: list[Card] | CardMask) -> list[list[Card]]:
+    """Partition the cards into the fewest combinations."""
+    if isinstance(cards, int):
+        cards = from_mask(cards)
+    parts = [[card] for card in cards if card in (DOG, DRAGON)]
+    buckets = Combination.get_card_buckets(cards)
+    key = get_rank_key(cards)
+    phoenix = PHOENIX in cards
+    while True:
+        _, part = _solve(key, phoenix)
+        if part is None:
+            return parts
+        taken, uses_phoenix = part
+        parts.append(
+            [
+                buckets[value].pop()
+                for value in range(MIN_VALUE, MAX_VALUE + 1)
+                for _ in range(get_count(taken, value))
+            ]
+            + ([PHOENIX] if uses_phoenix else [])
+        )
+        key -= taken
+        phoenix = phoenix and not uses_phoenix
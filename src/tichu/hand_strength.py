@@ -0,0 +1,301 @@
+import argparse
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+from tichu import GRAND_TICHU_HAND_SIZE, HAND_SIZE, NUM_PLAYERS
+from tichu.card import NORMAL_CARD_VALUES, Card, DOG, MAH_JONG, PHOENIX, DRAGON
+from tichu.combination import BOMB_SIZE, Combination
+from tichu.hand_decomposition import get_min_plays
+from tichu.player import Player
+from tichu.player_state import PlayerState
+from tichu.tichu_state import CardPlay, TichuState
+
+# Dragon, Phoenix, Dog, number of aces and kings, whether there is a bomb and
+# the fewest combinations the hand can be played as.
+type HandKey = tuple[int, ...]
+# Wins and deals per hand key, for one hand size.
+type HandStrengthTable = dict[HandKey, list[int]]
+
+TABLES_PATH = os.path.join(os.path.dirname(__file__), "hand_strength.json")
+DECISION_HAND_SIZES = (GRAND_TICHU_HAND_SIZE, HAND_SIZE)
+# Share of the simulated deals whose hands call. Random play hardly lets any
+# 8 card hand go out first at even odds, so a call is made by the hands with
+# the best simulated odds rather than above a fixed probability.
+GRAND_TICHU_CALL_RATE = 0.03
+TICHU_CALL_RATE = 0.05
+# Deals a hand key's rate is shrunk with towards the average win-out rate.
+PRIOR_WEIGHT = 20
+
+
+def get_hand_key(hand: list[Card]) -> HandKey:
+    """The features of a hand its win-out probability is tabulated by.
+
+    The number of combinations the hand needs tells pairs, runs and full
+    houses apart from loose singles.
+    """
+    value_counts = Combination.get_card_count(hand)
+    has_bomb = Combination._has_color_run(hand) or any(
+        count == BOMB_SIZE
+        for value, count in value_counts.items()
+        if value in NORMAL_CARD_VALUES
+    )
+    return (
+        int(DRAGON in hand),
+        int(PHOENIX in hand),
+        int(DOG in hand),
+        value_counts.get(14, 0) + value_counts.get(13, 0),
+        int(has_bomb),
+        get_min_plays(hand),
+    )
+
+
+class HandStrengthEvaluator:
+    """Win-out probabilities of freshly dealt hands from precomputed tables.
+
+    The tables count, per hand key and decision point, how often a hand
+    finished first in simulated rounds. The smoothed probabilities are
+    computed once on loading, so a lookup is a single dict access.
+    thresholds holds, per hand size, the probability the best call_rates
+    share of the deals reaches.
+    """
+
+    def __init__(
+        self,
+        tables: dict[int, HandStrengthTable],
+        call_rates: dict[int, float] | None = None,
+    ):
+        if call_rates is None:
+            call_rates = {
+                GRAND_TICHU_HAND_SIZE: GRAND_TICHU_CALL_RATE,
+                HAND_SIZE: TICHU_CALL_RATE,
+            }
+        self.base_rates: dict[int, float] = {}
+        self.probabilities: dict[int, dict[HandKey, float]] = {}
+        self.thresholds: dict[int, float] = {}
+        for hand_size, table in tables.items():
+            wins = sum(entry[0] for entry in table.values())
+            deals = sum(entry[1] for entry in table.values())
+            base_rate = wins / deals if deals else 1 / NUM_PLAYERS
+            self.base_rates[hand_size] = base_rate
+            probabilities = {
+                key: (wins + PRIOR_WEIGHT * base_rate) / (deals + PRIOR_WEIGHT)
+                for key, (wins, deals) in table.items()
+            }
+            self.probabilities[hand_size] = probabilities
+            self.thresholds[hand_size] = _get_threshold(
+                table, probabilities, call_rates.get(hand_size, 0.0) * deals
+            )
+
+    @classmethod
+    def load(cls, path: str = TABLES_PATH) -> "HandStrengthEvaluator":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(_decode_tables(json.load(f)["tables"]))
+
+    def get_win_probability(self, hand: list[Card]) -> float:
+        """Probability that the player of a freshly dealt hand goes out first."""
+        probabilities = self.probabilities.get(len(hand))
+        if probabilities is None:
+            msg = f"No hand strength table for {len(hand)} cards."
+            raise ValueError(msg)
+        return probabilities.get(get_hand_key(hand), self.base_rates[len(hand)])
+
+    def _should_call(self, hand: list[Card], threshold: float | None) -> bool:
+        probability = self.get_win_probability(hand)
+        if threshold is None:
+            threshold = self.thresholds[len(hand)]
+        return probability >= threshold
+
+    def should_call_grand_tichu(
+        self, hand: list[Card], threshold: float | None = None
+    ) -> bool:
+        return self._should_call(hand, threshold)
+
+    def should_call_tichu(
+        self, hand: list[Card], threshold: float | None = None
+    ) -> bool:
+        return self._should_call(hand, threshold)
+
+
+def _get_threshold(
+    table: HandStrengthTable, probabilities: dict[HandKey, float], num_calls: float
+) -> float:
+    """The lowest probability of the best keys that together hold num_calls deals."""
+    threshold = math.inf
+    for key in sorted(probabilities, key=probabilities.__getitem__, reverse=True):
+        if num_calls <= 0:
+            break
+        threshold = probabilities[key]
+        num_calls -= table[key][1]
+    return threshold
+
+
+@cache
+def get_evaluator() -> HandStrengthEvaluator:
+    """The evaluator of the tables shipped with the package, loaded once."""
+    return HandStrengthEvaluator.load()
+
+
+def should_call_grand_tichu(player_state: PlayerState) -> bool:
+    return get_evaluator().should_call_grand_tichu(player_state.hand)
+
+
+def should_call_tichu(player_state: PlayerState) -> bool:
+    """Whether to call Tichu now, which is only allowed with a full hand."""
+    return (
+        len(player_state.hand) == HAND_SIZE
+        and not player_state.tichu_called
+        and not player_state.grand_tichu_called
+        and get_evaluator().should_call_tichu(player_state.hand)
+    )
+
+
+class _RecordingPlayer(Player):
+    """Plays randomly and never calls, remembering its Grand Tichu hand."""
+
+    def __init__(self, name: str, rng: random.Random):
+        super().__init__(name)
+        self.random = rng
+        self.grand_tichu_hand: list[Card] = []
+
+    def get_card_play(self, game_state: TichuState) -> CardPlay:
+        chosen_play = Combination.random_play(
+            game_state.current_combination,
+            game_state.get_player_state(self.player_idx).hand,
+            game_state.current_wish,
+            self.random,
+        )
+        if chosen_play is None:
+            return "pass"
+        argument = None
+        if DRAGON in chosen_play:
+            argument = self.random.choice(self.get_opponents())
+        if MAH_JONG in chosen_play:
+            argument = self.random.choice(NORMAL_CARD_VALUES)
+        return (chosen_play, argument)
+
+    def get_grand_tichu_play(self, game_state: TichuState):
+        self.grand_tichu_hand = list(game_state.get_player_state(self.player_idx).hand)
+        return "pass"
+
+    def get_push_play(self, game_state: TichuState) -> set[int]:
+        return set(self.random.sample(range(HAND_SIZE), NUM_PLAYERS - 1))
+
+
+def _simulate_tables(rounds: int, seed: int) -> dict[int, HandStrengthTable]:
+    # tichu.tichu imports the players, which use this module.
+    from tichu.tichu import Tichu, TichuHooks
+
+    tables: dict[int, HandStrengthTable] = {size: {} for size in DECISION_HAND_SIZES}
+    rng = random.Random(seed)
+    players = [_RecordingPlayer(f"Player {idx}", rng) for idx in range(NUM_PLAYERS)]
+    hands: list[list[Card]] = []
+
+    def record_hands(game: Tichu):
+        # The first turn of the round sees the hands right after pushing.
+        if not game.state.play_log:
+            hands[:] = [list(state.hand) for state in game.state.player_states]
+
+    game = Tichu(seed=seed, listeners=[])
+    game.new_game(list(players))
+    hooks = TichuHooks(on_turn_start=record_hands)
+    for _ in range(rounds):
+        game.play_round(hooks)
+        winner_idx = game.state.player_rankings[0]
+        for player_idx, player in enumerate(players):
+            for hand in (player.grand_tichu_hand, hands[player_idx]):
+                entry = tables[len(hand)].setdefault(get_hand_key(hand), [0, 0])
+                entry[0] += player_idx == winner_idx
+                entry[1] += 1
+    return tables
+
+
+def generate_tables(
+    rounds: int, seed: int = 0, workers: int | None = None, chunks: int = 16
+) -> dict[int, HandStrengthTable]:
+    """Count win-outs per hand key over random rounds played in a process pool."""
+    chunk_rounds = [
+        rounds // chunks + (chunk_idx < rounds % chunks) for chunk_idx in range(chunks)
+    ]
+    tables: dict[int, HandStrengthTable] = {size: {} for size in DECISION_HAND_SIZES}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_simulate_tables, num_rounds, seed + chunk_idx)
+            for chunk_idx, num_rounds in enumerate(chunk_rounds)
+            if num_rounds
+        ]
+        for future in futures:
+            for hand_size, table in future.result().items():
+                _merge_table(tables[hand_size], table)
+    return tables
+
+
+def _merge_table(table: HandStrengthTable, other: HandStrengthTable):
+    for key, (wins, deals) in other.items():
+        entry = table.setdefault(key, [0, 0])
+        entry[0] += wins
+        entry[1] += deals
+
+
+def _encode_tables(tables: dict[int, HandStrengthTable]) -> dict:
+    return {
+        str(hand_size): {
+            ",".join(map(str, key)): entry for key, entry in sorted(table.items())
+        }
+        for hand_size, table in tables.items()
+    }
+
+
+def _decode_tables(data: dict) -> dict[int, HandStrengthTable]:
+    return {
+        int(hand_size): {
+            tuple(map(int, key.split(","))): entry for key, entry in table.items()
+        }
+        for hand_size, table in data.items()
+    }
+
+
+def save_tables(
+    tables: dict[int, HandStrengthTable],
+    rounds: int,
+    seed: int,
+    path: str = TABLES_PATH,
+):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"rounds": rounds, "seed": seed, "tables": _encode_tables(tables)},
+            f,
+            separators=(",", ":"),
+        )
+        f.write("\n")
+
+
+def _format_table(
+    evaluator: HandStrengthEvaluator, hand_size: int, limit: int = 10
+) -> str:
+    probabilities = sorted(
+        evaluator.probabilities[hand_size].items(), key=lambda item: -item[1]
+    )
+    return "\n".join(
+        f"{key}: {probability:.3f}" for key, probability in probabilities[:limit]
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the hand strength tables by simulating random rounds."
+    )
+    parser.add_argument("--rounds", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=TABLES_PATH)
+    args = parser.parse_args()
+    tables = generate_tables(args.rounds, seed=args.seed, workers=args.workers)
+    save_tables(tables, args.rounds, args.seed, args.output)
+    evaluator = HandStrengthEvaluator(tables)
+    for hand_size in DECISION_HAND_SIZES:
+        print(f"Best {hand_size} card hands:")
+        print(_format_table(evaluator, hand_size))
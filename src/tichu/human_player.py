@@ -68,7 +68,7 @@ class HumanPlayer(Player):
         logging.error("Invalid input. Please enter 'pass' or 'grand_tichu'. Try again.")
         return self.get_grand_tichu_play(game_state)
 
-    def get_push_play(self, game_state: TichuState) -> set[int]:
+    def get_push_play(self, game_state: TichuState) -> list[int]:
         push = self._get_input(
             "Enter cards to push, first player to the left, next partner player and last player to the right, separated by commas: "
         )
@@ -80,7 +80,7 @@ class HumanPlayer(Player):
             if not all(0 <= idx < HAND_SIZE for idx in card_indices):
                 logging.error("One or more card indices are out of range. Try again.")
                 return self.get_push_play(game_state)
-            return set(card_indices)
+            return card_indices
         except ValueError:
             logging.error(
                 "Invalid input. Please enter valid card indices separated by commas. Try again."
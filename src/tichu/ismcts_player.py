@@ -0,0 +1,281 @@
+import math
+import random
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from tichu import NUM_PLAYERS
+from tichu.card import NORMAL_CARD_VALUES, MAH_JONG, DRAGON
+from tichu.combination import Combination
+from tichu.hand_strength import should_call_grand_tichu, should_call_tichu
+from tichu.player import Player, PlayerType
+from tichu.push import choose_push
+from tichu.search import MoveKey, determinize, get_move_key, iter_moves
+from tichu.tichu import Tichu
+from tichu.tichu_state import CardPlay, TichuState
+
+# Round score difference mapped to the ends of the [0, 1] reward range.
+REWARD_SCALE = 400
+EXPLORATION = 0.7
+
+
+class ISMCTSNode:
+    """Node of an information set search tree.
+
+    A node is reached by player_idx making move; its reward is counted for
+    that player's team.
+    """
+
+    __slots__ = (
+        "move",
+        "player_idx",
+        "parent",
+        "children",
+        "visits",
+        "reward",
+        "availability",
+    )
+
+    def __init__(
+        self,
+        move: MoveKey | None = None,
+        player_idx: int | None = None,
+        parent: "ISMCTSNode | None" = None,
+    ):
+        self.move = move
+        self.player_idx = player_idx
+        self.parent = parent
+        self.children: dict[MoveKey, ISMCTSNode] = {}
+        self.visits = 0
+        self.reward = 0.0
+        self.availability = 0
+
+    def get_ucb(self) -> float:
+        return self.reward / self.visits + EXPLORATION * math.sqrt(
+            math.log(self.availability) / self.visits
+        )
+
+
+def rollout(state: TichuState, seed: int) -> list[int]:
+    """Play the round out with random moves and return the teams' round scores."""
+    rng = random.Random(seed)
+    engine = Tichu(listeners=[])
+    engine.state = state
+    while not engine.end_of_round:
+        player_idx = state.current_player_idx
+        cards = Combination.random_play(
+            state.current_combination,
+            state.get_player_state(player_idx).hand,
+            state.current_wish,
+            rng,
+        )
+        if cards is None:
+            engine.next_turn(player_idx, "pass")
+            continue
+        argument = None
+        if DRAGON in cards:
+            argument = rng.choice(
+                [(player_idx + 1) % NUM_PLAYERS, (player_idx + 3) % NUM_PLAYERS]
+            )
+        if MAH_JONG in cards:
+            argument = rng.choice(NORMAL_CARD_VALUES)
+        engine.next_turn(player_idx, (cards, argument))
+    return engine.end_round_scoring()
+
+
+def rollout_batch(states: list[TichuState], seeds: list[int]) -> list[list[int]]:
+    return [rollout(state, seed) for state, seed in zip(states, seeds)]
+
+
+class ISMCTSPlayer(Player):
+    """Information Set Monte Carlo Tree Search with random rollouts.
+
+    Every iteration samples the unseen cards, descends the shared tree with
+    UCB over the moves legal in that sample and finishes the round randomly.
+    With workers > 0 the rollouts of a batch of iterations run in a process
+    pool. The subtree of the chosen move is kept for the next decision.
+
+    The pool is started on the first search and shut down by close(), on
+    leaving a with block or once the player is garbage collected.
+    """
+
+    def __init__(
+        self,
+        name: str = "Anonymous",
+        iterations: int | None = None,
+        time_budget: float | None = 0.1,
+        workers: int = 0,
+        batch_size: int = 16,
+        seed: int | None = None,
+    ):
+        super().__init__(name)
+        if iterations is None and time_budget is None:
+            raise ValueError("Either iterations or time_budget must be set.")
+        self.player_type = PlayerType.ISMCTS
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.workers = workers
+        self.batch_size = batch_size if workers else 1
+        self.random = random.Random(seed)
+        self._executor: Executor | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._root: ISMCTSNode | None = None
+        self._root_round = 0
+        self._root_log_size = 0
+
+    def close(self):
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._executor = None
+
+    def __enter__(self) -> "ISMCTSPlayer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+            # The finalizer must not reference self, or it keeps it alive.
+            self._finalizer = weakref.finalize(self, self._executor.shutdown)
+        return self._executor
+
+    def get_card_play(self, game_state: TichuState) -> CardPlay:
+        if should_call_tichu(game_state.get_player_state(self.player_idx)):
+            return "tichu"
+        engine = Tichu(listeners=[])
+        engine.state = game_state
+        moves = dict(iter_moves(engine))
+        if len(moves) == 1:
+            return next(iter(moves.values()))
+        root = self._get_root(game_state)
+        self.search(root, game_state)
+        move = max(
+            (key for key in root.children if key in moves),
+            key=lambda key: root.children[key].visits,
+            default=next(iter(moves)),
+        )
+        # Keep the tree rooted before our move: the play log tells on the next
+        # call which moves were made since.
+        self._root = root
+        self._root_round = game_state.current_round
+        self._root_log_size = len(game_state.play_log)
+        return moves[move]
+
+    def get_grand_tichu_play(self, game_state: TichuState):
+        player_state = game_state.get_player_state(self.player_idx)
+        return "grand_tichu" if should_call_grand_tichu(player_state) else "pass"
+
+    def get_push_play(self, game_state: TichuState) -> list[int]:
+        return choose_push(game_state.get_player_state(self.player_idx).hand)
+
+    def search(self, root: ISMCTSNode, game_state: TichuState):
+        """Run iterations from root until the iteration or time budget is spent."""
+        deadline = (
+            time.perf_counter() + self.time_budget
+            if self.time_budget is not None
+            else math.inf
+        )
+        player_idx = self.player_idx
+        if player_idx is None:
+            msg = "The player must join a game before searching."
+            raise ValueError(msg)
+        iterations = 0
+        while (
+            self.iterations is None or iterations < self.iterations
+        ) and time.perf_counter() < deadline:
+            batch_size = self.batch_size
+            if self.iterations is not None:
+                batch_size = min(batch_size, self.iterations - iterations)
+            paths, states = [], []
+            for _ in range(batch_size):
+                path, state = self._select(root, game_state, player_idx)
+                paths.append(path)
+                states.append(state)
+            seeds = [self.random.getrandbits(32) for _ in states]
+            if self.workers:
+                executor = self._get_executor()
+                chunks = [
+                    executor.submit(
+                        rollout_batch,
+                        states[worker :: self.workers],
+                        seeds[worker :: self.workers],
+                    )
+                    for worker in range(min(self.workers, batch_size))
+                ]
+                results: list[list[int]] = [[] for _ in range(batch_size)]
+                for worker, chunk in enumerate(chunks):
+                    results[worker :: self.workers] = chunk.result()
+            else:
+                results = rollout_batch(states, seeds)
+            for path, round_scores in zip(paths, results):
+                self._backpropagate(path, round_scores)
+            iterations += batch_size
+
+    def _get_root(self, game_state: TichuState) -> ISMCTSNode:
+        """The subtree of the last search matching the moves played since."""
+        node = self._root
+        if (
+            node is None
+            or self._root_round != game_state.current_round
+            or self._root_log_size > len(game_state.play_log)
+        ):
+            return ISMCTSNode()
+        for _, card_play in game_state.play_log[self._root_log_size :]:
+            if card_play == "tichu":
+                continue
+            node = node.children.get(get_move_key(card_play))
+            if node is None:
+                return ISMCTSNode()
+        node.parent = None
+        return node
+
+    def _select(
+        self, root: ISMCTSNode, game_state: TichuState, player_idx: int
+    ) -> tuple[list[ISMCTSNode], TichuState]:
+        """Descend the tree in a fresh determinization and expand one node.
+
+        Visits are counted on the way down, so iterations of the same batch
+        spread over the tree before their rewards are known.
+        """
+        state = determinize(game_state, player_idx, self.random)
+        engine = Tichu(listeners=[])
+        engine.state = state
+        node = root
+        node.visits += 1
+        path = [node]
+        while not engine.end_of_round:
+            current_idx = state.current_player_idx
+            moves = dict(iter_moves(engine))
+            untried = [key for key in moves if key not in node.children]
+            for key, child in node.children.items():
+                if key in moves:
+                    child.availability += 1
+            if untried:
+                key = self.random.choice(untried)
+                child = ISMCTSNode(key, current_idx, node)
+                child.availability = 1
+                node.children[key] = child
+            else:
+                key = max(
+                    (key for key in node.children if key in moves),
+                    key=lambda key: node.children[key].get_ucb(),
+                )
+                child = node.children[key]
+            engine.next_turn(current_idx, moves[key])
+            node = child
+            node.visits += 1
+            path.append(node)
+            if untried:
+                break
+        return path, state
+
+    def _backpropagate(self, path: list[ISMCTSNode], round_scores: list[int]):
+        difference = round_scores[0] - round_scores[1]
+        reward = min(1.0, max(0.0, 0.5 + difference / (2 * REWARD_SCALE)))
+        for node in path:
+            # Only the root was reached without a move.
+            if node.player_idx is not None:
+                node.reward += reward if node.player_idx % 2 == 0 else 1 - reward
@@ -0,0 +1,104 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+from openai import AsyncOpenAI
+
+# Requests collected before a batch is sent right away.
+MAX_BATCH_SIZE = 64
+# Requests of all batches in flight at the same time.
+MAX_CONCURRENCY = 16
+
+
+@dataclass
+class _PendingRequest:
+    kwargs: dict[str, Any]
+    future: asyncio.Future = field(repr=False)
+
+
+class LLMBatcher:
+    """Collects the parse requests of many concurrent games and sends them in batches.
+
+    It stands in for an async client: give it to LLMPlayer as async_client
+    and every player sharing it has its requests batched. A batch holds the
+    requests made in the same step of the event loop, up to max_batch_size,
+    so no request waits for others to join. The requests of a batch are
+    still sent one by one, over a pool of at most max_concurrency requests
+    in flight, and each parsed response is routed back to the game that
+    asked.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        if max_batch_size < 1 or max_concurrency < 1:
+            msg = "Batch size and concurrency must be positive."
+            raise ValueError(msg)
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.num_batches = 0
+        self.num_requests = 0
+        self._pending: list[_PendingRequest] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        # A semaphore belongs to the loop it is used in, and the synchronous
+        # get_card_play runs a new loop for every play.
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def responses(self) -> "LLMBatcher":
+        return self
+
+    async def parse(self, **kwargs):
+        """Queue a responses.parse request and wait for its response."""
+        loop = asyncio.get_running_loop()
+        request = _PendingRequest(kwargs, loop.create_future())
+        self._pending.append(request)
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self.flush)
+        return await request.future
+
+    def flush(self):
+        """Send the pending requests as a batch now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self.num_batches += 1
+        self.num_requests += len(batch)
+        task = asyncio.get_running_loop().create_task(self._send_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _send_batch(self, batch: list[_PendingRequest]):
+        semaphore = self._get_semaphore()
+        await asyncio.gather(*(self._send(request, semaphore) for request in batch))
+
+    async def _send(self, request: _PendingRequest, semaphore: asyncio.Semaphore):
+        if request.future.done():
+            return
+        async with semaphore:
+            try:
+                response = await self.client.responses.parse(**request.kwargs)
+            except Exception as e:
+                if not request.future.done():
+                    request.future.set_exception(e)
+                return
+        if not request.future.done():
+            request.future.set_result(response)
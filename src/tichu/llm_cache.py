@@ -0,0 +1,137 @@
+import hashlib
+import json
+import sqlite3
+
+from tichu.card import to_mask
+from tichu.combination import Combination
+from tichu.llm_prompt import RECENT_PLAYS
+from tichu.tichu_state import CardPlay, TichuState
+
+# Responses kept before the least recently used ones are evicted.
+MAX_ENTRIES = 100_000
+
+
+def _encode_combination(combination: Combination | None) -> list[float] | None:
+    if combination is None:
+        return None
+    return [
+        combination.combination_type.value,
+        combination.value,
+        combination.length,
+    ]
+
+
+def _encode_card_play(card_play: CardPlay) -> str | list[int | None]:
+    if not isinstance(card_play, tuple):
+        return card_play
+    cards, argument = card_play
+    return [to_mask(cards), argument]
+
+
+def get_situation_key(model: str, game_state: TichuState, player_idx: int) -> bytes:
+    """Digest of everything the seat sees when deciding, and the model asked.
+
+    Two decisions with the same key get the same prompt and legal plays,
+    so a response to one answers the other. The order cards were stacked
+    in, the round number and the player's name are left out.
+    """
+    player_state = game_state.get_player_state(player_idx)
+    situation = [
+        model,
+        player_idx,
+        player_state.hand_mask,
+        [
+            [len(other.hand), other.tichu_called, other.grand_tichu_called]
+            for other in game_state.player_states
+        ],
+        game_state.scores,
+        _encode_combination(game_state.current_combination),
+        game_state.winning_player_idx,
+        game_state.current_wish,
+        to_mask(game_state.card_stack),
+        game_state.player_rankings,
+        [
+            [idx, _encode_card_play(card_play)]
+            for idx, card_play in game_state.play_log[-RECENT_PLAYS:]
+        ],
+    ]
+    encoded = json.dumps(situation, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).digest()
+
+
+class ResponseCache:
+    """Model responses stored in sqlite by situation key.
+
+    Once more than max_entries responses are stored, the least recently
+    used ones are evicted. The entries are counted once on opening and the
+    count is kept by put, so other writers to the same file go unnoticed.
+    hits and misses count the lookups of this instance.
+    """
+
+    def __init__(self, path: str, max_entries: int = MAX_ENTRIES):
+        if max_entries < 1:
+            msg = "The cache must hold at least one entry."
+            raise ValueError(msg)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key BLOB PRIMARY KEY, response TEXT NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self.connection.commit()
+        # Orders the uses of entries, continuing from earlier runs.
+        self._clock, self._size = self.connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0), COUNT(*) FROM responses"
+        ).fetchone()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, key: bytes) -> str | None:
+        row = self.connection.execute(
+            "SELECT response FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self.connection:
+            self.connection.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                (self._tick(), key),
+            )
+        return row[0]
+
+    def put(self, key: bytes, response: str):
+        with self.connection:
+            last_used = self._tick()
+            inserted = self.connection.execute(
+                "INSERT OR IGNORE INTO responses VALUES (?, ?, ?)",
+                (key, response, last_used),
+            ).rowcount
+            if not inserted:
+                self.connection.execute(
+                    "UPDATE responses SET response = ?, last_used = ? WHERE key = ?",
+                    (response, last_used, key),
+                )
+                return
+            self._size += 1
+            # Only an insert can take the cache over its size.
+            if self._size > self.max_entries:
+                self._size -= self.connection.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                    (self._size - self.max_entries,),
+                ).rowcount
+
+    def close(self):
+        self.connection.close()
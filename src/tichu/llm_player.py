@@ -1,83 +1,185 @@
 import os
-import random
-from typing import Literal
+from functools import cache
+from typing import Any, Literal
 
 from dotenv import load_dotenv
-from openai import OpenAI
-from pydantic import BaseModel
-
-from tichu import HAND_SIZE, NUM_PLAYERS
-from tichu.card import NORMAL_CARD_VALUES
-from tichu.player import Player
+from openai import AsyncOpenAI, OpenAI
+from pydantic import BaseModel, create_model
+
+from tichu.card import NORMAL_CARD_VALUES, MAH_JONG, to_mask
+from tichu.hand_strength import should_call_grand_tichu
+from tichu.llm_cache import ResponseCache, get_situation_key
+from tichu.llm_prompt import get_legal_plays, get_prompt_input
+from tichu.player import AsyncPlayer
+from tichu.push import choose_push
 from tichu.tichu_state import CardPlay, TichuState
 
+DEFAULT_MODEL = "gpt-4o-2024-08-06"
+
 
 class InvalidLLMResponse(Exception):
     """Raised when the LLM returns an invalid response."""
 
 
 class LLMPlay(BaseModel):
-    play: Literal["pass", "tichu"] | list[int]
-    argument: int | None
-
-
-class LLMPlayer(Player):
-    def __init__(self, name: str = "Anonymous"):
+    """A play chosen from the numbered legal plays, with the Mah Jong wish."""
+
+    choice: int
+    wish: int | None
+
+
+@cache
+def get_play_format(num_choices: int, with_wish: bool) -> type[BaseModel]:
+    """LLMPlay with the choice restricted to the menu, so any response is legal.
+
+    A wish is only asked for, and then required, when a legal play
+    contains the Mah Jong.
+    """
+    # The literal types are built at runtime, which type checkers cannot follow.
+    choice_type: Any = Literal[tuple(range(num_choices))]
+    wish_type: Any = Literal[tuple(NORMAL_CARD_VALUES)] if with_wish else None
+    return create_model(
+        "LLMMenuPlay",
+        __base__=LLMPlay,
+        choice=(choice_type, ...),
+        wish=(wish_type, ...),
+    )
+
+
+def _get_api_key() -> str:
+    load_dotenv()
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not found in environment variables.")
+    return api_key
+
+
+@cache
+def get_async_client() -> AsyncOpenAI:
+    """The async client shared by all players, so games reuse its connection pool."""
+    return AsyncOpenAI(api_key=_get_api_key())
+
+
+def _has_mah_jong(legal_plays: list[CardPlay]) -> bool:
+    return any(
+        isinstance(card_play, tuple) and MAH_JONG.mask & to_mask(card_play[0])
+        for card_play in legal_plays
+    )
+
+
+class LLMPlayer(AsyncPlayer):
+    """Asks a model for every card play.
+
+    The model chooses from the numbered legal plays, so its answer is
+    always a valid play; a forced play is made without asking. Concurrent
+    games should use get_card_play_async, which goes through the shared
+    async client unless another one is given. With a cache, responses are
+    reused for decisions the seat has seen before.
+    """
+
+    def __init__(
+        self,
+        name: str = "Anonymous",
+        model: str = DEFAULT_MODEL,
+        client: OpenAI | None = None,
+        async_client: AsyncOpenAI | None = None,
+        cache: ResponseCache | None = None,
+    ):
         super().__init__(name)
-        load_dotenv()
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not found in environment variables.")
-        self.client = OpenAI(api_key=api_key)
+        self.model = model
+        self.cache = cache
+        if client is None and async_client is None:
+            client = OpenAI(api_key=_get_api_key())
+        self.client = client
+        self.async_client = async_client
+
+    def _get_player_idx(self) -> int:
+        if self.player_idx is None:
+            msg = "The player must join a game before playing."
+            raise ValueError(msg)
+        return self.player_idx
 
     def get_card_play(self, game_state: TichuState) -> CardPlay:
-        player_state = game_state.get_player_state(self.player_idx)
-        # Load rules from file
-        rules_path = os.path.join(os.path.dirname(__file__), "..", "..", "rules.md")
-        with open(rules_path, "r", encoding="utf-8") as f:
-            rules = f.read()
-
-        prompt = f"""
-Game Rules:
-{rules}
-
-Your Name: {self.name}
-Your Hand: {', '.join(str(card) for card in player_state.hand)}
-
-{game_state}
-
-Instructions: Decide what to play based on the rules and state. Respond with exactly one of:
-- 'pass' to pass your turn
-- 'tichu' to call Tichu (only if you have a full hand and haven't called Grand Tichu)
-- Tuple of 
-    - List of card indices (0-based) to play those cards from your hand
-    - Integer argument (for Dragon card recipient or Mah Jong wish) if applicable, else None.
-
-Ensure the play is valid according to the rules.
-"""
-
-        response = self.client.responses.parse(
-            text_format=LLMPlay,
-            model="gpt-4o-2024-08-06",
-            input=[{"role": "user", "content": prompt}],
-        )
-
-        if not response or not response.output_parsed:
+        if self.client is None:
+            return super().get_card_play(game_state)
+        player_idx = self._get_player_idx()
+        legal_plays = get_legal_plays(game_state, player_idx)
+        if len(legal_plays) == 1 and not _has_mah_jong(legal_plays):
+            return legal_plays[0]
+        llm_play = self.get_cached_play(game_state, player_idx)
+        if llm_play is None:
+            response = self.client.responses.parse(
+                **self.get_request(game_state, player_idx, legal_plays)
+            )
+            llm_play = self.cache_play(game_state, player_idx, response)
+        return self.parse_play(llm_play, legal_plays)
+
+    async def get_card_play_async(self, game_state: TichuState) -> CardPlay:
+        client = self.async_client or get_async_client()
+        player_idx = self._get_player_idx()
+        legal_plays = get_legal_plays(game_state, player_idx)
+        if len(legal_plays) == 1 and not _has_mah_jong(legal_plays):
+            return legal_plays[0]
+        llm_play = self.get_cached_play(game_state, player_idx)
+        if llm_play is None:
+            response = await client.responses.parse(
+                **self.get_request(game_state, player_idx, legal_plays)
+            )
+            llm_play = self.cache_play(game_state, player_idx, response)
+        return self.parse_play(llm_play, legal_plays)
+
+    def get_request(
+        self, game_state: TichuState, player_idx: int, legal_plays: list[CardPlay]
+    ) -> dict[str, Any]:
+        """Arguments of the responses.parse request for a decision."""
+        return {
+            "text_format": get_play_format(
+                len(legal_plays), _has_mah_jong(legal_plays)
+            ),
+            "model": self.model,
+            "input": get_prompt_input(game_state, player_idx, self.name, legal_plays),
+        }
+
+    def get_cached_play(
+        self, game_state: TichuState, player_idx: int
+    ) -> LLMPlay | None:
+        if self.cache is None:
+            return None
+        response = self.cache.get(get_situation_key(self.model, game_state, player_idx))
+        return None if response is None else LLMPlay.model_validate_json(response)
+
+    def cache_play(
+        self, game_state: TichuState, player_idx: int, response
+    ) -> LLMPlay | None:
+        """The parsed play of a response, stored in the cache if there is one."""
+        llm_play = response.output_parsed if response else None
+        if self.cache is not None and llm_play is not None:
+            self.cache.put(
+                get_situation_key(self.model, game_state, player_idx),
+                llm_play.model_dump_json(),
+            )
+        return llm_play
+
+    def parse_play(
+        self, llm_play: LLMPlay | None, legal_plays: list[CardPlay]
+    ) -> CardPlay:
+        if not llm_play:
             raise InvalidLLMResponse("No response from LLM")
-        play = response.output_parsed.play
-        if play == "pass":
-            return "pass"
-        elif play == "tichu":
-            return "tichu"
-        if play and all(0 <= idx < len(player_state.hand) for idx in play):
-            argument = response.output_parsed.argument
-            return {player_state.hand[idx] for idx in play}, argument
-        raise InvalidLLMResponse(f"Invalid card indices: {play}")
+        if not 0 <= llm_play.choice < len(legal_plays):
+            raise InvalidLLMResponse(f"Invalid choice: {llm_play.choice}")
+        card_play = legal_plays[llm_play.choice]
+        if not isinstance(card_play, tuple):
+            return card_play
+        cards, _ = card_play
+        if not MAH_JONG.mask & to_mask(cards):
+            return card_play
+        if llm_play.wish not in NORMAL_CARD_VALUES:
+            raise InvalidLLMResponse(f"Invalid wish: {llm_play.wish}")
+        return cards, llm_play.wish
 
     def get_grand_tichu_play(self, game_state: TichuState):
-        # TODO: Implement LLM grand tichu play
-        return "pass"
+        player_state = game_state.get_player_state(self.player_idx)
+        return "grand_tichu" if should_call_grand_tichu(player_state) else "pass"
 
-    def get_push_play(self, game_state: TichuState) -> set[int]:
-        # TODO: Implement LLM push play
-        return set(random.sample(range(HAND_SIZE), NUM_PLAYERS - 1))
+    def get_push_play(self, game_state: TichuState) -> list[int]:
+        return choose_push(game_state.get_player_state(self.player_idx).hand)
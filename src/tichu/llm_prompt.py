@@ -0,0 +1,137 @@
+import os
+from functools import cache
+
+from tichu import HAND_SIZE, NUM_PLAYERS
+from tichu.card import DRAGON, from_mask
+from tichu.combination import Combination
+from tichu.tichu_state import CardPlay, TichuState
+
+RULES_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "rules.md")
+# Most recent play log entries sent with every decision.
+RECENT_PLAYS = NUM_PLAYERS * 2
+
+INSTRUCTIONS = """Instructions: Decide what to play based on the rules and state. Respond with:
+- choice: the number of one of the listed legal plays
+- wish: the card value (2 to 14) to wish for if the chosen play contains the Mah Jong, else None."""
+
+
+@cache
+def load_rules(path: str = RULES_PATH) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@cache
+def get_static_prefix() -> str:
+    """The part of the prompt that is the same for every decision.
+
+    It comes first and never changes within a process, so the API can
+    cache it as a prompt prefix.
+    """
+    return f"""Game Rules:
+{load_rules()}
+
+{INSTRUCTIONS}"""
+
+
+def format_card_play(card_play: CardPlay) -> str:
+    if card_play == "pass":
+        return "pass"
+    if card_play == "tichu":
+        return "called Tichu"
+    cards, argument = card_play
+    played_cards = from_mask(cards) if isinstance(cards, int) else cards
+    played = ", ".join(
+        str(card) for card in sorted(played_cards, key=lambda c: c.value)
+    )
+    if argument is None:
+        return played
+    if DRAGON in played_cards:
+        return f"{played} (trick to Player {argument})"
+    return f"{played} (wish: {argument})"
+
+
+def get_legal_plays(game_state: TichuState, player_idx: int) -> list[CardPlay]:
+    """The plays the current player may make, one per play class.
+
+    Plays that only differ in the colors of their cards are merged, keeping
+    straight bombs apart. The Dragon is listed once per opponent it can
+    give the trick to; the Mah Jong wish is left to be chosen.
+    """
+    player_state = game_state.get_player_state(player_idx)
+    hand = player_state.hand
+    combination = game_state.current_combination
+    wish = game_state.current_wish
+    legal_plays: list[CardPlay] = []
+    if (
+        len(hand) == HAND_SIZE
+        and not player_state.tichu_called
+        and not player_state.grand_tichu_called
+    ):
+        legal_plays.append("tichu")
+    must_fulfill_wish = (
+        wish is not None
+        and Combination.can_fulfill_wish(combination, wish, hand)
+        and Combination.has_any_play(combination, hand, wish)
+    )
+    if combination is not None and not must_fulfill_wish:
+        legal_plays.append("pass")
+    for play_class in Combination.play_classes(
+        combination, hand, wish if must_fulfill_wish else None
+    ):
+        cards = play_class.get_representative()
+        if DRAGON in cards:
+            legal_plays.extend(
+                (cards, (player_idx + offset) % NUM_PLAYERS)
+                for offset in range(1, NUM_PLAYERS, 2)
+            )
+        else:
+            legal_plays.append((cards, None))
+    return legal_plays
+
+
+def get_state_prompt(
+    game_state: TichuState,
+    player_idx: int,
+    name: str,
+    legal_plays: list[CardPlay],
+) -> str:
+    """What changed for a decision: the seat's hand, the table, recent plays and the legal plays."""
+    player_state = game_state.get_player_state(player_idx)
+    hand = ", ".join(str(card) for card in player_state.hand)
+    hand_sizes = ", ".join(
+        f"Player {idx}: {len(other.hand)}"
+        for idx, other in enumerate(game_state.player_states)
+    )
+    recent_plays = "\n".join(
+        f"- Player {idx}: {format_card_play(card_play)}"
+        for idx, card_play in game_state.play_log[-RECENT_PLAYS:]
+    )
+    menu = "\n".join(
+        f"{choice}: {format_card_play(card_play)}"
+        for choice, card_play in enumerate(legal_plays)
+    )
+    return f"""You are {name}, Player {player_idx}. Your partner is Player {(player_idx + 2) % NUM_PLAYERS}.
+Your Hand: {hand}
+
+{game_state}
+- Cards in hand: {hand_sizes}
+Recent plays:
+{recent_plays or "- none"}
+Legal plays:
+{menu}"""
+
+
+def get_prompt_input(
+    game_state: TichuState,
+    player_idx: int,
+    name: str,
+    legal_plays: list[CardPlay],
+) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": get_static_prefix()},
+        {
+            "role": "user",
+            "content": get_state_prompt(game_state, player_idx, name, legal_plays),
+        },
+    ]
@@ -0,0 +1,174 @@
+import random
+import time
+
+from tichu import MATCH_SCORE, TICHU_SCORE
+from tichu.card import Card
+from tichu.hand_strength import should_call_grand_tichu, should_call_tichu
+from tichu.player import Player, PlayerType
+from tichu.push import choose_push
+from tichu.search import determinize, iter_moves
+from tichu.tichu import InvalidPlayError, Tichu
+from tichu.tichu_state import CardPlay, TichuState
+from tichu.transposition_table import TranspositionTable
+from tichu.zobrist import TEAM_KEYS
+
+HAND_CARD_PENALTY = 5
+FIRST_PLACE_BONUS = 50
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the move's time budget is used up."""
+
+
+class MiniMaxiPlayer(Player):
+    """Expectimax search over sampled opponent hands.
+
+    The player's team maximises, opponents are chance nodes choosing
+    uniformly among their moves. Moves are one representative per play
+    class, the search deepens iteratively and stops at the time budget.
+    Values of inner nodes go to a transposition table that several players
+    can share.
+    """
+
+    def __init__(
+        self,
+        name: str = "Anonymous",
+        time_budget: float = 0.05,
+        max_depth: int = 8,
+        num_samples: int = 4,
+        seed: int | None = None,
+        transposition_table: TranspositionTable | None = None,
+    ):
+        super().__init__(name)
+        self.player_type = PlayerType.MINI_MAXI
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.num_samples = num_samples
+        self.random = random.Random(seed)
+        self.transposition_table = (
+            TranspositionTable() if transposition_table is None else transposition_table
+        )
+
+    def get_card_play(self, game_state: TichuState) -> CardPlay:
+        player_idx = self.player_idx
+        if player_idx is None:
+            msg = "The player must join a game before playing."
+            raise ValueError(msg)
+        if should_call_tichu(game_state.get_player_state(player_idx)):
+            return "tichu"
+        deadline = time.perf_counter() + self.time_budget
+        self.transposition_table.new_search()
+        engine = Tichu(listeners=[])
+        engine.state = game_state
+        moves = self.get_moves(engine)
+        if len(moves) == 1:
+            return moves[0]
+        samples = [
+            self.sample_state(game_state, player_idx) for _ in range(self.num_samples)
+        ]
+        best_move = moves[0]
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best_move = self._search_root(
+                    samples, moves, player_idx, depth, deadline
+                )
+            except SearchTimeout:
+                break
+        return best_move
+
+    def get_grand_tichu_play(self, game_state: TichuState):
+        player_state = game_state.get_player_state(self.player_idx)
+        return "grand_tichu" if should_call_grand_tichu(player_state) else "pass"
+
+    def get_push_play(self, game_state: TichuState) -> list[int]:
+        return choose_push(game_state.get_player_state(self.player_idx).hand)
+
+    def get_moves(self, engine: Tichu) -> list[CardPlay]:
+        return [card_play for _, card_play in iter_moves(engine)]
+
+    def sample_state(self, game_state: TichuState, player_idx: int) -> TichuState:
+        """Copy the state, redealing the cards player_idx cannot see to the others."""
+        return determinize(game_state, player_idx, self.random)
+
+    def evaluate(self, state: TichuState, team: int) -> float:
+        """Heuristic value of a state for a team."""
+        value = 0
+        for player_idx, player_state in enumerate(state.player_states):
+            sign = 1 if player_idx % 2 == team else -1
+            value += sign * (
+                Card.count_card_scores(player_state.card_stack)
+                - HAND_CARD_PENALTY * len(player_state.hand)
+            )
+            if player_state.tichu_called or player_state.grand_tichu_called:
+                if state.player_rankings and state.player_rankings[0] == player_idx:
+                    value += sign * TICHU_SCORE
+                elif state.player_rankings:
+                    value -= sign * TICHU_SCORE
+        value += (
+            1 if state.winning_player_idx % 2 == team else -1
+        ) * Card.count_card_scores(state.card_stack)
+        if state.player_rankings:
+            first_team = state.player_rankings[0] % 2
+            sign = 1 if first_team == team else -1
+            value += sign * FIRST_PLACE_BONUS
+            if (
+                len(state.player_rankings) >= 2
+                and state.player_rankings[1] % 2 == first_team
+            ):
+                value += sign * MATCH_SCORE
+        return value
+
+    def _search_root(
+        self,
+        samples: list[TichuState],
+        moves: list[CardPlay],
+        player_idx: int,
+        depth: int,
+        deadline: float,
+    ) -> CardPlay:
+        totals = [0.0] * len(moves)
+        engine = Tichu(listeners=[])
+        for sample in samples:
+            engine.state = sample
+            for move_idx, move in enumerate(moves):
+                try:
+                    record = engine.apply_move(player_idx, move)
+                except InvalidPlayError:
+                    totals[move_idx] = float("-inf")
+                    continue
+                totals[move_idx] += self._expectimax(
+                    engine, player_idx % 2, depth - 1, deadline
+                )
+                engine.undo_move(record)
+        return moves[max(range(len(moves)), key=totals.__getitem__)]
+
+    def _expectimax(
+        self, engine: Tichu, team: int, depth: int, deadline: float
+    ) -> float:
+        if time.perf_counter() > deadline:
+            raise SearchTimeout
+        state = engine.state
+        if depth == 0 or engine.end_of_round:
+            return self.evaluate(state, team)
+        # The same position is reached through different pass orders.
+        key = state.zobrist_key ^ TEAM_KEYS[team]
+        value = self.transposition_table.get(key, depth)
+        if value is not None:
+            return value
+        player_idx = state.current_player_idx
+        values = []
+        for move in self.get_moves(engine):
+            try:
+                record = engine.apply_move(player_idx, move)
+            except InvalidPlayError:
+                continue
+            values.append(self._expectimax(engine, team, depth - 1, deadline))
+            engine.undo_move(record)
+        if not values:
+            value = self.evaluate(state, team)
+        elif player_idx % 2 == team:
+            value = max(values)
+        else:
+            value = sum(values) / len(values)
+        self.transposition_table.store(key, depth, value)
+        return value
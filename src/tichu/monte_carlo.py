@@ -0,0 +1,144 @@
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+from tichu import HAND_SIZE, NUM_PLAYERS
+from tichu.card import FULL_MASK, NUM_CARDS, Card, CardMask, to_mask
+
+# Takes dealt hands as a (deals, players, NUM_CARDS) boolean array and
+# returns a (deals,) boolean array.
+type DealPredicate = Callable[[np.ndarray], np.ndarray]
+
+
+@dataclass
+class Estimate:
+    """A Monte Carlo probability estimate with its Wilson score interval."""
+
+    hits: int
+    trials: int
+    confidence: float = 0.95
+
+    @property
+    def probability(self) -> float:
+        return self.hits / self.trials if self.trials else 0.0
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        if not self.trials:
+            return 0.0, 1.0
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        p = self.probability
+        denominator = 1 + z**2 / self.trials
+        center = (p + z**2 / (2 * self.trials)) / denominator
+        half_width = (
+            z
+            * math.sqrt(p * (1 - p) / self.trials + z**2 / (4 * self.trials**2))
+            / denominator
+        )
+        return max(0.0, center - half_width), min(1.0, center + half_width)
+
+    @property
+    def half_width(self) -> float:
+        low, high = self.interval
+        return (high - low) / 2
+
+    def __str__(self):
+        low, high = self.interval
+        return f"{self.probability:.6f} ({self.confidence:.0%} CI {low:.6f}-{high:.6f}, {self.trials} trials)"
+
+
+def deal_hands(
+    rng: np.random.Generator,
+    num_deals: int,
+    cards: CardMask = FULL_MASK,
+    hand_sizes: Iterable[int] = (HAND_SIZE,) * NUM_PLAYERS,
+) -> np.ndarray:
+    """Deal the cards num_deals times as a (deals, players, NUM_CARDS) boolean array.
+
+    Every deal is a random permutation of the cards, obtained by sorting
+    random keys, whose consecutive slices go to the players.
+    """
+    card_indices = np.array(
+        [index for index in range(NUM_CARDS) if cards >> index & 1], dtype=np.intp
+    )
+    hand_sizes = list(hand_sizes)
+    num_dealt = sum(hand_sizes)
+    if num_dealt > len(card_indices):
+        raise ValueError("Hand sizes exceed the number of cards.")
+    order = np.argsort(
+        rng.random((num_deals, len(card_indices)), dtype=np.float32), axis=1
+    )
+    dealt = card_indices[order[:, :num_dealt]]
+    # Offset each player's cards into their own row of the flattened hands.
+    seats = np.repeat(np.arange(len(hand_sizes)), hand_sizes) * NUM_CARDS
+    hands = np.zeros((num_deals, len(hand_sizes) * NUM_CARDS), dtype=bool)
+    np.put_along_axis(hands, dealt + seats, True, axis=1)
+    return hands.reshape(num_deals, len(hand_sizes), NUM_CARDS)
+
+
+def _get_indices(cards: set[Card] | CardMask) -> list[int]:
+    mask = to_mask(cards)
+    return [index for index in range(NUM_CARDS) if mask >> index & 1]
+
+
+def holds_all(player_idx: int, cards: set[Card] | CardMask) -> DealPredicate:
+    indices = _get_indices(cards)
+    return lambda hands: hands[:, player_idx, indices].all(axis=1)
+
+
+def holds_any(player_idx: int, cards: set[Card] | CardMask) -> DealPredicate:
+    indices = _get_indices(cards)
+    return lambda hands: hands[:, player_idx, indices].any(axis=1)
+
+
+def holds_any_of(player_idx: int, plays: list[set[Card]]) -> DealPredicate:
+    predicates = [holds_all(player_idx, play) for play in plays]
+    return lambda hands: np.logical_or.reduce(
+        [predicate(hands) for predicate in predicates]
+    )
+
+
+def estimate(
+    event: DealPredicate,
+    given: DealPredicate | None = None,
+    cards: CardMask = FULL_MASK,
+    hand_sizes: Iterable[int] = (HAND_SIZE,) * NUM_PLAYERS,
+    confidence: float = 0.95,
+    target_half_width: float | None = None,
+    batch_size: int = 100_000,
+    max_trials: int = 1_000_000,
+    seed: int | None = None,
+) -> Estimate:
+    """Estimate the probability of an event over random deals.
+
+    With given, the probability is conditional and only deals satisfying it
+    count as trials. Deals are drawn in batches until max_trials, or until
+    the confidence interval is at most target_half_width wide on each side.
+    """
+    rng = np.random.default_rng(seed)
+    hand_sizes = tuple(hand_sizes)
+    result = Estimate(0, 0, confidence)
+    num_deals = 0
+    while num_deals < max_trials:
+        hands = deal_hands(
+            rng, min(batch_size, max_trials - num_deals), cards, hand_sizes
+        )
+        num_deals += len(hands)
+        hits = event(hands)
+        if given is not None:
+            condition = given(hands)
+            hits = hits & condition
+            result.trials += int(condition.sum())
+        else:
+            result.trials += len(hands)
+        result.hits += int(hits.sum())
+        if (
+            target_half_width is not None
+            and result.trials
+            and result.half_width <= target_half_width
+        ):
+            break
+    return result
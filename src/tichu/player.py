@@ -1,4 +1,5 @@
 import abc
+import asyncio
 from enum import Enum
 from typing import Literal
 
@@ -12,6 +13,7 @@ class PlayerType(Enum):
     MINI_MAXI = "mini_maxi"
     LLM = "llm"
     RANDOM = "random"
+    ISMCTS = "ismcts"
 
 
 class Player(abc.ABC):
@@ -37,13 +39,17 @@ class Player(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_push_play(self, game_state: TichuState) -> set[int]:
-        pass
+    def get_push_play(self, game_state: TichuState) -> set[int] | list[int]:
+        """Hand indices of the cards to push.
+
+        A list gives the cards for the left player, the partner and the
+        right player in that order; a set pushes them in hand order.
+        """
 
     def reset_for_new_round(self, game_state: TichuState):
         """Reset the player's state for a new round."""
         player_state = game_state.get_player_state(self.player_idx)
-        player_state.hand.clear()
+        player_state.hand = []
         player_state.card_stack.clear()
         player_state.has_passed = False
         player_state.tichu_called = False
@@ -60,3 +66,19 @@ class Player(abc.ABC):
 
     def __str__(self):
         return f"Player {self.name} with index {self.player_idx}"
+
+
+class AsyncPlayer(Player):
+    """A player whose card plays are awaited, e.g. because they wait on the network.
+
+    Tichu.play_round_async awaits get_card_play_async, so other games can
+    run while this player is thinking. The synchronous get_card_play runs it
+    in an event loop of its own.
+    """
+
+    @abc.abstractmethod
+    async def get_card_play_async(self, game_state: TichuState) -> CardPlay:
+        pass
+
+    def get_card_play(self, game_state: TichuState) -> CardPlay:
+        return asyncio.run(self.get_card_play_async(game_state))
@@ -1,12 +1,49 @@
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
-from tichu.card import Card
+from tichu.card import Card, CardMask, to_mask
 
 
 @dataclass
 class PlayerState:
+    """The hand, stack and calls of one player.
+
+    hand_mask follows the hand: it is recomputed when hand is assigned and
+    updated by add_cards and remove_cards. Change the hand in place only
+    through these methods.
+    """
+
     hand: list[Card] = field(default_factory=list)
     card_stack: list[Card] = field(default_factory=list)
     has_passed: bool = False
     tichu_called: bool = False
     grand_tichu_called: bool = False
+    hand_mask: CardMask = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name == "hand":
+            super().__setattr__("hand_mask", to_mask(value))
+
+    def copy(self) -> "PlayerState":
+        return PlayerState(
+            list(self.hand),
+            list(self.card_stack),
+            self.has_passed,
+            self.tichu_called,
+            self.grand_tichu_called,
+        )
+
+    def add_cards(self, cards: Iterable[Card]):
+        for card in cards:
+            self.hand.append(card)
+            self.hand_mask |= card.mask
+
+    def remove_cards(self, cards: Iterable[Card] | CardMask):
+        cards_mask = to_mask(cards)
+        self.hand[:] = [card for card in self.hand if not card.mask & cards_mask]
+        self.hand_mask &= ~cards_mask
+
+    @property
+    def card_stack_mask(self) -> CardMask:
+        return to_mask(self.card_stack)
@@ -1,21 +1,43 @@
-from functools import reduce
 import math
-import random
-from tichu import NUM_PLAYERS
-from tichu.player import Player
-from tichu.random_player import RandomPlayer
-from tichu.tichu import Tichu
-from tqdm import tqdm
-from tichu.card import DOG, DRAGON, MAH_JONG, NORMAL_CARD_VALUES, PHOENIX, Card, Color
+from functools import cache, reduce
+
+from tichu import monte_carlo
+from tichu.card import (
+    DECK,
+    NORMAL_CARD_VALUES,
+    NUM_CARDS,
+    NUM_COLORS,
+    Card,
+    CardMask,
+    Color,
+    MAH_JONG,
+    PHOENIX,
+    DRAGON,
+    to_mask,
+)
+from tichu.combination import STRAIGHT_MIN_SIZE
+from tichu.search import get_unseen_mask
+from tichu.tichu_state import TichuState
+
+_BINOMIALS = tuple(
+    tuple(math.comb(n, k) for k in range(NUM_CARDS + 1)) for n in range(NUM_CARDS + 1)
+)
+
+
+def binomial(n: int, k: int) -> int:
+    """Binomial coefficient for up to NUM_CARDS, looked up in a precomputed table."""
+    if k < 0 or k > n:
+        return 0
+    return _BINOMIALS[n][k]
 
 
 def get_probability_for_combination(
     remaining_cards: set[Card], hand_size: int, play: set[Card]
 ):
     if all([card in remaining_cards for card in play]):
-        return math.comb(
+        return binomial(
             len(remaining_cards) - len(play), hand_size - len(play)
-        ) / math.comb(len(remaining_cards), hand_size)
+        ) / binomial(len(remaining_cards), hand_size)
     else:
         return 0
 
@@ -30,28 +52,171 @@ def get_probability_for_combination_excluding_others(
         reduce(
             lambda x, y: x + y,
             [
-                math.comb(len(remaining_cards) - len(play), hand_size - len(play))
+                binomial(len(remaining_cards) - len(play), hand_size - len(play))
                 for play in impossible_plays
             ],
         )
-        / math.comb(len(remaining_cards), hand_size)
+        / binomial(len(remaining_cards), hand_size)
     )
-    combinations_play = math.comb(
+    combinations_play = binomial(
         len(remaining_cards) - len(play), hand_size - len(play)
     )
     for impossible_play in impossible_plays:
-        combinations_play -= math.comb(
+        combinations_play -= binomial(
             len(remaining_cards) - len(play) - len(impossible_play - play),
             hand_size - len(play) - len(impossible_play - play),
         )
     return (
-        combinations_play / math.comb(len(remaining_cards), hand_size)
+        combinations_play / binomial(len(remaining_cards), hand_size)
     ) / probability_impossible_plays
 
 
+def get_probability_for_cards(
+    unknown_cards: CardMask, hand_size: int, cards: CardMask
+) -> float:
+    """Probability that a hand dealt from the unknown cards holds all cards."""
+    if cards & ~unknown_cards:
+        return 0.0
+    num_unknown = unknown_cards.bit_count()
+    num_cards = cards.bit_count()
+    return binomial(num_unknown - num_cards, hand_size - num_cards) / binomial(
+        num_unknown, hand_size
+    )
+
+
+def _get_bomb_masks(unknown_cards: CardMask) -> list[CardMask]:
+    """Four of a kinds and shortest straight bombs made only of unknown cards."""
+    bomb_masks = []
+    for value in NORMAL_CARD_VALUES:
+        mask = 0
+        for color_value in range(NUM_COLORS):
+            mask |= Card(Color(color_value), value).mask
+        bomb_masks.append(mask)
+    # Every longer straight bomb contains one of the shortest.
+    for color_value in range(NUM_COLORS):
+        for start in range(
+            NORMAL_CARD_VALUES[0], NORMAL_CARD_VALUES[-1] - STRAIGHT_MIN_SIZE + 2
+        ):
+            mask = 0
+            for value in range(start, start + STRAIGHT_MIN_SIZE):
+                mask |= Card(Color(color_value), value).mask
+            bomb_masks.append(mask)
+    return [mask for mask in bomb_masks if mask & unknown_cards == mask]
+
+
+@cache
+def get_probability_for_any_bomb(unknown_cards: CardMask, hand_size: int) -> float:
+    """Probability that a hand dealt from the unknown cards holds any bomb.
+
+    Inclusion-exclusion over the bombs: the signed count of every union of
+    bomb card sets is accumulated, skipping unions larger than the hand.
+    """
+    unions: dict[CardMask, int] = {0: 1}
+    for bomb_mask in _get_bomb_masks(unknown_cards):
+        for union, sign in list(unions.items()):
+            new_union = union | bomb_mask
+            if new_union.bit_count() <= hand_size:
+                unions[new_union] = unions.get(new_union, 0) - sign
+    num_unknown = unknown_cards.bit_count()
+    no_bomb_hands = sum(
+        sign * binomial(num_unknown - union.bit_count(), hand_size - union.bit_count())
+        for union, sign in unions.items()
+    )
+    return 1.0 - no_bomb_hands / binomial(num_unknown, hand_size)
+
+
+@cache
+def get_probability_for_straight(
+    unknown_cards: CardMask,
+    hand_size: int,
+    min_length: int = STRAIGHT_MIN_SIZE,
+    above_value: int = 0,
+) -> float:
+    """Probability that a hand dealt from the unknown cards holds a straight.
+
+    Only straights of at least min_length ending above above_value count,
+    with the Phoenix filling a gap. Hands without such a straight are
+    counted by a dynamic program over the card values, tracking the run
+    ending at the current value with and without one gap.
+    """
+    value_counts = [0] * (NORMAL_CARD_VALUES[-1] + 1)
+    value_counts[MAH_JONG.value] = int(bool(unknown_cards & MAH_JONG.mask))
+    for value in NORMAL_CARD_VALUES:
+        for color_value in range(NUM_COLORS):
+            if unknown_cards & Card(Color(color_value), value).mask:
+                value_counts[value] += 1
+    has_phoenix = bool(unknown_cards & PHOENIX.mask)
+    num_others = unknown_cards.bit_count() - sum(value_counts) - has_phoenix
+
+    no_straight_hands = 0
+    for holds_phoenix in (False, True) if has_phoenix else (False,):
+        # (run, run with one gap) -> number of ways by cards taken
+        states: dict[tuple[int, int], list[int]] = {(0, 0): [1] + [0] * hand_size}
+        for value in range(MAH_JONG.value, NORMAL_CARD_VALUES[-1] + 1):
+            next_states: dict[tuple[int, int], list[int]] = {}
+            for (run, gap_run), ways in states.items():
+                for taken in range(value_counts[value] + 1):
+                    if taken:
+                        next_run, next_gap_run = run + 1, gap_run + 1
+                    else:
+                        next_run = 0
+                        next_gap_run = run + 1 if holds_phoenix and value > 1 else 0
+                    longest = next_gap_run if holds_phoenix else next_run
+                    if longest >= min_length and value > above_value:
+                        continue
+                    key = (min(next_run, min_length), min(next_gap_run, min_length))
+                    next_ways = next_states.setdefault(key, [0] * (hand_size + 1))
+                    factor = binomial(value_counts[value], taken)
+                    for num_cards in range(hand_size + 1 - taken):
+                        if ways[num_cards]:
+                            next_ways[num_cards + taken] += ways[num_cards] * factor
+            states = next_states
+        for ways in states.values():
+            for num_cards, count in enumerate(ways):
+                no_straight_hands += count * binomial(
+                    num_others, hand_size - num_cards - holds_phoenix
+                )
+    return 1.0 - no_straight_hands / binomial(unknown_cards.bit_count(), hand_size)
+
+
+class ProbabilityEngine:
+    """Answers what another player may hold, from one player's point of view.
+
+    The other players' hands are treated as dealt uniformly from the cards
+    the player has not seen, keeping their known hand sizes.
+    """
+
+    def __init__(self, game_state: TichuState, player_idx: int):
+        self.unknown_cards = get_unseen_mask(game_state, player_idx)
+        self.hand_sizes = [
+            len(player_state.hand) for player_state in game_state.player_states
+        ]
+
+    def holds_cards(self, player_idx: int, cards: set[Card] | CardMask) -> float:
+        return get_probability_for_cards(
+            self.unknown_cards, self.hand_sizes[player_idx], to_mask(cards)
+        )
+
+    def holds_dragon(self, player_idx: int) -> float:
+        return self.holds_cards(player_idx, DRAGON.mask)
+
+    def holds_any_bomb(self, player_idx: int) -> float:
+        return get_probability_for_any_bomb(
+            self.unknown_cards, self.hand_sizes[player_idx]
+        )
+
+    def holds_straight(
+        self,
+        player_idx: int,
+        min_length: int = STRAIGHT_MIN_SIZE,
+        above_value: int = 0,
+    ) -> float:
+        return get_probability_for_straight(
+            self.unknown_cards, self.hand_sizes[player_idx], min_length, above_value
+        )
+
+
 if __name__ == "__main__":
-    count = 0
-    count_excluding = 0
     play = {
         Card(Color.JADE, 2),
         Card(Color.SWORDS, 2),
@@ -75,52 +240,32 @@ if __name__ == "__main__":
         },
     ]
     player_num = 0
-    deck = []
-    for color in Color:
-        if color == Color.SPECIAL:
-            continue
-        for value in NORMAL_CARD_VALUES:
-            card = Card(color, value)
-            deck.append(card)
-    deck.extend([DOG, MAH_JONG, PHOENIX, DRAGON])
-    trials = 1000000
-    excluding_trails = 0
-    tichu = Tichu()
-    for i in tqdm(range(0, trials)):
-        players: list[Player] = [
-            RandomPlayer(f"Player {i}") for i in range(NUM_PLAYERS)
-        ]
-        tichu.new_game(players)
-
-        random.shuffle(deck)
-        for i, card in enumerate(deck):
-            player = players[i % NUM_PLAYERS]
-            player.state.hand.append(card)
-        if all(
-            not all(card in players[player_num].state.hand for card in not_play)
-            for not_play in not_plays
-        ):
-            excluding_trails += 1
-            if all(card in players[player_num].state.hand for card in play):
-                count_excluding += 1
-        if all(card in players[player_num].state.hand for card in play):
-            count += 1
-    emp_prob = count / trials
-    emp_prob_excluding = count_excluding / excluding_trails
-    print("Measured probability ", emp_prob)
+    holds_play = monte_carlo.holds_all(player_num, play)
+    holds_not_play = monte_carlo.holds_any_of(player_num, not_plays)
+    print(
+        "Measured probability ",
+        monte_carlo.estimate(holds_play, target_half_width=2e-4),
+    )
     print(
         "Calculated probability ",
         get_probability_for_combination(
-            set(deck),
+            set(DECK),
             14,
             play,
         ),
     )
-    print("Measured probability excluding others ", emp_prob_excluding)
+    print(
+        "Measured probability excluding others ",
+        monte_carlo.estimate(
+            holds_play,
+            given=lambda hands: ~holds_not_play(hands),
+            target_half_width=2e-4,
+        ),
+    )
     print(
         "Calculated probability excluding others ",
         get_probability_for_combination_excluding_others(
-            set(deck),
+            set(DECK),
             14,
             play,
             not_plays,
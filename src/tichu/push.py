@@ -0,0 +1,146 @@
+from functools import lru_cache
+from itertools import combinations
+
+from tichu import NUM_PLAYERS
+from tichu.card import NORMAL_CARD_VALUES, Card, Color, DOG, PHOENIX, DRAGON
+from tichu.combination import BOMB_SIZE, STRAIGHT_MIN_SIZE
+from tichu.hand_decomposition import (
+    COUNT_BITS,
+    MAX_VALUE,
+    MIN_VALUE,
+    RankKey,
+    count_min_plays,
+    get_rank_key,
+)
+
+# A play fewer to empty the hand is worth this much card strength.
+PLAY_WEIGHT = 6
+# Share of the strength of the card pushed to the partner the team keeps.
+PARTNER_SHARE = 0.5
+# Strength of the special cards, on the scale of the normal card values.
+SPECIAL_STRENGTHS = {DOG.value: 0, PHOENIX.value: 15, DRAGON.value: 16}
+CACHE_SIZE = 1 << 14
+
+# Values of the cards pushed to the left player, the partner and the right player.
+type PushValues = tuple[int, int, int]
+
+
+def _get_strength(value: int) -> float:
+    return SPECIAL_STRENGTHS.get(value, value)
+
+
+def get_bomb_cards(hand: list[Card]) -> set[Card]:
+    """Cards that are part of a four of a kind or a straight bomb."""
+    by_value: dict[int, list[Card]] = {}
+    by_color: dict[Color, set[int]] = {}
+    for card in hand:
+        if card.value in NORMAL_CARD_VALUES:
+            by_value.setdefault(card.value, []).append(card)
+            by_color.setdefault(card.color, set()).add(card.value)
+    bomb_cards = {
+        card for cards in by_value.values() if len(cards) == BOMB_SIZE for card in cards
+    }
+    for color, values in by_color.items():
+        run: list[int] = []
+        for value in [*NORMAL_CARD_VALUES, MAX_VALUE + 1]:
+            if value in values:
+                run.append(value)
+                continue
+            if len(run) >= STRAIGHT_MIN_SIZE:
+                bomb_cards.update(Card(color, run_value) for run_value in run)
+            run = []
+    return bomb_cards
+
+
+def _get_rest_plays(
+    key: RankKey, specials: frozenset[int], pushed: tuple[int, ...]
+) -> int:
+    for value in pushed:
+        if MIN_VALUE <= value <= MAX_VALUE:
+            key -= 1 << (COUNT_BITS * value)
+    kept = specials.difference(pushed)
+    # The Dog and the Dragon are always played on their own.
+    num_singles = (DOG.value in kept) + (DRAGON.value in kept)
+    return num_singles + count_min_plays(key, PHOENIX.value in kept)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _choose_push_values(
+    key: RankKey, specials: frozenset[int], free: tuple[tuple[int, int], ...]
+) -> PushValues | None:
+    """The best push of a hand given by its rank key and special cards.
+
+    Free holds the values of the cards that may be pushed, with their
+    number. Every choice of three cards is scored by the plays left to
+    empty the hand and the strength given away; the strongest of the three
+    goes to the partner, so the Dragon and the Phoenix never reach an
+    opponent. None if the free cards allow no such push.
+    """
+    values = sorted(
+        (value for value, count in free for _ in range(count)), key=_get_strength
+    )
+    strengths = [_get_strength(value) for value in values]
+    max_opponent_strength = _get_strength(NORMAL_CARD_VALUES[-1])
+    candidates: dict[PushValues, float] = {}
+    for low, middle, high in combinations(range(len(values)), NUM_PLAYERS - 1):
+        if strengths[middle] > max_opponent_strength:
+            continue
+        candidates[values[low], values[high], values[middle]] = -(
+            strengths[low] + strengths[middle] + (1 - PARTNER_SHARE) * strengths[high]
+        )
+    ranked = sorted(candidates.items(), key=lambda item: -item[1])
+    # Pushing a card saves at most one play, which bounds the score of the
+    # remaining candidates.
+    min_plays = _get_rest_plays(key, specials, ()) - (NUM_PLAYERS - 1)
+    best: tuple[float, PushValues] | None = None
+    for push_values, strength_score in ranked:
+        if best is not None and strength_score - PLAY_WEIGHT * min_plays <= best[0]:
+            break
+        score = strength_score - PLAY_WEIGHT * _get_rest_plays(
+            key, specials, push_values
+        )
+        if best is None or score > best[0]:
+            best = (score, push_values)
+    return None if best is None else best[1]
+
+
+def _get_free_values(
+    hand: list[Card], bomb_cards: set[Card]
+) -> tuple[tuple[int, int], ...]:
+    free: dict[int, int] = {}
+    for card in hand:
+        if card not in bomb_cards:
+            free[card.value] = free.get(card.value, 0) + 1
+    return tuple(sorted(free.items()))
+
+
+def choose_push(hand: list[Card]) -> list[int]:
+    """Hand indices of the cards to push to the left player, partner and right player.
+
+    Cards of bombs are only pushed if the other cards allow no push, e.g.
+    when they are only the Dog, the Phoenix and the Dragon. The result
+    depends only on the values of the hand and which cards are in bombs,
+    so it is cached on those.
+    """
+    key = get_rank_key(hand)
+    specials = frozenset(card.value for card in hand if card in (DOG, PHOENIX, DRAGON))
+    bomb_cards = get_bomb_cards(hand)
+    push_values = _choose_push_values(key, specials, _get_free_values(hand, bomb_cards))
+    if push_values is None and bomb_cards:
+        bomb_cards = set()
+        push_values = _choose_push_values(
+            key, specials, _get_free_values(hand, bomb_cards)
+        )
+    if push_values is None:
+        msg = "Not enough cards to push."
+        raise ValueError(msg)
+    indices: list[int] = []
+    for value in push_values:
+        indices.append(
+            next(
+                idx
+                for idx, card in enumerate(hand)
+                if card.value == value and card not in bomb_cards and idx not in indices
+            )
+        )
+    return indices
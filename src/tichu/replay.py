@@ -0,0 +1,86 @@
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from tichu.game_record import PlayRecord, RoundHeader, iter_rounds
+from tichu.tichu import Tichu
+from tichu.tichu_state import TichuState
+
+# Turns between the states a replay keeps, bounding the moves applied to
+# reach any turn.
+KEYFRAME_INTERVAL = 16
+
+
+class RoundReplay:
+    """Every state of a recorded round, rebuilt without asking any player.
+
+    The deal is reproduced from the seed of the header.
+    A copy of the state is kept every keyframe_interval turns, so reaching
+    a turn replays fewer than keyframe_interval plays from the keyframe
+    before it. scores holds the game scores once the round is scored.
+    """
+
+    def __init__(
+        self,
+        header: RoundHeader,
+        plays: list[PlayRecord],
+        scores: list[int] | None = None,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ):
+        if keyframe_interval < 1:
+            msg = "Keyframes must be at least one turn apart."
+            raise ValueError(msg)
+        self.header = header
+        self.plays = plays
+        self.keyframe_interval = keyframe_interval
+        self.engine = Tichu(listeners=[])
+        self.engine.state = TichuState(scores=list(scores or [0, 0]))
+        self.engine.start_recorded_round(header)
+        self.keyframes = [self.engine.state.copy()]
+        for turn, play in enumerate(plays, start=1):
+            self.engine.next_turn(play.player_idx, play.card_play)
+            if turn % keyframe_interval == 0:
+                self.keyframes.append(self.engine.state.copy())
+        self.final_state = self.engine.state
+        # Records cut off mid-round have no score.
+        self.round_scores: list[int] | None = None
+        if self.engine.end_of_round:
+            self.engine.state = self.final_state.copy()
+            self.round_scores = self.engine.end_round_scoring()
+            self.scores = self.engine.state.scores
+        else:
+            self.scores = list(self.final_state.scores)
+
+    def __len__(self) -> int:
+        return len(self.plays)
+
+    def get_state(self, turn: int) -> TichuState:
+        """A copy of the state after the first turn plays of the round."""
+        if not 0 <= turn <= len(self.plays):
+            msg = f"The round has no turn {turn}."
+            raise IndexError(msg)
+        keyframe_idx = turn // self.keyframe_interval
+        self.engine.state = self.keyframes[keyframe_idx].copy()
+        for play in self.plays[keyframe_idx * self.keyframe_interval : turn]:
+            self.engine.next_turn(play.player_idx, play.card_play)
+        return self.engine.state
+
+    def __iter__(self) -> Iterator[TichuState]:
+        """The states from the start of the round to its end."""
+        self.engine.state = self.keyframes[0].copy()
+        yield self.engine.state.copy()
+        for play in self.plays:
+            self.engine.next_turn(play.player_idx, play.card_play)
+            yield self.engine.state.copy()
+
+
+def replay_rounds(
+    stream: BinaryIO, keyframe_interval: int = KEYFRAME_INTERVAL
+) -> Iterator[RoundReplay]:
+    """Replay the rounds of a game record, carrying the scores within a game."""
+    scores = [0, 0]
+    for header, plays in iter_rounds(stream):
+        if header.round_number == 1:
+            scores = [0, 0]
+        replay = RoundReplay(header, plays, scores, keyframe_interval)
+        scores = replay.scores
+        yield replay
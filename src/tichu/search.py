@@ -0,0 +1,109 @@
+import random
+from collections.abc import Iterator
+from typing import Literal
+
+from tichu import NUM_PLAYERS
+from tichu.card import (
+    FULL_MASK,
+    NORMAL_CARD_VALUES,
+    Card,
+    CardMask,
+    MAH_JONG,
+    DRAGON,
+    from_mask,
+    to_mask,
+)
+from tichu.combination import Combination, CombinationType
+from tichu.tichu import Tichu
+from tichu.tichu_state import CardPlay, TichuState
+from tichu.zobrist import compute_key
+
+type MoveKey = tuple[tuple[int, ...], bool] | Literal["pass"]
+
+
+def get_move_key(card_play: CardPlay) -> MoveKey:
+    """Key of a move that does not depend on the colors of the cards played.
+
+    Plays are keyed by their rank signature and whether they are a straight
+    bomb, so the same move can be found in every sampled deal.
+    """
+    if not isinstance(card_play, tuple):
+        return "pass"
+    cards, _ = card_play
+    cards_mask = to_mask(cards)
+    combination = Combination.from_cards(cards_mask)
+    return (
+        tuple(sorted(card.value for card in from_mask(cards_mask))),
+        combination is not None
+        and combination.combination_type == CombinationType.STRAIGHT_BOMB,
+    )
+
+
+def get_play_argument(
+    player_idx: int, cards: set[Card], hand: list[Card]
+) -> int | None:
+    """Dragon recipient or Mah Jong wish for a play made by a search player."""
+    if DRAGON in cards:
+        return (player_idx + 1) % NUM_PLAYERS
+    if MAH_JONG in cards:
+        # Wish for the highest value we do not hold ourselves.
+        values = {card.value for card in hand}
+        return next(
+            (value for value in reversed(NORMAL_CARD_VALUES) if value not in values),
+            NORMAL_CARD_VALUES[-1],
+        )
+    return None
+
+
+def iter_moves(engine: Tichu) -> Iterator[tuple[MoveKey, CardPlay]]:
+    """One legal move per play class, plus passing when it is allowed."""
+    state = engine.state
+    player_idx = state.current_player_idx
+    hand = state.get_player_state(player_idx).hand
+    for play_class in Combination.play_classes(
+        state.current_combination, hand, state.current_wish
+    ):
+        # The representative of a class that can be a straight bomb is one.
+        cards = play_class.get_representative()
+        yield (
+            (play_class.signature, play_class.can_be_straight_bomb),
+            (cards, get_play_argument(player_idx, cards, hand)),
+        )
+    if state.current_combination is not None and not engine.can_fulfill_wish(
+        player_idx
+    ):
+        yield "pass", "pass"
+
+
+def get_unseen_mask(game_state: TichuState, player_idx: int) -> CardMask:
+    """Cards the player has not seen: neither in their hand nor played."""
+    seen = game_state.get_player_state(player_idx).hand_mask | to_mask(
+        game_state.card_stack
+    )
+    for player_state in game_state.player_states:
+        seen |= player_state.card_stack_mask
+    for _, card_play in game_state.play_log:
+        if isinstance(card_play, tuple):
+            seen |= to_mask(card_play[0])
+    return FULL_MASK & ~seen
+
+
+def determinize(
+    game_state: TichuState, player_idx: int, rng: random.Random
+) -> TichuState:
+    """Copy the state as one player could see it, dealing the unseen cards randomly.
+
+    The unseen cards are dealt to the other players, keeping their hand
+    sizes.
+    """
+    state = game_state.copy()
+    unseen = from_mask(get_unseen_mask(state, player_idx))
+    rng.shuffle(unseen)
+    for other_idx, player_state in enumerate(state.player_states):
+        if other_idx == player_idx:
+            continue
+        hand_size = len(player_state.hand)
+        player_state.hand = sorted(unseen[:hand_size], key=lambda c: c.value)
+        del unseen[:hand_size]
+    state.zobrist_key = compute_key(state)
+    return state
@@ -0,0 +1,209 @@
+import argparse
+import os
+import random
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+from tichu import NUM_PLAYERS
+from tichu.ismcts_player import ISMCTSPlayer
+from tichu.mini_maxi_player import MiniMaxiPlayer
+from tichu.player import Player, PlayerType
+from tichu.random_player import RandomPlayer
+from tichu.tichu import Tichu, TichuHooks
+
+type PlayerFactory = Callable[[str], Player]
+
+NUM_TEAMS = NUM_PLAYERS // 2
+DEFAULT_MAX_ROUNDS = 100
+PLAYER_FACTORIES: dict[str, PlayerFactory] = {
+    PlayerType.RANDOM.value: RandomPlayer,
+    PlayerType.MINI_MAXI.value: MiniMaxiPlayer,
+    PlayerType.ISMCTS.value: ISMCTSPlayer,
+}
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated statistics of a batch of matches, per team."""
+
+    games: int = 0
+    unfinished_games: int = 0
+    rounds: int = 0
+    wins: list[int] = field(default_factory=lambda: [0] * NUM_TEAMS)
+    points: list[int] = field(default_factory=lambda: [0] * NUM_TEAMS)
+    tichu_calls: list[int] = field(default_factory=lambda: [0] * NUM_TEAMS)
+    tichu_successes: list[int] = field(default_factory=lambda: [0] * NUM_TEAMS)
+    grand_tichu_calls: list[int] = field(default_factory=lambda: [0] * NUM_TEAMS)
+    grand_tichu_successes: list[int] = field(default_factory=lambda: [0] * NUM_TEAMS)
+
+    @property
+    def draws(self) -> int:
+        return self.games - sum(self.wins)
+
+    @property
+    def win_rates(self) -> list[float]:
+        return [wins / self.games if self.games else 0.0 for wins in self.wins]
+
+    @property
+    def average_score_per_round(self) -> list[float]:
+        return [points / self.rounds if self.rounds else 0.0 for points in self.points]
+
+    @property
+    def tichu_success_rates(self) -> list[float]:
+        return [
+            successes / calls if calls else 0.0
+            for successes, calls in zip(self.tichu_successes, self.tichu_calls)
+        ]
+
+    @property
+    def grand_tichu_success_rates(self) -> list[float]:
+        return [
+            successes / calls if calls else 0.0
+            for successes, calls in zip(
+                self.grand_tichu_successes, self.grand_tichu_calls
+            )
+        ]
+
+    def merge(self, other: "SimulationResult"):
+        self.games += other.games
+        self.unfinished_games += other.unfinished_games
+        self.rounds += other.rounds
+        for team in range(NUM_TEAMS):
+            self.wins[team] += other.wins[team]
+            self.points[team] += other.points[team]
+            self.tichu_calls[team] += other.tichu_calls[team]
+            self.tichu_successes[team] += other.tichu_successes[team]
+            self.grand_tichu_calls[team] += other.grand_tichu_calls[team]
+            self.grand_tichu_successes[team] += other.grand_tichu_successes[team]
+
+    def __str__(self):
+        return f"""Simulation Result:
+- Games: {self.games} ({self.unfinished_games} stopped at the round limit)
+- Rounds: {self.rounds}
+- Win rates: {_format_rates(self.win_rates)} (draws: {self.draws})
+- Average score per round: {_format_rates(self.average_score_per_round)}
+- Tichu success rates: {_format_rates(self.tichu_success_rates)} (calls: {self.tichu_calls})
+- Grand Tichu success rates: {_format_rates(self.grand_tichu_success_rates)} (calls: {self.grand_tichu_calls})"""
+
+
+def _format_rates(rates: list[float]) -> str:
+    return ", ".join(f"{rate:.3f}" for rate in rates)
+
+
+def _record_round(result: SimulationResult, game: Tichu, round_scores: list[int]):
+    result.rounds += 1
+    for team in range(NUM_TEAMS):
+        result.points[team] += round_scores[team]
+    for player_idx, player_state in enumerate(game.state.player_states):
+        team = player_idx % NUM_TEAMS
+        has_won = game.state.player_rankings[0] == player_idx
+        if player_state.grand_tichu_called:
+            result.grand_tichu_calls[team] += 1
+            result.grand_tichu_successes[team] += has_won
+        elif player_state.tichu_called:
+            result.tichu_calls[team] += 1
+            result.tichu_successes[team] += has_won
+
+
+def _record_match(result: SimulationResult, game: Tichu):
+    result.games += 1
+    if not game.match_over:
+        result.unfinished_games += 1
+    if game.state.scores[0] != game.state.scores[1]:
+        result.wins[game.state.scores.index(max(game.state.scores))] += 1
+
+
+def _simulate_games(
+    player_factories: Sequence[PlayerFactory],
+    seeds: Sequence[int],
+    goal_score: int,
+    max_rounds: int,
+) -> SimulationResult:
+    result = SimulationResult()
+    hooks = TichuHooks(on_round_end=partial(_record_round, result))
+    # Players draw from the global random module, so it is seeded as well to
+    # make every match reproducible on its own. The caller's state is put
+    # back afterwards, as matches may run in the caller's process.
+    random_state = random.getstate()
+    try:
+        for seed in seeds:
+            random.seed(seed)
+            game = Tichu(goal_score=goal_score, seed=seed, listeners=[])
+            game.new_game(
+                [
+                    factory(f"Player {player_idx}")
+                    for player_idx, factory in enumerate(player_factories)
+                ]
+            )
+            game.play_match(hooks, max_rounds=max_rounds)
+            _record_match(result, game)
+    finally:
+        random.setstate(random_state)
+    return result
+
+
+def simulate(
+    player_factories: Sequence[PlayerFactory],
+    games: int,
+    seed: int = 0,
+    goal_score: int = 1000,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+    workers: int | None = None,
+    chunks_per_worker: int = 4,
+) -> SimulationResult:
+    """Play full matches in a process pool and aggregate their statistics.
+
+    Match i is played with seed + i, so results do not depend on the number
+    of workers. Player factories must be picklable (e.g. player classes).
+    With a single worker all matches run in the current process.
+    """
+    if len(player_factories) != NUM_PLAYERS:
+        raise ValueError("Number of player factories must match NUM_PLAYERS")
+    seeds = range(seed, seed + games)
+    num_workers = workers or os.cpu_count() or 1
+    if num_workers == 1:
+        return _simulate_games(player_factories, seeds, goal_score, max_rounds)
+    result = SimulationResult()
+    num_chunks = max(1, num_workers * chunks_per_worker)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(
+                _simulate_games,
+                player_factories,
+                seeds[chunk_idx::num_chunks],
+                goal_score,
+                max_rounds,
+            )
+            for chunk_idx in range(min(num_chunks, games))
+        ]
+        for future in futures:
+            result.merge(future.result())
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate Tichu matches.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--goal-score", type=int, default=1000)
+    parser.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--players",
+        nargs=NUM_PLAYERS,
+        choices=sorted(PLAYER_FACTORIES),
+        default=[PlayerType.RANDOM.value] * NUM_PLAYERS,
+    )
+    args = parser.parse_args()
+    print(
+        simulate(
+            [PLAYER_FACTORIES[player_type] for player_type in args.players],
+            games=args.games,
+            seed=args.seed,
+            goal_score=args.goal_score,
+            max_rounds=args.max_rounds,
+            workers=args.workers,
+        )
+    )
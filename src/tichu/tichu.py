@@ -1,5 +1,7 @@
 import logging
 import random
+from collections.abc import Callable
+from dataclasses import dataclass
 
 from tichu import (
     GRAND_TICHU_HAND_SIZE,
@@ -9,15 +11,31 @@ from tichu import (
     NUM_PLAYERS,
     TICHU_SCORE,
 )
-from tichu.card import NORMAL_CARD_VALUES, Card, Color, DOG, MAH_JONG, PHOENIX, DRAGON
+from tichu import zobrist
+from tichu.card import (
+    DECK,
+    NORMAL_CARD_VALUES,
+    Card,
+    DOG,
+    MAH_JONG,
+    PHOENIX,
+    DRAGON,
+    from_mask,
+    to_mask,
+)
 from tichu.combination import Combination, CombinationType
+from tichu.events import EventListener, EventType, TichuEvent, log_event
+from tichu.game_record import GameRecordWriter, RoundHeader
 from tichu.human_player import HumanPlayer
 from tichu.llm_player import LLMPlayer
-from tichu.player import Player
+from tichu.player import AsyncPlayer, Player
 from tichu.player_state import PlayerState
 from tichu.random_player import RandomPlayer
 from tichu.tichu_state import CardPlay, TichuState
 
+# Bits of the seed a round's deck is shuffled with.
+DEAL_SEED_BITS = 64
+
 
 class TichuError(Exception):
     """Base class for Tichu-related exceptions."""
@@ -27,14 +45,53 @@ class InvalidPlayError(TichuError):
     """Raised when a player makes an invalid play."""
 
 
+@dataclass
+class TichuHooks:
+    """Optional callbacks invoked by play_round and play_match."""
+
+    on_turn_start: Callable[["Tichu"], None] | None = None
+    on_turn_end: Callable[["Tichu", int, CardPlay], None] | None = None
+    on_invalid_play: Callable[["Tichu", int, CardPlay, InvalidPlayError], None] | (
+        None
+    ) = None
+    on_round_end: Callable[["Tichu", list[int]], None] | None = None
+
+
+@dataclass(slots=True)
+class MoveRecord:
+    """The parts of the state a next_turn call can change, saved by apply_move."""
+
+    player_idx: int
+    current_player_idx: int
+    winning_player_idx: int
+    current_combination: Combination | None
+    current_wish: int | None
+    dragon_stack_recipient_id: int | None
+    has_passed: list[bool]
+    tichu_called: bool
+    hand: list[Card] | None
+    card_stack: list[Card] | None
+    card_stack_size: int
+    player_card_stack_sizes: list[int] | None
+    player_rankings_size: int
+    play_log_size: int
+    zobrist_key: int
+
+
 class Tichu:
     def __init__(
         self,
         goal_score: int = 1000,
         seed: int | None = None,
+        listeners: list[EventListener] | None = None,
+        recorder: GameRecordWriter | None = None,
     ):
         self.goal_score = goal_score
         self.random = random.Random(seed)
+        # Events are only built while listeners are attached, so games are
+        # headless by default; pass [log_event] to log them.
+        self.listeners = [] if listeners is None else listeners
+        self.recorder = recorder
 
     def new_game(self, players: list[Player]):
         self.state = TichuState()
@@ -50,20 +107,14 @@ class Tichu:
         self.state.current_round += 1
         for idx, player in enumerate(self.players):
             player.reset_for_new_round(self.state)
-        deck = []
-        for color in Color:
-            if color == Color.SPECIAL:
-                continue
-            for value in NORMAL_CARD_VALUES:
-                card = Card(color, value)
-                deck.append(card)
-        deck.extend([DOG, MAH_JONG, PHOENIX, DRAGON])
-
-        self.random.shuffle(deck)
-        for i, card in enumerate(deck):
+
+        # Every deal has a seed of its own, so a game record reproduces it
+        # however the engine's generator was used before.
+        deal_seed = self.random.getrandbits(DEAL_SEED_BITS)
+        for i, card in enumerate(self.shuffle_deck(deal_seed)):
             player_idx = i % NUM_PLAYERS
             player_state = self.state.get_player_state(player_idx)
-            player_state.hand.append(card)
+            player_state.add_cards([card])
             if (
                 len(player_state.hand) == GRAND_TICHU_HAND_SIZE
                 and self.players[player_idx].get_grand_tichu_play(self.state)
@@ -74,8 +125,39 @@ class Tichu:
         for player_state in self.state.player_states:
             player_state.hand.sort(key=lambda c: c.value)
 
-        self.push_cards()
+        pushes = self.push_cards()
+        if self.recorder is not None:
+            self.recorder.write_round(
+                deal_seed,
+                self.state.current_round,
+                [state.grand_tichu_called for state in self.state.player_states],
+                pushes,
+            )
+        self.start_play()
 
+    def start_recorded_round(self, header: RoundHeader):
+        """Start a round as recorded, without asking the players."""
+        deck = self.shuffle_deck(header.seed)
+        self.state.play_log.clear()
+        self.state.current_round = header.round_number
+        self.state.player_states = [PlayerState() for _ in range(NUM_PLAYERS)]
+        for player_idx, player_state in enumerate(self.state.player_states):
+            # Cards are dealt to the players in turn.
+            player_state.hand = sorted(
+                deck[player_idx::NUM_PLAYERS], key=lambda c: c.value
+            )
+            player_state.grand_tichu_called = header.grand_tichu_calls[player_idx]
+        self.exchange_pushes([list(pushed) for pushed in header.pushes])
+        self.start_play()
+
+    @staticmethod
+    def shuffle_deck(seed: int) -> list[Card]:
+        deck = list(DECK)
+        random.Random(seed).shuffle(deck)
+        return deck
+
+    def start_play(self):
+        """Let the holder of the Mah Jong lead the first trick of the round."""
         self.state.current_player_idx = next(
             i
             for i, player_state in enumerate(self.state.player_states)
@@ -84,8 +166,10 @@ class Tichu:
         self.state.winning_player_idx = self.state.current_player_idx
         self.state.current_combination = None
         self.state.current_wish = None
+        self.state.dragon_stack_recipient_id = None
         self.state.card_stack.clear()
         self.state.player_rankings.clear()
+        self.state.zobrist_key = zobrist.compute_key(self.state)
 
     @property
     def current_player(self) -> Player:
@@ -102,46 +186,85 @@ class Tichu:
             and self.state.player_rankings[0] % 2 == self.state.player_rankings[1] % 2
         )
 
-    def push_cards(self):
-        cards_for_players = [[], [], [], []]
+    def push_cards(self) -> list[list[Card]]:
+        """Exchange the players' pushes and return the cards each pushed.
+
+        Every player's cards are listed as pushed to the left player, the
+        partner and the right player.
+        """
+        pushes: list[list[Card]] = []
         for player_idx, player in enumerate(self.players):
             player_state = self.state.get_player_state(player_idx)
             card_indices = player.get_push_play(self.state)
-            cards_to_push = [
-                card
-                for card_idx, card in enumerate(player_state.hand)
-                if card_idx in card_indices
-            ]
-            for card in cards_to_push:
-                player_state.hand.remove(card)
+            # A set pushes the cards in hand order, a list in the given order.
+            if isinstance(card_indices, list):
+                pushes.append([player_state.hand[idx] for idx in card_indices])
+            else:
+                pushes.append(
+                    [
+                        card
+                        for card_idx, card in enumerate(player_state.hand)
+                        if card_idx in card_indices
+                    ]
+                )
+        self.exchange_pushes(pushes)
+        return pushes
+
+    def exchange_pushes(self, pushes: list[list[Card]]):
+        cards_for_players: list[list[Card]] = [[], [], [], []]
+        for player_idx, cards_to_push in enumerate(pushes):
+            player_state = self.state.get_player_state(player_idx)
+            player_state.remove_cards(cards_to_push)
             cards_for_players[(player_idx - 1) % NUM_PLAYERS].append(cards_to_push[0])
             cards_for_players[(player_idx + 2) % NUM_PLAYERS].append(cards_to_push[1])
             cards_for_players[(player_idx + 1) % NUM_PLAYERS].append(cards_to_push[2])
         for player_idx in range(NUM_PLAYERS):
             player_state = self.state.get_player_state(player_idx)
-            for card in cards_for_players[player_idx]:
-                player_state.hand.append(card)
+            player_state.add_cards(cards_for_players[player_idx])
             player_state.hand.sort(key=lambda c: c.value)
 
-    def add_play_log_entry(self, play: CardPlay):
-        self.state.play_log.append((self.state.current_player_idx, play))
+    def can_fulfill_wish(self, player_idx: int) -> bool:
+        """Whether the player holds a legal play containing the wished value."""
+        hand = self.state.get_player_state(player_idx).hand
+        return (
+            self.state.current_wish is not None
+            and Combination.can_fulfill_wish(
+                self.state.current_combination, self.state.current_wish, hand
+            )
+            and Combination.has_any_play(
+                self.state.current_combination, hand, self.state.current_wish
+            )
+        )
+
+    def emit(self, event: TichuEvent):
+        for listener in self.listeners:
+            listener(self, event)
+
+    def add_play_log_entry(self, player_idx: int, play: CardPlay):
+        self.state.play_log.append((player_idx, play))
 
     def next_turn(self, player_idx: int, card_play: CardPlay):
-        player = self.players[player_idx]
+        scalar_key = zobrist.get_scalar_key(self.state)
+        self._next_turn(player_idx, card_play)
+        self.state.zobrist_key ^= scalar_key ^ zobrist.get_scalar_key(self.state)
+        # Only moves that were fully applied are recorded.
+        if self.recorder is not None:
+            self.recorder.write_play(player_idx, card_play)
+
+    def _next_turn(self, player_idx: int, card_play: CardPlay):
+        """Apply a move; card and flag changes update the Zobrist key here."""
         player_state = self.state.get_player_state(player_idx)
-        current_hand = player_state.hand
         if card_play == "pass":
             if player_idx != self.state.current_player_idx:
                 raise InvalidPlayError("Only the current player can pass.")
-            if self.state.current_wish is not None and Combination.can_fulfill_wish(
-                self.state.current_combination,
-                self.state.current_wish,
-                current_hand,
-            ):
+            if self.can_fulfill_wish(player_idx):
                 msg = f"You can fulfill the wish for card value {self.state.current_wish} and cannot pass."
                 raise InvalidPlayError(msg)
-            logging.info(f"{player.name} has passed.")
-            self.add_play_log_entry(card_play)
+            if self.listeners:
+                self.emit(TichuEvent(EventType.PASSED, player_idx))
+            self.add_play_log_entry(player_idx, card_play)
+            if not player_state.has_passed:
+                self.state.zobrist_key ^= zobrist.PASSED_KEYS[player_idx]
             player_state.has_passed = True
             if all(
                 self.state.get_player_state(idx).has_passed
@@ -149,10 +272,11 @@ class Tichu:
                 if idx != self.state.winning_player_idx
                 and idx not in self.state.player_rankings
             ):
-                logging.info(
-                    "All other players have passed. Resetting current combination."
-                )
-                for ps in self.state.player_states:
+                if self.listeners:
+                    self.emit(TichuEvent(EventType.TRICK_ENDED))
+                for idx, ps in enumerate(self.state.player_states):
+                    if ps.has_passed:
+                        self.state.zobrist_key ^= zobrist.PASSED_KEYS[idx]
                     ps.has_passed = False
                 if (
                     self.state.current_combination
@@ -160,20 +284,28 @@ class Tichu:
                     == CombinationType.SINGLE
                     and self.state.current_combination.value == DRAGON.value
                 ):
-                    logging.info(
-                        f"{self.winning_player.name} wins the single card round and collects the card stack."
-                    )
+                    if self.listeners:
+                        self.emit(
+                            TichuEvent(
+                                EventType.DRAGON_TRICK_WON,
+                                self.state.winning_player_idx,
+                            )
+                        )
                     if self.state.dragon_stack_recipient_id is None:
                         msg = "Dragon stack recipient id is not set."
                         raise RuntimeError(msg)
 
-                    self.state.get_player_state(
-                        self.state.dragon_stack_recipient_id
-                    ).card_stack.extend(self.state.card_stack)
+                    recipient_idx = self.state.dragon_stack_recipient_id
                 else:
-                    self.state.get_player_state(
-                        self.winning_player.player_idx
-                    ).card_stack.extend(self.state.card_stack)
+                    recipient_idx = self.state.winning_player_idx
+                self.state.get_player_state(recipient_idx).card_stack.extend(
+                    self.state.card_stack
+                )
+                self.state.zobrist_key ^= zobrist.get_cards_key(
+                    zobrist.TABLE_KEYS, self.state.card_stack
+                ) ^ zobrist.get_cards_key(
+                    zobrist.STACK_KEYS[recipient_idx], self.state.card_stack
+                )
                 self.state.current_combination = None
                 self.state.card_stack.clear()
         elif card_play == "tichu":
@@ -185,17 +317,22 @@ class Tichu:
                     "Tichu can only be called at the start of a turn with a full hand."
                 )
                 raise InvalidPlayError(msg)
-            logging.info(f"{player.name} has called Tichu!")
+            if self.listeners:
+                self.emit(TichuEvent(EventType.TICHU_CALLED, player_idx))
+            if not player_state.tichu_called:
+                self.state.zobrist_key ^= zobrist.TICHU_KEYS[player_idx]
             player_state.tichu_called = True
-            self.add_play_log_entry(card_play)
+            self.add_play_log_entry(player_idx, card_play)
             return
         else:
             cards, play_argument = card_play
-            if not all([card in current_hand for card in cards]):
+            cards_mask = to_mask(cards)
+            played_cards = from_mask(cards) if isinstance(cards, int) else cards
+            if cards_mask & ~player_state.hand_mask:
                 msg = "Play contains cards that are not in the current players hand."
                 raise InvalidPlayError(msg)
 
-            next_combination = Combination.from_cards(list(cards))
+            next_combination = Combination.from_cards(cards_mask)
             if next_combination is None:
                 msg = "Cards are not a valid combination."
                 raise InvalidPlayError(msg)
@@ -215,39 +352,62 @@ class Tichu:
                 raise InvalidPlayError(
                     "Only the current player can play this combination."
                 )
+            wish_fulfilled = self.state.current_wish is not None and any(
+                card.value == self.state.current_wish for card in played_cards
+            )
+            if (
+                self.state.current_wish is not None
+                and not wish_fulfilled
+                and self.state.current_wish
+                in [card.value for card in player_state.hand]
+                and self.can_fulfill_wish(player_idx)
+            ):
+                msg = f"The played combination does not fulfill the wish for card value {self.state.current_wish}."
+                raise InvalidPlayError(msg)
+            # The play argument is checked before anything changes, so an
+            # invalid play leaves the state as it was.
+            if next_combination.combination_type == CombinationType.SINGLE:
+                self._check_play_argument(
+                    player_idx, next_combination.value, play_argument
+                )
+
             self.state.current_player_idx = player_idx
-            if self.state.current_wish is not None:
-                if self.state.current_wish in [card.value for card in cards]:
-                    logging.info(
-                        f"{player.name} has fulfilled the wish for card value {self.state.current_wish}."
+            if wish_fulfilled:
+                if self.listeners:
+                    self.emit(
+                        TichuEvent(
+                            EventType.WISH_FULFILLED,
+                            player_idx,
+                            value=self.state.current_wish,
+                        )
                     )
-                    self.state.current_wish = None
-                elif self.state.current_wish in [
-                    card.value for card in self.state.get_player_state(player_idx).hand
-                ]:
-                    if Combination.can_fulfill_wish(
-                        self.state.current_combination,
-                        self.state.current_wish,
-                        self.state.get_player_state(player_idx).hand,
-                    ):
-                        msg = f"The played combination does not fulfill the wish for card value {self.state.current_wish}."
-                        raise InvalidPlayError(msg)
+                self.state.current_wish = None
 
             for reset_player_idx in range(NUM_PLAYERS):
-                self.state.get_player_state(reset_player_idx).has_passed = False
+                reset_player_state = self.state.get_player_state(reset_player_idx)
+                if reset_player_state.has_passed:
+                    self.state.zobrist_key ^= zobrist.PASSED_KEYS[reset_player_idx]
+                reset_player_state.has_passed = False
             self.state.current_combination = next_combination
             self.state.winning_player_idx = player_idx
-            for card in cards:
-                player_state.hand.remove(card)
+            player_state.remove_cards(cards_mask)
+            self.state.zobrist_key ^= zobrist.get_cards_key(
+                zobrist.PLAY_KEYS[player_idx], played_cards
+            )
             if len(player_state.hand) == 0:
-                logging.info(
-                    f"{player.name} has played all their cards and finished the round!"
-                )
+                if self.listeners:
+                    self.emit(TichuEvent(EventType.PLAYER_FINISHED, player_idx))
+                self.state.zobrist_key ^= zobrist.RANKING_KEYS[
+                    len(self.state.player_rankings)
+                ][player_idx]
                 self.state.player_rankings.append(player_idx)
-            self.state.card_stack.extend(list(cards))
+            self.state.card_stack.extend(played_cards)
 
-            self.add_play_log_entry(card_play)
-            logging.info(", ".join([str(card) for card in cards]))
+            self.add_play_log_entry(player_idx, card_play)
+            if self.listeners:
+                self.emit(
+                    TichuEvent(EventType.CARDS_PLAYED, player_idx, cards=cards_mask)
+                )
 
             if (
                 self.state.current_combination.combination_type
@@ -255,9 +415,8 @@ class Tichu:
             ):
                 match self.state.current_combination.value:
                     case DOG.value:
-                        logging.info(
-                            f"{player.name} played the Dog and passes the turn to their teammate."
-                        )
+                        if self.listeners:
+                            self.emit(TichuEvent(EventType.DOG_PLAYED, player_idx))
                         self.state.current_player_idx = (player_idx + 2) % NUM_PLAYERS
                         return
                     case PHOENIX.value:
@@ -267,33 +426,17 @@ class Tichu:
                             else NORMAL_CARD_VALUES[0]
                         )
                     case DRAGON.value:
-                        if play_argument is None:
-                            msg = "Dragon stack recipient id must be provided when playing the Dragon."
-                            raise InvalidPlayError(msg)
                         self.state.dragon_stack_recipient_id = play_argument
-                        if (
-                            self.state.dragon_stack_recipient_id < 0
-                            or self.state.dragon_stack_recipient_id >= NUM_PLAYERS
-                        ):
-                            msg = f"Dragon stack recipient id must be between 0 and {NUM_PLAYERS - 1}."
-                            raise InvalidPlayError(msg)
-                        elif (
-                            self.state.dragon_stack_recipient_id % 2
-                            == self.state.winning_player_idx % 2
-                        ):
-                            msg = "Dragon stack recipient cannot be on the same team as the player who played the Dragon."
-                            raise InvalidPlayError(msg)
                     case MAH_JONG.value:
-                        if (
-                            play_argument is None
-                            or play_argument not in NORMAL_CARD_VALUES
-                        ):
-                            msg = "A valid card value must be provided when playing the Mah Jong."
-                            raise InvalidPlayError(msg)
                         self.state.current_wish = play_argument
-                        logging.info(
-                            f"{player.name} wishes for card value {self.state.current_wish}."
-                        )
+                        if self.listeners:
+                            self.emit(
+                                TichuEvent(
+                                    EventType.WISH_MADE,
+                                    player_idx,
+                                    value=self.state.current_wish,
+                                )
+                            )
 
         next_player_idx = self.state.current_player_idx
         while (
@@ -303,7 +446,202 @@ class Tichu:
             next_player_idx = (next_player_idx + 1) % NUM_PLAYERS
         self.state.current_player_idx = next_player_idx
 
-    def end_round_scoring(self):
+    def _check_play_argument(
+        self, player_idx: int, value: int | float, play_argument: int | None
+    ):
+        """Raise if the argument of a single Dragon or Mah Jong is invalid."""
+        if value == DRAGON.value:
+            if play_argument is None:
+                msg = "Dragon stack recipient id must be provided when playing the Dragon."
+                raise InvalidPlayError(msg)
+            if play_argument < 0 or play_argument >= NUM_PLAYERS:
+                msg = f"Dragon stack recipient id must be between 0 and {NUM_PLAYERS - 1}."
+                raise InvalidPlayError(msg)
+            if play_argument % 2 == player_idx % 2:
+                msg = "Dragon stack recipient cannot be on the same team as the player who played the Dragon."
+                raise InvalidPlayError(msg)
+        elif value == MAH_JONG.value:
+            if play_argument is None or play_argument not in NORMAL_CARD_VALUES:
+                msg = "A valid card value must be provided when playing the Mah Jong."
+                raise InvalidPlayError(msg)
+
+    @property
+    def match_over(self) -> bool:
+        return (
+            max(self.state.scores) >= self.goal_score
+            and self.state.scores[0] != self.state.scores[1]
+        )
+
+    def play_round(
+        self, hooks: TichuHooks | None = None, max_invalid_plays: int | None = 3
+    ) -> list[int]:
+        """Play a full round and return the points each team scored in it.
+
+        A player may retry an invalid play up to max_invalid_plays times in a
+        row before the error is raised; None allows unlimited retries.
+        """
+        hooks = hooks or TichuHooks()
+        self.start_new_round()
+        invalid_plays = 0
+        while not self.end_of_round:
+            if hooks.on_turn_start is not None:
+                hooks.on_turn_start(self)
+            player_idx = self.state.current_player_idx
+            card_play = self.players[player_idx].get_card_play(self.state)
+            invalid_plays = self._play_turn(
+                hooks, player_idx, card_play, invalid_plays, max_invalid_plays
+            )
+        return self._end_round(hooks)
+
+    async def play_round_async(
+        self, hooks: TichuHooks | None = None, max_invalid_plays: int | None = 3
+    ) -> list[int]:
+        """Like play_round, but awaits the card plays of async players.
+
+        Other games can run on the event loop while a player is thinking.
+        """
+        hooks = hooks or TichuHooks()
+        self.start_new_round()
+        invalid_plays = 0
+        while not self.end_of_round:
+            if hooks.on_turn_start is not None:
+                hooks.on_turn_start(self)
+            player_idx = self.state.current_player_idx
+            player = self.players[player_idx]
+            if isinstance(player, AsyncPlayer):
+                card_play = await player.get_card_play_async(self.state)
+            else:
+                card_play = player.get_card_play(self.state)
+            invalid_plays = self._play_turn(
+                hooks, player_idx, card_play, invalid_plays, max_invalid_plays
+            )
+        return self._end_round(hooks)
+
+    def _play_turn(
+        self,
+        hooks: TichuHooks,
+        player_idx: int,
+        card_play: CardPlay,
+        invalid_plays: int,
+        max_invalid_plays: int | None,
+    ) -> int:
+        """Apply a card play of a round being played and return the invalid plays in a row."""
+        try:
+            self.next_turn(player_idx, card_play)
+        except InvalidPlayError as e:
+            invalid_plays += 1
+            if hooks.on_invalid_play is not None:
+                hooks.on_invalid_play(self, player_idx, card_play, e)
+            if max_invalid_plays is not None and invalid_plays > max_invalid_plays:
+                raise
+            return invalid_plays
+        if hooks.on_turn_end is not None:
+            hooks.on_turn_end(self, player_idx, card_play)
+        return 0
+
+    def _end_round(self, hooks: TichuHooks) -> list[int]:
+        round_scores = self.end_round_scoring()
+        if hooks.on_round_end is not None:
+            hooks.on_round_end(self, round_scores)
+        return round_scores
+
+    def play_match(
+        self,
+        hooks: TichuHooks | None = None,
+        max_rounds: int | None = None,
+        max_invalid_plays: int | None = 3,
+    ) -> list[int]:
+        """Play rounds until a team reaches the goal score and return the scores.
+
+        A tie at or above the goal score is played out. If max_rounds is set,
+        the match stops after that many rounds even if it is not over.
+        """
+        while not self._match_finished(max_rounds):
+            self.play_round(hooks, max_invalid_plays)
+        return self.state.scores
+
+    async def play_match_async(
+        self,
+        hooks: TichuHooks | None = None,
+        max_rounds: int | None = None,
+        max_invalid_plays: int | None = 3,
+    ) -> list[int]:
+        """Like play_match, playing the rounds with play_round_async."""
+        while not self._match_finished(max_rounds):
+            await self.play_round_async(hooks, max_invalid_plays)
+        return self.state.scores
+
+    def _match_finished(self, max_rounds: int | None) -> bool:
+        return self.match_over or (
+            max_rounds is not None and self.state.current_round >= max_rounds
+        )
+
+    def apply_move(self, player_idx: int, card_play: CardPlay) -> MoveRecord:
+        """Play a turn like next_turn and return a record to undo it.
+
+        Only what the move can touch is saved: the acting player's hand for
+        plays, and the card stacks for passes, which can end a trick. An
+        invalid move leaves the state unchanged.
+        """
+        state = self.state
+        player_states = state.player_states
+        is_pass = card_play == "pass"
+        record = MoveRecord(
+            player_idx,
+            state.current_player_idx,
+            state.winning_player_idx,
+            state.current_combination,
+            state.current_wish,
+            state.dragon_stack_recipient_id,
+            [player_state.has_passed for player_state in player_states],
+            player_states[player_idx].tichu_called,
+            None if is_pass else list(player_states[player_idx].hand),
+            list(state.card_stack) if is_pass else None,
+            len(state.card_stack),
+            (
+                [len(player_state.card_stack) for player_state in player_states]
+                if is_pass
+                else None
+            ),
+            len(state.player_rankings),
+            len(state.play_log),
+            state.zobrist_key,
+        )
+        try:
+            self.next_turn(player_idx, card_play)
+        except Exception:
+            self.undo_move(record)
+            raise
+        return record
+
+    def undo_move(self, record: MoveRecord):
+        """Revert the state to before the move that returned the record."""
+        state = self.state
+        state.current_player_idx = record.current_player_idx
+        state.winning_player_idx = record.winning_player_idx
+        state.current_combination = record.current_combination
+        state.current_wish = record.current_wish
+        state.dragon_stack_recipient_id = record.dragon_stack_recipient_id
+        for player_state, has_passed in zip(state.player_states, record.has_passed):
+            player_state.has_passed = has_passed
+        player_state = state.player_states[record.player_idx]
+        player_state.tichu_called = record.tichu_called
+        if record.hand is not None:
+            player_state.hand = list(record.hand)
+        if record.card_stack is not None:
+            state.card_stack[:] = record.card_stack
+        else:
+            del state.card_stack[record.card_stack_size :]
+        if record.player_card_stack_sizes is not None:
+            for player_state, size in zip(
+                state.player_states, record.player_card_stack_sizes
+            ):
+                del player_state.card_stack[size:]
+        del state.player_rankings[record.player_rankings_size :]
+        del state.play_log[record.play_log_size :]
+        state.zobrist_key = record.zobrist_key
+
+    def end_round_scoring(self) -> list[int]:
         team_scores = [0, 0]
         for i, player_state in enumerate(self.state.player_states):
             if player_state.tichu_called or player_state.grand_tichu_called:
@@ -339,9 +677,16 @@ class Tichu:
                 team_scores[team_id] += Card.count_card_scores(player_state.card_stack)
         for i in range(len(team_scores)):
             self.state.scores[i] += team_scores[i]
-            logging.info(
-                f"Team {i} scored {team_scores[i]} points this round. Total score: {self.state.scores[i]}"
-            )
+            if self.listeners:
+                self.emit(
+                    TichuEvent(
+                        EventType.TEAM_SCORED,
+                        team_idx=i,
+                        value=team_scores[i],
+                        total=self.state.scores[i],
+                    )
+                )
+        return team_scores
 
 
 if __name__ == "__main__":
@@ -350,16 +695,14 @@ if __name__ == "__main__":
     ]
     players.append(HumanPlayer("HUMAN"))
     # players.append(LLMPlayer("LLM"))
-    game = Tichu()
+    game = Tichu(listeners=[log_event])
     game.new_game(players)
-    game.start_new_round()
-    while not game.end_of_round:
-        print(game.state)
-        print(game.current_player)
-        print()
-        play = game.current_player.get_card_play(game.state)
-        try:
-            game.next_turn(game.state.current_player_idx, play)
-        except InvalidPlayError as e:
-            logging.info(f"Invalid play: {e}")
-            continue
+    game.play_round(
+        TichuHooks(
+            on_turn_start=lambda game: print(f"{game.state}\n{game.current_player}\n"),
+            on_invalid_play=lambda game, player_idx, card_play, e: logging.info(
+                f"Invalid play: {e}"
+            ),
+        ),
+        max_invalid_plays=None,
+    )
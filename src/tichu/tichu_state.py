@@ -1,11 +1,11 @@
 from dataclasses import dataclass, field
 from tichu import card
 from typing_extensions import Literal
-from tichu.card import Card
+from tichu.card import Card, CardMask
 from tichu.combination import Combination
 from tichu.player_state import PlayerState
 
-type CardPlay = tuple[set[Card], int | None] | Literal["pass", "tichu"]
+type CardPlay = tuple[set[Card] | CardMask, int | None] | Literal["pass", "tichu"]
 
 
 @dataclass
@@ -21,6 +21,8 @@ class TichuState:
     player_rankings: list[int] = field(default_factory=list)
     play_log: list[tuple[int, CardPlay]] = field(default_factory=list)
     player_states: list[PlayerState] = field(default_factory=list)
+    # Zobrist key of the position, maintained by the engine.
+    zobrist_key: int = 0
 
     def get_player_state(self, player_idx: int | None) -> PlayerState:
         """Retrieve a player's state by index."""
@@ -28,6 +30,27 @@ class TichuState:
             raise ValueError("Player index cannot be None.")
         return self.player_states[player_idx]
 
+    def copy(self) -> "TichuState":
+        """Copy the state for branching, far cheaper than copy.deepcopy.
+
+        Cards are interned and combinations are not modified once on the
+        table, so they are shared with the copy.
+        """
+        return TichuState(
+            list(self.scores),
+            self.current_round,
+            self.current_player_idx,
+            self.winning_player_idx,
+            self.current_combination,
+            self.current_wish,
+            self.dragon_stack_recipient_id,
+            list(self.card_stack),
+            list(self.player_rankings),
+            list(self.play_log),
+            [player_state.copy() for player_state in self.player_states],
+            self.zobrist_key,
+        )
+
     def __str__(self):
         card_stack = ", ".join(str(card) for card in self.card_stack)
         return f"""Current Game State:
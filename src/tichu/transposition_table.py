@@ -0,0 +1,54 @@
+class TranspositionTable:
+    """Bounded table of search values keyed by Zobrist key.
+
+    Every key maps to a single slot. A slot is overwritten by a result of at
+    least the same depth, or by any result once its entry is from an older
+    search, so deep results survive within a search and stale ones are
+    recycled. The table can be shared by several search players.
+    """
+
+    def __init__(self, size_bits: int = 16):
+        self.size = 1 << size_bits
+        self._index_mask = self.size - 1
+        self._keys: list[int | None] = [None] * self.size
+        self._depths = [0] * self.size
+        self._values = [0.0] * self.size
+        self._generations = [0] * self.size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(key is not None for key in self._keys)
+
+    def new_search(self):
+        """Mark the entries stored so far as replaceable."""
+        self.generation += 1
+
+    def clear(self):
+        self._keys = [None] * self.size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: int, depth: int) -> float | None:
+        """The stored value of a position searched at least depth deep."""
+        idx = key & self._index_mask
+        if self._keys[idx] == key and self._depths[idx] >= depth:
+            self.hits += 1
+            return self._values[idx]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, depth: int, value: float):
+        idx = key & self._index_mask
+        stored_key = self._keys[idx]
+        if (
+            stored_key is not None
+            and self._depths[idx] > depth
+            and (stored_key == key or self._generations[idx] == self.generation)
+        ):
+            return
+        self._keys[idx] = key
+        self._depths[idx] = depth
+        self._values[idx] = value
+        self._generations[idx] = self.generation
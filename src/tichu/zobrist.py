@@ -0,0 +1,104 @@
+import random
+from collections.abc import Iterable
+
+from tichu import NUM_PLAYERS
+from tichu.card import NUM_CARDS, Card
+from tichu.combination import Combination
+from tichu.tichu_state import TichuState
+
+ZOBRIST_SEED = 0x7E1C4
+KEY_BITS = 64
+KEY_MASK = (1 << KEY_BITS) - 1
+
+_random = random.Random(ZOBRIST_SEED)
+
+
+def _random_keys(size: int) -> tuple[int, ...]:
+    return tuple(_random.getrandbits(KEY_BITS) for _ in range(size))
+
+
+HAND_KEYS = tuple(_random_keys(NUM_CARDS) for _ in range(NUM_PLAYERS))
+STACK_KEYS = tuple(_random_keys(NUM_CARDS) for _ in range(NUM_PLAYERS))
+TABLE_KEYS = _random_keys(NUM_CARDS)
+# Playing a card moves it from the hand to the table.
+PLAY_KEYS = tuple(
+    tuple(hand_key ^ table_key for hand_key, table_key in zip(hand_keys, TABLE_KEYS))
+    for hand_keys in HAND_KEYS
+)
+PASSED_KEYS = _random_keys(NUM_PLAYERS)
+TICHU_KEYS = _random_keys(NUM_PLAYERS)
+GRAND_TICHU_KEYS = _random_keys(NUM_PLAYERS)
+RANKING_KEYS = tuple(_random_keys(NUM_PLAYERS) for _ in range(NUM_PLAYERS))
+CURRENT_PLAYER_KEYS = _random_keys(NUM_PLAYERS)
+WINNING_PLAYER_KEYS = _random_keys(NUM_PLAYERS)
+# Indexed by the wished value, 0 for no wish.
+WISH_KEYS = _random_keys(15)
+# Indexed by the recipient, NUM_PLAYERS for none.
+DRAGON_RECIPIENT_KEYS = _random_keys(NUM_PLAYERS + 1)
+# Mixed into keys of values seen from one team's point of view.
+TEAM_KEYS = _random_keys(NUM_PLAYERS // 2)
+
+
+def _mix(value: int) -> int:
+    """The splitmix64 finalizer, spreading a small integer over 64 bits."""
+    value = (value + 0x9E3779B97F4A7C15) & KEY_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & KEY_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & KEY_MASK
+    return value ^ (value >> 31)
+
+
+def get_combination_key(combination: Combination | None) -> int:
+    if combination is None:
+        return 0
+    return _mix(
+        combination.combination_type.value << 16
+        | int(combination.value * 2) << 4
+        | combination.length
+    )
+
+
+def get_scalar_key(state: TichuState) -> int:
+    """Key of the state's single-valued fields, cheap to recompute after a move."""
+    return (
+        CURRENT_PLAYER_KEYS[state.current_player_idx]
+        ^ WINNING_PLAYER_KEYS[state.winning_player_idx]
+        ^ WISH_KEYS[state.current_wish or 0]
+        ^ DRAGON_RECIPIENT_KEYS[
+            (
+                NUM_PLAYERS
+                if state.dragon_stack_recipient_id is None
+                else state.dragon_stack_recipient_id
+            )
+        ]
+        ^ get_combination_key(state.current_combination)
+    )
+
+
+def get_cards_key(keys: tuple[int, ...], cards: Iterable[Card]) -> int:
+    key = 0
+    for card in cards:
+        key ^= keys[card.index]
+    return key
+
+
+def compute_key(state: TichuState) -> int:
+    """Zobrist key of a state, computed from scratch.
+
+    Covers hands, card stacks, the cards on the table, the current
+    combination, wish and dragon recipient, passed and Tichu flags,
+    rankings, and the current and winning players. Scores, the round and
+    the play log are not part of the position.
+    """
+    key = get_scalar_key(state) ^ get_cards_key(TABLE_KEYS, state.card_stack)
+    for player_idx, player_state in enumerate(state.player_states):
+        key ^= get_cards_key(HAND_KEYS[player_idx], player_state.hand)
+        key ^= get_cards_key(STACK_KEYS[player_idx], player_state.card_stack)
+        if player_state.has_passed:
+            key ^= PASSED_KEYS[player_idx]
+        if player_state.tichu_called:
+            key ^= TICHU_KEYS[player_idx]
+        if player_state.grand_tichu_called:
+            key ^= GRAND_TICHU_KEYS[player_idx]
+    for position, player_idx in enumerate(state.player_rankings):
+        key ^= RANKING_KEYS[position][player_idx]
+    return key
@@ -0,0 +1,37 @@
+import io
+import random
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.game_record import GameRecordWriter
+from tichu.random_player import RandomPlayer
+from tichu.tichu import Tichu, TichuHooks
+
+
+def _record_match(seed: int, max_rounds: int):
+    """Play a match, recording it and the state after every turn of each round."""
+    random.seed(seed)
+    stream = io.BytesIO()
+    game = Tichu(seed=seed, listeners=[], recorder=GameRecordWriter(stream))
+    game.new_game([RandomPlayer(f"Player {idx}") for idx in range(NUM_PLAYERS)])
+    rounds = []
+
+    def on_turn_start(game: Tichu):
+        if not game.state.play_log:
+            rounds.append([game.state.copy()])
+
+    game.play_match(
+        TichuHooks(
+            on_turn_start=on_turn_start,
+            on_turn_end=lambda game, *_: rounds[-1].append(game.state.copy()),
+        ),
+        max_rounds=max_rounds,
+    )
+    stream.seek(0)
+    return stream, rounds, game.state.scores
+
+
+@pytest.fixture
+def record_match():
+    return _record_match
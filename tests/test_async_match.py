@@ -0,0 +1,63 @@
+import asyncio
+import random
+
+from tichu import NUM_PLAYERS
+from tichu.async_match import play_matches
+from tichu.player import AsyncPlayer
+from tichu.random_player import RandomPlayer
+from tichu.tichu import Tichu
+from tichu.tichu_state import CardPlay, TichuState
+
+
+class SlowRandomPlayer(AsyncPlayer, RandomPlayer):
+    """Plays randomly after a network-like delay, counting overlapping calls."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_card_play_async(self, game_state: TichuState) -> CardPlay:
+        SlowRandomPlayer.in_flight += 1
+        SlowRandomPlayer.max_in_flight = max(
+            SlowRandomPlayer.max_in_flight, SlowRandomPlayer.in_flight
+        )
+        await asyncio.sleep(0)
+        SlowRandomPlayer.in_flight -= 1
+        return RandomPlayer.get_card_play(self, game_state)
+
+
+def _new_game(seed: int) -> Tichu:
+    game = Tichu(seed=seed, listeners=[])
+    game.new_game([SlowRandomPlayer(f"Player {idx}") for idx in range(NUM_PLAYERS)])
+    return game
+
+
+def test_play_matches_runs_games_concurrently():
+    random.seed(0)
+    SlowRandomPlayer.max_in_flight = 0
+    games = [_new_game(seed) for seed in range(4)]
+
+    scores = asyncio.run(play_matches(games, max_rounds=2))
+
+    assert scores == [game.state.scores for game in games]
+    assert all(game.state.current_round == 2 for game in games)
+    assert SlowRandomPlayer.max_in_flight == len(games)
+
+
+def test_play_matches_limits_concurrency():
+    random.seed(0)
+    SlowRandomPlayer.max_in_flight = 0
+    games = [_new_game(seed) for seed in range(4)]
+
+    asyncio.run(play_matches(games, max_rounds=1, max_concurrency=2))
+
+    assert SlowRandomPlayer.max_in_flight == 2
+
+
+def test_sync_get_card_play_runs_the_coroutine():
+    game = _new_game(0)
+    game.start_new_round()
+    player_idx = game.state.current_player_idx
+
+    card_play = game.players[player_idx].get_card_play(game.state)
+
+    game.next_turn(player_idx, card_play)
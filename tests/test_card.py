@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2025-present Nic Dorner <nic.dorner@me.com>
+#
+# SPDX-License-Identifier: MIT
+import copy
+import pickle
+
+import pytest
+
+from tichu.card import (
+    CARDS_BY_INDEX,
+    DECK,
+    DOG,
+    DRAGON,
+    FULL_MASK,
+    MAH_JONG,
+    NUM_CARDS,
+    PHOENIX,
+    Card,
+    Color,
+    count_mask_scores,
+    from_mask,
+    to_mask,
+)
+
+
+def test_card_indices_are_unique_and_dense():
+    assert len(DECK) == NUM_CARDS
+    assert sorted(card.index for card in DECK) == list(range(NUM_CARDS))
+    assert to_mask(DECK) == FULL_MASK
+
+
+def test_card_indices_are_ordered_by_value():
+    values = [card.value for card in CARDS_BY_INDEX]
+    assert values == sorted(values)
+
+
+@pytest.mark.parametrize(
+    "cards",
+    [
+        [],
+        [DOG],
+        [MAH_JONG, Card(Color.JADE, 2), Card(Color.STAR, 14)],
+        [Card(Color.PAGODE, 7), PHOENIX, DRAGON, Card(Color.SWORDS, 7)],
+    ],
+)
+def test_mask_round_trip(cards):
+    mask = to_mask(cards)
+    assert mask.bit_count() == len(cards)
+    assert from_mask(mask) == sorted(cards, key=lambda c: c.index)
+
+
+def test_mask_set_algebra():
+    hand = to_mask([Card(Color.JADE, 5), Card(Color.SWORDS, 5), DRAGON])
+    play = to_mask([Card(Color.JADE, 5), Card(Color.SWORDS, 5)])
+    assert play & ~hand == 0
+    assert from_mask(hand & ~play) == [DRAGON]
+    assert to_mask([Card(Color.STAR, 5)]) & ~hand != 0
+
+
+def test_count_mask_scores():
+    assert count_mask_scores(FULL_MASK) == Card.count_card_scores(DECK) == 100
+    assert count_mask_scores(to_mask([PHOENIX, Card(Color.JADE, 13)])) == -15
+
+
+def test_cards_are_interned():
+    card = Card(Color.JADE, 7)
+    assert card is Card(Color.JADE, 7)
+    assert card is Card.from_index(card.index)
+    assert Card(Color.SPECIAL, 50) is PHOENIX
+    assert card is not Card(Color.SWORDS, 7)
+
+
+def test_cards_survive_copy_and_pickle():
+    card = Card(Color.STAR, 13)
+    assert copy.copy(card) is card
+    assert copy.deepcopy([card])[0] is card
+    assert pickle.loads(pickle.dumps(card)) is card
+
+
+def test_cards_are_slotted():
+    with pytest.raises(AttributeError):
+        Card(Color.JADE, 2).owner = 1
+
+
+@pytest.mark.parametrize(
+    ("color", "value"),
+    [(Color.JADE, 1), (Color.STAR, 15), (Color.SPECIAL, 2)],
+)
+def test_invalid_cards_raise_error(color, value):
+    with pytest.raises(ValueError):
+        Card(color, value)
+
+
+@pytest.mark.parametrize(
+    ("card", "expected_name", "expected_score"),
+    [
+        (Card(Color.PAGODE, 5), "PAGODE 5", 5),
+        (Card(Color.JADE, 13), "JADE King", 10),
+        (Card(Color.SWORDS, 14), "SWORDS Ace", 0),
+        (PHOENIX, "Phoenix", -25),
+        (DRAGON, "Dragon", 25),
+    ],
+)
+def test_card_name_and_score(card, expected_name, expected_score):
+    assert str(card) == expected_name
+    assert card.get_score() == expected_score
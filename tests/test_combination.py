@@ -1,7 +1,9 @@
+import random
+
 import pytest
 
-from tichu.card import Card, Color, DOG, MAH_JONG, PHOENIX, DRAGON
-from tichu.combination import Combination, CombinationType
+from tichu.card import DECK, Card, Color, DOG, MAH_JONG, PHOENIX, DRAGON, to_mask
+from tichu.combination import Combination, CombinationType, get_combination_key
 
 
 @pytest.mark.parametrize(
@@ -249,6 +251,40 @@ def test_valid_combinations(cards, expected_type, expected_value, expected_lengt
     assert combination.combination_type == expected_type
     assert combination.value == expected_value
     assert combination.length == expected_length
+    if len(set(cards)) == len(cards):
+        assert Combination.from_cards(to_mask(cards)) == combination
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_from_cards_matches_classification(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        low = rng.randint(0, 10)
+        pool = [
+            card
+            for card in DECK
+            if low <= card.value <= low + 5 or card.value in (0, 1, 50, 100)
+        ]
+        cards = rng.sample(pool, rng.randint(1, 8))
+        expected = Combination._from_sorted_cards(sorted(cards, key=lambda c: c.value))
+        for combination in (
+            Combination.from_cards(list(cards)),
+            Combination.from_cards(to_mask(cards)),
+        ):
+            if expected is None:
+                assert combination is None
+            else:
+                assert combination == expected
+
+
+def test_combination_key_ignores_card_order_and_suits():
+    straight = [Card(Color.JADE, 5), Card(Color.STAR, 6), Card(Color.JADE, 7)]
+    reordered = [Card(Color.SWORDS, 7), Card(Color.PAGODE, 5), Card(Color.JADE, 6)]
+    flush = [Card(Color.JADE, 5), Card(Color.JADE, 6), Card(Color.JADE, 7)]
+    assert get_combination_key(straight) == get_combination_key(reordered)
+    assert get_combination_key(straight) == get_combination_key(to_mask(straight))
+    assert get_combination_key(flush) != get_combination_key(straight)
+    assert get_combination_key(flush) == get_combination_key(to_mask(flush))
 
 
 @pytest.mark.parametrize(
@@ -347,6 +383,8 @@ def test_valid_combinations(cards, expected_type, expected_value, expected_lengt
 def test_invalid_combinations(cards):
     combination = Combination.from_cards(cards)
     assert combination is None
+    if len(set(cards)) == len(cards):
+        assert Combination.from_cards(to_mask(cards)) is None
 
 
 @pytest.mark.parametrize(
@@ -1537,3 +1575,179 @@ def test_possible_plays(
     possible_plays = Combination.possible_plays(combination, cards)
     assert len(expected) == len(possible_plays)
     assert all(expected_play in possible_plays for expected_play in expected)
+    assert sorted(
+        map(to_mask, Combination.possible_plays(combination, to_mask(cards)))
+    ) == sorted(map(to_mask, possible_plays))
+    assert Combination.count_plays(combination, cards) == len(possible_plays)
+    assert Combination.has_any_play(combination, cards) is bool(possible_plays)
+
+
+STRAIGHT_HAND = [
+    Card(Color.JADE, 3),
+    Card(Color.SWORDS, 4),
+    Card(Color.STAR, 5),
+    Card(Color.STAR, 6),
+    Card(Color.PAGODE, 7),
+    Card(Color.JADE, 7),
+    Card(Color.JADE, 8),
+    Card(Color.SWORDS, 9),
+    Card(Color.SWORDS, 10),
+    PHOENIX,
+]
+
+
+def test_iter_plays_yields_lazily_in_type_order():
+    plays = Combination.iter_plays(None, STRAIGHT_HAND)
+    first_play = next(plays)
+    assert len(first_play) == 1
+    combination_types = [
+        Combination.from_cards(list(play)).combination_type
+        for play in Combination.iter_plays(None, STRAIGHT_HAND)
+    ]
+    order = [
+        CombinationType.SINGLE,
+        CombinationType.PAIR,
+        CombinationType.TRIPLE,
+        CombinationType.STRAIGHT,
+        CombinationType.FULL_HOUSE,
+        CombinationType.STAIR,
+    ]
+    assert combination_types == sorted(combination_types, key=order.index)
+
+
+def test_any_bomb_can_be_played_on_a_non_bomb():
+    bomb = {Card(color, 3) for color in Color if color != Color.SPECIAL}
+    ace = Combination(CombinationType.SINGLE, 14)
+
+    assert Combination.from_cards(list(bomb)).can_be_played_on(ace)
+    plays = Combination.possible_plays(ace, list(bomb) + [Card(Color.JADE, 4)])
+    assert plays == [bomb]
+    higher_bomb = Combination(CombinationType.BOMB, 5)
+    assert Combination.possible_plays(higher_bomb, list(bomb)) == []
+
+
+@pytest.mark.parametrize(
+    ("combination", "wish_value"),
+    [
+        (None, 7),
+        (None, 9),
+        (Combination(CombinationType.SINGLE, 4), 7),
+        (Combination(CombinationType.PAIR, 3), 7),
+        (Combination(CombinationType.STRAIGHT, 7, 5), 8),
+        (Combination(CombinationType.STAIR, 3, 2), 7),
+    ],
+)
+def test_iter_plays_only_builds_wished_plays(combination, wish_value):
+    all_plays = Combination.possible_plays(combination, STRAIGHT_HAND)
+    wished_plays = list(Combination.iter_plays(combination, STRAIGHT_HAND, wish_value))
+    assert wished_plays
+    assert all(wish_value in {card.value for card in play} for play in wished_plays)
+    assert sorted(map(to_mask, wished_plays)) == sorted(
+        to_mask(play)
+        for play in all_plays
+        if wish_value in {card.value for card in play}
+    )
+
+
+def test_random_play_picks_a_possible_play():
+    rng = random.Random(3)
+    possible_plays = Combination.possible_plays(None, STRAIGHT_HAND)
+    chosen_plays = [
+        Combination.random_play(None, STRAIGHT_HAND, rng=rng) for _ in range(200)
+    ]
+    assert all(play in possible_plays for play in chosen_plays)
+    assert len({to_mask(play) for play in chosen_plays}) > 50
+
+
+def test_random_play_without_plays_returns_none():
+    assert (
+        Combination.random_play(
+            Combination(CombinationType.SINGLE, 14), [Card(Color.JADE, 3)]
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_count_plays_matches_possible_plays(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        low = rng.randint(1, 9)
+        pool = [
+            card
+            for card in DECK
+            if low <= card.value <= low + 6 or card.value in (0, 1, 50, 100)
+        ]
+        cards = rng.sample(pool, rng.randint(1, 14))
+        combination = Combination.from_cards(rng.sample(DECK, rng.randint(1, 6)))
+        wish_value = rng.choice([None, *range(2, 15)])
+        possible_plays = Combination.possible_plays(combination, cards, wish_value)
+        assert Combination.count_plays(combination, cards, wish_value) == len(
+            possible_plays
+        )
+        assert Combination.has_any_play(combination, cards, wish_value) is bool(
+            possible_plays
+        )
+
+
+@pytest.mark.parametrize(
+    ("combination", "wish_value"),
+    [
+        (None, None),
+        (None, 7),
+        (Combination(CombinationType.PAIR, 3), None),
+        (Combination(CombinationType.STRAIGHT, 7, 5), None),
+        (Combination(CombinationType.TRIPLE, 10), None),
+    ],
+)
+def test_play_classes_cover_distinct_plays(combination, wish_value):
+    play_classes = Combination.play_classes(combination, STRAIGHT_HAND, wish_value)
+    expanded_plays = [
+        to_mask(play) for play_class in play_classes for play in play_class.expand()
+    ]
+    possible_plays = Combination.possible_plays(combination, STRAIGHT_HAND, wish_value)
+    assert len(expanded_plays) == len(set(expanded_plays))
+    assert set(expanded_plays) == set(map(to_mask, possible_plays))
+    assert len({play_class.signature for play_class in play_classes}) == len(
+        play_classes
+    )
+    assert sum(play_class.count() for play_class in play_classes) == len(expanded_plays)
+
+
+def test_play_classes_merge_phoenix_straight_duplicates():
+    cards = [
+        Card(Color.JADE, 4),
+        Card(Color.STAR, 5),
+        Card(Color.SWORDS, 6),
+        Card(Color.JADE, 7),
+        PHOENIX,
+    ]
+    straights = [
+        play
+        for play in Combination.possible_plays(None, cards)
+        if len(play) == len(cards)
+    ]
+    play_classes = [
+        play_class
+        for play_class in Combination.play_classes(None, cards)
+        if len(play_class.signature) == len(cards)
+    ]
+    assert len(straights) == 2
+    assert [play_class.signature for play_class in play_classes] == [(4, 5, 6, 7, 50)]
+
+
+def test_play_classes_flag_straight_bombs():
+    cards = [Card(Color.STAR, value) for value in range(2, 7)] + [
+        Card(Color.JADE, 6),
+        Card(Color.JADE, 7),
+    ]
+    play_classes = {
+        play_class.signature: play_class
+        for play_class in Combination.play_classes(None, cards)
+    }
+    assert play_classes[(2, 3, 4, 5, 6)].can_be_straight_bomb
+    assert play_classes[(2, 3, 4, 5, 6)].count() == 2
+    assert Combination.from_cards(
+        list(play_classes[(2, 3, 4, 5, 6)].get_representative())
+    ) == Combination(CombinationType.STRAIGHT_BOMB, 6, 5)
+    assert not play_classes[(3, 4, 5, 6, 7)].can_be_straight_bomb
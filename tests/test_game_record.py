@@ -0,0 +1,116 @@
+import io
+import random
+from unittest.mock import patch
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.card import DECK, Card, Color, MAH_JONG, DRAGON, to_mask
+from tichu.game_record import (
+    MAGIC,
+    GameRecordError,
+    GameRecordWriter,
+    PlayRecord,
+    RoundHeader,
+    iter_records,
+    iter_rounds,
+)
+from tichu.random_player import RandomPlayer
+from tichu.replay import replay_rounds
+from tichu.tichu import Tichu
+
+
+def _as_mask(card_play):
+    if isinstance(card_play, str):
+        return card_play
+    return to_mask(card_play[0]), card_play[1]
+
+
+def test_recorded_match_reads_back(record_match):
+    stream, states, _ = record_match(seed=3, max_rounds=3)
+    play_logs = [round_states[-1].play_log for round_states in states]
+
+    rounds = list(iter_rounds(stream))
+
+    assert len(rounds) == len(play_logs)
+    for round_number, ((header, plays), play_log) in enumerate(
+        zip(rounds, play_logs), start=1
+    ):
+        assert header.round_number == round_number
+        assert [(play.player_idx, _as_mask(play.card_play)) for play in plays] == [
+            (idx, _as_mask(card_play)) for idx, card_play in play_log
+        ]
+        # The seed gives the deal the pushes were made from.
+        deck = Tichu.shuffle_deck(header.seed)
+        for player_idx, pushed in enumerate(header.pushes):
+            assert len(pushed) == NUM_PLAYERS - 1
+            assert set(pushed) <= set(deck[player_idx::NUM_PLAYERS])
+
+
+def test_rejected_plays_are_not_recorded():
+    random.seed(4)
+    stream = io.BytesIO()
+    game = Tichu(seed=4, listeners=[], recorder=GameRecordWriter(stream))
+    game.new_game([RandomPlayer(f"Player {idx}") for idx in range(NUM_PLAYERS)])
+    get_card_play = RandomPlayer.get_card_play
+    # The holder of the Mah Jong leads and first forgets the wish.
+    attempts = iter([({MAH_JONG}, None)])
+
+    def first_play_invalid(player, game_state):
+        return next(attempts, None) or get_card_play(player, game_state)
+
+    with patch.object(RandomPlayer, "get_card_play", first_play_invalid):
+        game.play_round()
+    stream.seek(0)
+
+    (replay,) = replay_rounds(stream)
+    assert replay.final_state.play_log == game.state.play_log
+    assert replay.scores == game.state.scores
+    assert all(play.card_play != ({MAH_JONG}, None) for play in replay.plays)
+
+
+def test_records_are_compact():
+    stream = io.BytesIO()
+    writer = GameRecordWriter(stream)
+    writer.write_play(2, "pass")
+    writer.write_play(1, "tichu")
+    writer.write_play(0, ({Card(Color.JADE, 5), Card(Color.STAR, 5)}, None))
+    writer.write_play(3, ({DRAGON}, 1))
+
+    assert len(stream.getvalue()) == len(MAGIC) + 1 + 1 + 4 + 4
+    stream.seek(0)
+    assert list(iter_records(stream)) == [
+        PlayRecord(2, "pass"),
+        PlayRecord(1, "tichu"),
+        PlayRecord(0, ({Card(Color.JADE, 5), Card(Color.STAR, 5)}, None)),
+        PlayRecord(3, ({DRAGON}, 1)),
+    ]
+
+
+def test_round_header_round_trip():
+    stream = io.BytesIO()
+    pushes = [list(DECK[idx : idx + 3]) for idx in range(0, 12, 3)]
+    GameRecordWriter(stream).write_round(
+        -(2**40), 300, [True, False, False, True], pushes
+    )
+    stream.seek(0)
+
+    assert list(iter_records(stream)) == [
+        RoundHeader(
+            -(2**40),
+            300,
+            (True, False, False, True),
+            tuple(tuple(pushed) for pushed in pushes),
+        )
+    ]
+
+
+def test_broken_records_raise():
+    with pytest.raises(GameRecordError):
+        list(iter_records(io.BytesIO(b"JSON")))
+    stream = io.BytesIO()
+    GameRecordWriter(stream).write_play(0, ({DRAGON}, 1))
+    with pytest.raises(GameRecordError):
+        list(iter_records(io.BytesIO(stream.getvalue()[:-1])))
+    with pytest.raises(GameRecordError):
+        list(iter_rounds(io.BytesIO(stream.getvalue())))
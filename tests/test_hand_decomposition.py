@@ -0,0 +1,89 @@
+import random
+from functools import cache
+
+import pytest
+
+from tichu.card import (
+    DECK,
+    Card,
+    CardMask,
+    Color,
+    DOG,
+    MAH_JONG,
+    PHOENIX,
+    DRAGON,
+    from_mask,
+    to_mask,
+)
+from tichu.combination import Combination, CombinationType
+from tichu.hand_decomposition import decompose, get_min_plays
+
+
+def _cards(*values: int, color: Color = Color.JADE) -> list[Card]:
+    return [Card(color, value) for value in values]
+
+
+@cache
+def _brute_force_min_plays(mask: CardMask) -> int:
+    if not mask:
+        return 0
+    lowest = mask & -mask
+    plays = []
+    for play in Combination.possible_plays(None, mask):
+        play_mask = to_mask(play)
+        combination = Combination.from_cards(play_mask)
+        # The engine lets the Phoenix pair with the Mah Jong, the rules do not.
+        if (
+            MAH_JONG in play
+            and PHOENIX in play
+            and combination is not None
+            and combination.combination_type != CombinationType.STRAIGHT
+        ):
+            continue
+        if play_mask & lowest:
+            plays.append(1 + _brute_force_min_plays(mask & ~play_mask))
+    return min(plays)
+
+
+@pytest.mark.parametrize(
+    "cards, expected",
+    [
+        ([], 0),
+        ([DOG, DRAGON, PHOENIX], 3),
+        (_cards(2, 3, 4, 5, 6), 1),
+        ([MAH_JONG] + _cards(2, 3, 4, 5), 1),
+        ([MAH_JONG, PHOENIX] + _cards(2, 3, 5), 1),
+        (_cards(10, 11, 12, 13) + [PHOENIX], 1),
+        (_cards(2, 3, 4, 5, 6) + _cards(2, 3, 4, 5, 6, color=Color.STAR), 1),
+        (_cards(7, 8) + _cards(7, 8, color=Color.STAR) + [PHOENIX], 1),
+        (_cards(7, 8) + _cards(7, 8, color=Color.STAR) + _cards(9), 2),
+        ([Card(color, 9) for color in Color if color != Color.SPECIAL], 1),
+        (_cards(4, 9) + _cards(4, 9, color=Color.STAR) + [PHOENIX], 1),
+    ],
+)
+def test_get_min_plays(cards: list[Card], expected: int):
+    assert get_min_plays(cards) == expected
+    assert get_min_plays(to_mask(cards)) == expected
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    pool = [card for card in DECK if card.value <= 6 or card.value > 14]
+    for _ in range(200):
+        mask = to_mask(rng.sample(pool, rng.randint(1, 9)))
+        assert get_min_plays(mask) == _brute_force_min_plays(mask)
+
+
+def test_decompose_partitions_into_combinations():
+    rng = random.Random(0)
+    for _ in range(100):
+        hand = rng.sample(DECK, 14)
+        parts = decompose(hand)
+
+        assert len(parts) == get_min_plays(hand)
+        assert sorted(card.index for part in parts for card in part) == sorted(
+            card.index for card in hand
+        )
+        for part in parts:
+            assert Combination.from_cards(part) is not None
+    assert decompose(from_mask(0)) == []
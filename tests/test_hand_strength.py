@@ -0,0 +1,118 @@
+import math
+
+import pytest
+
+from tichu import GRAND_TICHU_HAND_SIZE, HAND_SIZE, NUM_PLAYERS
+from tichu.card import Card, Color, DOG, MAH_JONG, PHOENIX, DRAGON
+from tichu.hand_strength import (
+    DECISION_HAND_SIZES,
+    HandStrengthEvaluator,
+    _decode_tables,
+    _encode_tables,
+    _simulate_tables,
+    get_evaluator,
+    get_hand_key,
+    should_call_grand_tichu,
+    should_call_tichu,
+)
+from tichu.player_state import PlayerState
+
+STRONG_HAND = [
+    DRAGON,
+    PHOENIX,
+    Card(Color.JADE, 14),
+    Card(Color.SWORDS, 13),
+    Card(Color.PAGODE, 7),
+    Card(Color.STAR, 7),
+    Card(Color.JADE, 3),
+    Card(Color.STAR, 3),
+]
+WEAK_HAND = [
+    DOG,
+    Card(Color.JADE, 2),
+    Card(Color.SWORDS, 3),
+    Card(Color.PAGODE, 4),
+    Card(Color.STAR, 6),
+    Card(Color.JADE, 7),
+    Card(Color.SWORDS, 9),
+    Card(Color.PAGODE, 10),
+]
+
+
+def test_get_hand_key():
+    assert get_hand_key(STRONG_HAND) == (1, 1, 0, 2, 0, 4)
+    assert get_hand_key(WEAK_HAND) == (0, 0, 1, 0, 0, 8)
+    four_of_a_kind = [Card(color, 5) for color in Color if color != Color.SPECIAL]
+    assert get_hand_key(four_of_a_kind + [MAH_JONG])[4:] == (1, 2)
+    straight_bomb = [Card(Color.STAR, value) for value in range(3, 8)]
+    assert get_hand_key(straight_bomb)[4:] == (1, 1)
+
+
+def test_simulated_tables_count_every_deal():
+    rounds = 20
+    tables = _simulate_tables(rounds, seed=0)
+
+    assert sorted(tables) == sorted(DECISION_HAND_SIZES)
+    for table in tables.values():
+        assert sum(deals for _, deals in table.values()) == rounds * NUM_PLAYERS
+        assert sum(wins for wins, _ in table.values()) == rounds
+    assert _decode_tables(_encode_tables(tables)) == tables
+
+
+def test_evaluator_smooths_towards_base_rate():
+    evaluator = HandStrengthEvaluator(
+        {GRAND_TICHU_HAND_SIZE: {(1, 1, 0, 2, 0, 4): [30, 30], (0,) * 6: [0, 90]}}
+    )
+
+    assert evaluator.base_rates[GRAND_TICHU_HAND_SIZE] == 0.25
+    assert 0.25 < evaluator.get_win_probability(STRONG_HAND) < 1
+    assert evaluator.should_call_grand_tichu(STRONG_HAND)
+    # Keys missing from the table fall back to the base rate.
+    assert evaluator.get_win_probability(WEAK_HAND) == 0.25
+    assert not evaluator.should_call_grand_tichu(WEAK_HAND)
+    assert evaluator.should_call_grand_tichu(WEAK_HAND, threshold=0.25)
+    with pytest.raises(ValueError):
+        evaluator.get_win_probability(STRONG_HAND[:5])
+
+
+def test_thresholds_follow_the_call_rates():
+    table = {(1,) * 6: [6, 10], (2,) * 6: [4, 10], (3,) * 6: [0, 80]}
+
+    evaluator = HandStrengthEvaluator(
+        {GRAND_TICHU_HAND_SIZE: table}, {GRAND_TICHU_HAND_SIZE: 0.15}
+    )
+    probabilities = evaluator.probabilities[GRAND_TICHU_HAND_SIZE]
+    # The best key holds 10 of the 100 deals, so the next one is needed too.
+    assert evaluator.thresholds[GRAND_TICHU_HAND_SIZE] == probabilities[(2,) * 6]
+
+    evaluator = HandStrengthEvaluator({GRAND_TICHU_HAND_SIZE: table}, {})
+    assert evaluator.thresholds[GRAND_TICHU_HAND_SIZE] == math.inf
+
+
+def test_shipped_tables():
+    evaluator = get_evaluator()
+
+    assert get_evaluator() is evaluator
+    for hand_size in DECISION_HAND_SIZES:
+        assert evaluator.base_rates[hand_size] == pytest.approx(1 / NUM_PLAYERS)
+    assert evaluator.get_win_probability(STRONG_HAND) > evaluator.get_win_probability(
+        WEAK_HAND
+    )
+
+
+def test_strong_hands_call_grand_tichu():
+    assert should_call_grand_tichu(PlayerState(list(STRONG_HAND)))
+    assert not should_call_grand_tichu(PlayerState(list(WEAK_HAND)))
+
+
+def test_should_call_tichu_needs_a_full_uncalled_hand(monkeypatch):
+    monkeypatch.setattr(HandStrengthEvaluator, "should_call_tichu", lambda *_: True)
+    player_state = PlayerState()
+    player_state.hand = STRONG_HAND + WEAK_HAND[1 : HAND_SIZE - len(STRONG_HAND) + 1]
+
+    assert should_call_tichu(player_state)
+    player_state.tichu_called = True
+    assert not should_call_tichu(player_state)
+    player_state.tichu_called = False
+    player_state.remove_cards(player_state.hand[-1:])
+    assert not should_call_tichu(player_state)
@@ -0,0 +1,161 @@
+import gc
+import random
+from unittest.mock import patch
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.card import Card, Color
+from tichu.ismcts_player import ISMCTSNode, ISMCTSPlayer, rollout
+from tichu.player import PlayerType
+from tichu.random_player import RandomPlayer
+from tichu.search import get_move_key
+from tichu.tichu import Tichu
+
+
+@pytest.fixture
+def game() -> Tichu:
+    random.seed(0)
+    players = [
+        ISMCTSPlayer("ISMCTS 0", iterations=50, time_budget=None, seed=0),
+        RandomPlayer("Random 1"),
+        ISMCTSPlayer("ISMCTS 2", iterations=50, time_budget=None, seed=2),
+        RandomPlayer("Random 3"),
+    ]
+    game_instance = Tichu(seed=42, listeners=[])
+    game_instance.new_game(players)
+    with patch(
+        "tichu.random_player.RandomPlayer.get_grand_tichu_play", return_value="pass"
+    ):
+        game_instance.start_new_round()
+    return game_instance
+
+
+@pytest.fixture
+def player(game: Tichu) -> ISMCTSPlayer:
+    player = game.players[0]
+    assert isinstance(player, ISMCTSPlayer)
+    return player
+
+
+def test_player_type():
+    assert ISMCTSPlayer().player_type == PlayerType.ISMCTS
+
+
+def test_requires_a_budget():
+    with pytest.raises(ValueError):
+        ISMCTSPlayer(iterations=None, time_budget=None)
+
+
+def test_rollout_finishes_the_round(game: Tichu):
+    state = game.state.copy()
+    round_scores = rollout(state, seed=1)
+
+    assert len(round_scores) == 2
+    engine = Tichu(listeners=[])
+    engine.state = state
+    assert engine.end_of_round
+    assert game.state.get_player_state(0).hand
+
+
+def test_search_runs_the_iteration_budget(game: Tichu, player: ISMCTSPlayer):
+    game.state.current_player_idx = 0
+    root = ISMCTSNode()
+
+    player.search(root, game.state)
+
+    assert root.visits == 50
+    assert sum(child.visits for child in root.children.values()) == 50
+
+
+def test_get_card_play_is_legal_and_reproducible(game: Tichu):
+    game.state.current_player_idx = 0
+    snapshot = game.state.copy()
+
+    card_play = game.players[0].get_card_play(game.state)
+    other_player = ISMCTSPlayer(iterations=50, time_budget=None, seed=0)
+    other_player.set_game(0)
+
+    assert game.state == snapshot
+    assert other_player.get_card_play(game.state) == card_play
+    game.next_turn(0, card_play)
+
+
+def test_tree_is_reused_between_moves(game: Tichu, player: ISMCTSPlayer):
+    game.state.current_player_idx = 0
+    game.next_turn(0, player.get_card_play(game.state))
+    while game.state.current_player_idx != 0 and not game.end_of_round:
+        game.next_turn(
+            game.state.current_player_idx,
+            game.current_player.get_card_play(game.state),
+        )
+    node = player._root
+    assert node is not None
+    for player_idx, card_play in game.state.play_log:
+        key = get_move_key(card_play)
+        if key not in node.children:
+            node.children[key] = ISMCTSNode(key, player_idx, node)
+        node = node.children[key]
+
+    root = player._get_root(game.state)
+
+    assert root is node
+    assert root.parent is None
+
+
+def test_unknown_moves_start_a_new_tree(game: Tichu, player: ISMCTSPlayer):
+    game.state.current_player_idx = 0
+    game.next_turn(0, player.get_card_play(game.state))
+    old_root = player._root
+    assert old_root is not None
+    old_root.children.clear()
+
+    root = player._get_root(game.state)
+
+    assert root is not old_root
+    assert root.visits == 0
+
+
+def test_tree_is_dropped_in_a_new_round(game: Tichu, player: ISMCTSPlayer):
+    game.state.current_player_idx = 0
+    game.next_turn(0, player.get_card_play(game.state))
+    game.state.current_round += 1
+
+    assert player._get_root(game.state).visits == 0
+
+
+def test_rollouts_in_process_pool(game: Tichu):
+    game.state.current_player_idx = 0
+    root = ISMCTSNode()
+    with ISMCTSPlayer(iterations=8, time_budget=None, workers=2, seed=0) as player:
+        player.set_game(0)
+        player.search(root, game.state)
+        executor = player._get_executor()
+
+    assert root.visits == 8
+    assert player._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(len, [])
+
+
+def test_process_pool_is_shut_down_with_the_player(game: Tichu):
+    player = ISMCTSPlayer(iterations=2, time_budget=None, workers=1, seed=0)
+    player.set_game(0)
+    game.state.current_player_idx = 0
+    player.search(ISMCTSNode(), game.state)
+    executor = player._get_executor()
+
+    del player
+    gc.collect()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(len, [])
+
+
+def test_single_legal_move_is_not_searched(game: Tichu, player: ISMCTSPlayer):
+    game.state.current_player_idx = 0
+    game.state.get_player_state(0).hand = [Card(Color.JADE, 9)]
+
+    with patch.object(player, "search") as search:
+        assert player.get_card_play(game.state) == ({Card(Color.JADE, 9)}, None)
+    search.assert_not_called()
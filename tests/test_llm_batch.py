@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.llm_batch import LLMBatcher
+from tichu.llm_player import LLMPlay, LLMPlayer
+from tichu.llm_prompt import get_legal_plays
+from tichu.tichu import Tichu
+
+
+class EchoResponses:
+    """Answers every request with its input after a delay, counting overlap."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def parse(self, **kwargs):
+        if kwargs["input"] == "fail":
+            raise RuntimeError("fail")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return SimpleNamespace(output_parsed=kwargs["input"])
+
+
+async def _parse_all(batcher: LLMBatcher, inputs: list) -> list:
+    return await asyncio.gather(
+        *(batcher.responses.parse(input=value) for value in inputs),
+        return_exceptions=True,
+    )
+
+
+def test_requests_are_batched_and_routed_back():
+    responses = EchoResponses()
+    batcher = LLMBatcher(
+        SimpleNamespace(responses=responses), max_batch_size=4, max_concurrency=2
+    )
+
+    results = asyncio.run(_parse_all(batcher, list(range(10))))
+
+    assert [result.output_parsed for result in results] == list(range(10))
+    assert batcher.num_batches == 3
+    assert batcher.num_requests == 10
+    assert responses.max_in_flight == 2
+
+
+def test_batcher_is_reused_across_event_loops():
+    responses = EchoResponses()
+    batcher = LLMBatcher(SimpleNamespace(responses=responses), max_concurrency=1)
+
+    for _ in range(2):
+        results = asyncio.run(_parse_all(batcher, list(range(3))))
+        assert [result.output_parsed for result in results] == list(range(3))
+
+    assert batcher.num_batches == 2
+    assert responses.max_in_flight == 1
+
+
+def test_errors_reach_only_their_request():
+    batcher = LLMBatcher(SimpleNamespace(responses=EchoResponses()))
+
+    ok, failed = asyncio.run(_parse_all(batcher, ["ok", "fail"]))
+
+    assert ok.output_parsed == "ok"
+    assert isinstance(failed, RuntimeError)
+    assert batcher.num_batches == 1
+
+
+def test_invalid_limits_raise():
+    with pytest.raises(ValueError):
+        LLMBatcher(SimpleNamespace(responses=EchoResponses()), max_batch_size=0)
+
+
+class FirstChoiceResponses:
+    async def parse(self, **kwargs):
+        await asyncio.sleep(0)
+        return SimpleNamespace(output_parsed=LLMPlay(choice=0, wish=None))
+
+
+def test_games_share_the_batcher():
+    batcher = LLMBatcher(SimpleNamespace(responses=FirstChoiceResponses()))
+    games, players = [], []
+    for seed in range(3):
+        game = Tichu(seed=seed, listeners=[])
+        game.new_game(
+            [
+                LLMPlayer(f"LLM {idx}", async_client=batcher)
+                for idx in range(NUM_PLAYERS)
+            ]
+        )
+        game.start_new_round()
+        games.append(game)
+        players.append(game.players[game.state.current_player_idx])
+
+    async def get_card_plays():
+        return await asyncio.gather(
+            *(
+                player.get_card_play_async(game.state)
+                for game, player in zip(games, players)
+            )
+        )
+
+    card_plays = asyncio.run(get_card_plays())
+
+    for game, player, card_play in zip(games, players, card_plays):
+        assert card_play == get_legal_plays(game.state, player.player_idx)[0]
+    assert batcher.num_batches == 1
+    assert batcher.num_requests == len(games)
@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import pytest
+from openai import OpenAI
+
+from tichu import NUM_PLAYERS
+from tichu.card import Card, Color
+from tichu.llm_cache import ResponseCache, get_situation_key
+from tichu.llm_player import LLMPlay, LLMPlayer
+from tichu.tichu import Tichu
+
+
+class CountingResponses:
+    def __init__(self):
+        self.num_requests = 0
+
+    def parse(self, **kwargs):
+        self.num_requests += 1
+        return SimpleNamespace(output_parsed=LLMPlay(choice=1, wish=2))
+
+
+def _new_game() -> Tichu:
+    game = Tichu(seed=0, listeners=[])
+    game.new_game(
+        [
+            LLMPlayer(f"LLM {idx}", client=OpenAI(api_key="unused"))
+            for idx in range(NUM_PLAYERS)
+        ]
+    )
+    game.start_new_round()
+    return game
+
+
+def test_situation_key_ignores_what_the_seat_cannot_tell_apart():
+    game = _new_game()
+    state = game.state
+    state.card_stack = [Card(Color.JADE, 3), Card(Color.STAR, 4)]
+    key = get_situation_key("model", state, 0)
+
+    other = state.copy()
+    other.card_stack.reverse()
+    other.current_round += 1
+    assert get_situation_key("model", other, 0) == key
+    # Other players' cards are hidden from the seat, only their number counts.
+    other.player_states[1].hand, other.player_states[2].hand = (
+        other.player_states[2].hand,
+        other.player_states[1].hand,
+    )
+    assert get_situation_key("model", other, 0) == key
+
+    assert get_situation_key("other model", state, 0) != key
+    assert get_situation_key("model", state, 1) != key
+    other.current_wish = 7
+    assert get_situation_key("model", other, 0) != key
+
+
+def test_cache_persists_and_counts(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    cache = ResponseCache(path)
+    assert cache.get(b"a") is None
+    cache.put(b"a", "response")
+    assert cache.get(b"a") == "response"
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened.get(b"a") == "response"
+    assert len(reopened) == 1
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"), max_entries=2)
+    cache.put(b"a", "1")
+    cache.put(b"b", "2")
+    cache.get(b"a")
+    cache.put(b"c", "3")
+
+    assert len(cache) == 2
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "1"
+    assert cache.get(b"c") == "3"
+    with pytest.raises(ValueError):
+        ResponseCache(str(tmp_path / "empty.sqlite"), max_entries=0)
+
+
+def test_cache_replaces_responses_without_growing(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"), max_entries=2)
+    cache.put(b"a", "1")
+    cache.put(b"b", "2")
+    cache.put(b"a", "3")
+
+    assert len(cache) == 2
+    assert cache.get(b"a") == "3"
+    assert cache.get(b"b") == "2"
+
+
+def test_seeded_reruns_are_answered_from_the_cache(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    card_plays = []
+    for _ in range(2):
+        responses = CountingResponses()
+        cache = ResponseCache(path)
+        game = _new_game()
+        player = game.current_player
+        player.client = SimpleNamespace(responses=responses)
+        player.cache = cache
+        card_plays.append(player.get_card_play(game.state))
+        cache.close()
+
+    assert card_plays[0] == card_plays[1]
+    assert responses.num_requests == 0
+    assert (cache.hits, cache.misses) == (1, 0)
@@ -0,0 +1,128 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.card import Card, Color, MAH_JONG
+from tichu.combination import Combination
+from tichu.llm_player import (
+    InvalidLLMResponse,
+    LLMPlay,
+    LLMPlayer,
+    get_async_client,
+)
+from tichu.llm_prompt import get_legal_plays
+from tichu.tichu import Tichu
+
+
+class StubResponses:
+    """Stands in for the responses API, answering every request with one play."""
+
+    def __init__(self, llm_play: LLMPlay | None):
+        self.llm_play = llm_play
+        self.requests: list[dict] = []
+
+    def parse(self, **kwargs):
+        self.requests.append(kwargs)
+        return SimpleNamespace(output_parsed=self.llm_play)
+
+
+class AsyncStubResponses(StubResponses):
+    async def parse(self, **kwargs):
+        await asyncio.sleep(0)
+        return super().parse(**kwargs)
+
+
+def _get_game_and_player(**clients) -> tuple[Tichu, LLMPlayer]:
+    player = LLMPlayer("LLM", **clients)
+    # Player 0 is not dealt the Mah Jong, so its plays need no wish.
+    game = Tichu(seed=1, listeners=[])
+    game.new_game(
+        [player, *(LLMPlayer(f"LLM {idx}", **clients) for idx in range(1, NUM_PLAYERS))]
+    )
+    game.start_new_round()
+    game.state.current_player_idx = 0
+    return game, player
+
+
+def test_get_card_play_async_uses_the_async_client():
+    responses = AsyncStubResponses(LLMPlay(choice=1, wish=None))
+    game, player = _get_game_and_player(
+        async_client=SimpleNamespace(responses=responses)
+    )
+    legal_plays = get_legal_plays(game.state, 0)
+
+    card_play = asyncio.run(player.get_card_play_async(game.state))
+
+    assert card_play == legal_plays[1]
+    assert len(responses.requests) == 1
+    assert issubclass(responses.requests[0]["text_format"], LLMPlay)
+
+
+def test_get_card_play_uses_the_sync_client():
+    responses = StubResponses(LLMPlay(choice=0, wish=None))
+    game, player = _get_game_and_player(client=SimpleNamespace(responses=responses))
+
+    # A full hand offers calling Tichu first.
+    assert player.get_card_play(game.state) == "tichu"
+
+
+def test_response_format_only_allows_listed_choices():
+    responses = StubResponses(LLMPlay(choice=0, wish=None))
+    game, player = _get_game_and_player(client=SimpleNamespace(responses=responses))
+    player.get_card_play(game.state)
+    text_format = responses.requests[0]["text_format"]
+    num_choices = len(get_legal_plays(game.state, 0))
+
+    text_format.model_validate({"choice": num_choices - 1, "wish": None})
+    with pytest.raises(ValueError):
+        text_format.model_validate({"choice": num_choices, "wish": None})
+
+
+def test_mah_jong_plays_take_the_wish():
+    game, player = _get_game_and_player(
+        client=SimpleNamespace(responses=StubResponses(None))
+    )
+    player_state = game.state.get_player_state(0)
+    player_state.hand = [MAH_JONG, Card(Color.JADE, 9)]
+    legal_plays = get_legal_plays(game.state, 0)
+    choice = legal_plays.index(({MAH_JONG}, None))
+    player.client.responses.llm_play = LLMPlay(choice=choice, wish=9)
+
+    assert player.get_card_play(game.state) == ({MAH_JONG}, 9)
+    format_fields = player.client.responses.requests[0]["text_format"].model_fields
+    assert format_fields["wish"].is_required()
+
+
+def test_forced_plays_skip_the_request():
+    responses = StubResponses(None)
+    game, player = _get_game_and_player(client=SimpleNamespace(responses=responses))
+    game.state.current_combination = Combination.from_cards([Card(Color.STAR, 14)])
+    game.state.get_player_state(0).hand = [Card(Color.JADE, 2)]
+
+    assert player.get_card_play(game.state) == "pass"
+    assert not responses.requests
+
+
+def test_invalid_responses_raise():
+    game, player = _get_game_and_player(
+        client=SimpleNamespace(responses=StubResponses(None))
+    )
+    with pytest.raises(InvalidLLMResponse):
+        player.get_card_play(game.state)
+
+    player.client = SimpleNamespace(
+        responses=StubResponses(LLMPlay(choice=999, wish=None))
+    )
+    with pytest.raises(InvalidLLMResponse):
+        player.get_card_play(game.state)
+
+
+def test_async_client_is_shared(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    get_async_client.cache_clear()
+    try:
+        assert get_async_client() is get_async_client()
+    finally:
+        get_async_client.cache_clear()
@@ -0,0 +1,101 @@
+from unittest.mock import patch
+
+import random
+
+from tichu import NUM_PLAYERS
+from tichu.card import Card, Color, MAH_JONG, DRAGON
+from tichu.combination import Combination
+from tichu.llm_prompt import (
+    RECENT_PLAYS,
+    format_card_play,
+    get_legal_plays,
+    get_prompt_input,
+    get_state_prompt,
+    get_static_prefix,
+    load_rules,
+)
+from tichu.player_state import PlayerState
+from tichu.random_player import RandomPlayer
+from tichu.tichu import Tichu
+from tichu.tichu_state import TichuState
+
+
+def _get_state() -> TichuState:
+    state = TichuState(player_states=[PlayerState() for _ in range(4)])
+    state.player_states[1].hand = [Card(Color.JADE, 5), DRAGON]
+    return state
+
+
+def test_rules_are_read_once():
+    load_rules.cache_clear()
+    get_static_prefix.cache_clear()
+    with patch("builtins.open", wraps=open) as mock_open:
+        first = get_static_prefix()
+        second = get_prompt_input(_get_state(), 1, "LLM", ["pass"])[0]["content"]
+    assert first is second
+    assert load_rules() in first
+    assert mock_open.call_count == 1
+
+
+def test_static_prefix_comes_first_and_state_follows():
+    state = _get_state()
+    messages = get_prompt_input(state, 1, "LLM", get_legal_plays(state, 1))
+
+    assert messages[0]["content"] == get_static_prefix()
+    assert "Player 1" in messages[1]["content"]
+    assert "Your Hand: JADE 5, Dragon" in messages[1]["content"]
+    assert "0: JADE 5\n1: Dragon (trick to Player 2)" in messages[1]["content"]
+    assert get_static_prefix() not in messages[1]["content"]
+
+
+def test_only_recent_plays_are_sent():
+    state = _get_state()
+    state.play_log = [(idx % 4, "pass") for idx in range(RECENT_PLAYS)]
+    state.play_log.insert(0, (0, ({Card(Color.STAR, 9)}, None)))
+
+    prompt = get_state_prompt(state, 1, "LLM", [])
+
+    assert "STAR 9" not in prompt
+    assert prompt.count(": pass") == RECENT_PLAYS
+
+
+def test_format_card_play():
+    assert format_card_play("pass") == "pass"
+    assert format_card_play("tichu") == "called Tichu"
+    assert format_card_play(({DRAGON}, 3)) == "Dragon (trick to Player 3)"
+    assert format_card_play(({MAH_JONG}, 7)) == "Mah Jong (wish: 7)"
+    assert format_card_play((Card(Color.JADE, 2).mask, None)) == "JADE 2"
+
+
+def test_legal_plays_offer_tichu_and_pass_only_when_allowed():
+    state = _get_state()
+    assert "tichu" not in get_legal_plays(state, 1)
+    assert "pass" not in get_legal_plays(state, 1)
+
+    state.current_combination = Combination.from_cards([Card(Color.STAR, 4)])
+    assert get_legal_plays(state, 1)[0] == "pass"
+    state.current_wish = 5
+    assert get_legal_plays(state, 1) == [({Card(Color.JADE, 5)}, None)]
+
+
+def _with_wish(card_play):
+    if card_play not in ("pass", "tichu") and MAH_JONG in card_play[0]:
+        return card_play[0], 2
+    return card_play
+
+
+def test_every_legal_play_is_accepted():
+    rng = random.Random(0)
+    for seed in range(3):
+        game = Tichu(seed=seed, listeners=[])
+        game.new_game([RandomPlayer(f"Player {idx}") for idx in range(NUM_PLAYERS)])
+        game.start_new_round()
+        while not game.end_of_round:
+            player_idx = game.state.current_player_idx
+            legal_plays = get_legal_plays(game.state, player_idx)
+            assert len(set(map(str, legal_plays))) == len(legal_plays)
+            for card_play in legal_plays:
+                engine = Tichu(listeners=[])
+                engine.state = game.state.copy()
+                engine.next_turn(player_idx, _with_wish(card_play))
+            game.next_turn(player_idx, _with_wish(rng.choice(legal_plays)))
@@ -0,0 +1,104 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.card import FULL_MASK, Card, Color
+from tichu.combination import Combination, CombinationType
+from tichu.mini_maxi_player import MiniMaxiPlayer
+from tichu.player import PlayerType
+from tichu.random_player import RandomPlayer
+from tichu.tichu import Tichu
+
+
+@pytest.fixture
+def game() -> Tichu:
+    players = [
+        MiniMaxiPlayer("MiniMaxi 0", time_budget=0.01, seed=0),
+        RandomPlayer("Random 1"),
+        MiniMaxiPlayer("MiniMaxi 2", time_budget=0.01, seed=2),
+        RandomPlayer("Random 3"),
+    ]
+    game_instance = Tichu(seed=42, listeners=[])
+    game_instance.new_game(players)
+    with patch(
+        "tichu.random_player.RandomPlayer.get_grand_tichu_play", return_value="pass"
+    ):
+        game_instance.start_new_round()
+    return game_instance
+
+
+@pytest.fixture
+def player(game: Tichu) -> MiniMaxiPlayer:
+    player = game.players[0]
+    assert isinstance(player, MiniMaxiPlayer)
+    return player
+
+
+def test_player_type():
+    assert MiniMaxiPlayer().player_type == PlayerType.MINI_MAXI
+
+
+def test_sample_state_keeps_own_hand_and_hand_sizes(
+    game: Tichu, player: MiniMaxiPlayer
+):
+    game.state.card_stack = [Card(Color.JADE, 2)]
+    game.state.get_player_state(1).card_stack = [Card(Color.STAR, 3)]
+    for player_state in game.state.player_states:
+        player_state.hand = [
+            card
+            for card in player_state.hand
+            if card not in (Card(Color.JADE, 2), Card(Color.STAR, 3))
+        ]
+
+    sample = player.sample_state(game.state, 0)
+
+    assert sample.get_player_state(0).hand == game.state.get_player_state(0).hand
+    masks = [player_state.hand_mask for player_state in sample.player_states]
+    for player_idx in range(NUM_PLAYERS):
+        assert len(sample.get_player_state(player_idx).hand) == len(
+            game.state.get_player_state(player_idx).hand
+        )
+    assert sum(masks) == FULL_MASK & ~(
+        Card(Color.JADE, 2).mask | Card(Color.STAR, 3).mask
+    )
+    assert game.state.get_player_state(1).hand != sample.get_player_state(1).hand
+
+
+def test_get_card_play_respects_time_budget(game: Tichu, player: MiniMaxiPlayer):
+    game.state.current_player_idx = 0
+    player.time_budget = 0.02
+    snapshot = game.state.copy()
+
+    start = time.perf_counter()
+    card_play = player.get_card_play(game.state)
+
+    assert time.perf_counter() - start < 0.2
+    assert game.state == snapshot
+    game.next_turn(0, card_play)
+
+
+def test_must_play_is_not_searched(game: Tichu):
+    game.state.current_player_idx = 0
+    game.state.get_player_state(0).hand = [Card(Color.JADE, 9)]
+    game.state.current_combination = None
+
+    assert game.players[0].get_card_play(game.state) == ({Card(Color.JADE, 9)}, None)
+
+
+def test_prefers_finishing_the_round(game: Tichu):
+    game.state.current_player_idx = 0
+    game.state.get_player_state(0).hand = [Card(Color.JADE, 9), Card(Color.STAR, 9)]
+    game.state.current_combination = Combination(CombinationType.PAIR, 8)
+    game.state.winning_player_idx = 1
+
+    assert game.players[0].get_card_play(game.state) == (
+        {Card(Color.JADE, 9), Card(Color.STAR, 9)},
+        None,
+    )
+
+
+def test_plays_a_full_round(game: Tichu):
+    game.play_round()
+    assert game.end_of_round
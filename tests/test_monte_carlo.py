@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from tichu import HAND_SIZE, NUM_PLAYERS
+from tichu.card import FULL_MASK, Card, Color, DRAGON, PHOENIX, to_mask
+from tichu.monte_carlo import (
+    Estimate,
+    deal_hands,
+    estimate,
+    holds_all,
+    holds_any,
+    holds_any_of,
+)
+from tichu.probabilities import get_probability_for_cards
+
+
+def test_deal_hands_deals_every_card_once():
+    hands = deal_hands(np.random.default_rng(0), 100)
+
+    assert hands.shape == (100, NUM_PLAYERS, 56)
+    assert (hands.sum(axis=2) == HAND_SIZE).all()
+    assert (hands.sum(axis=1) == 1).all()
+
+
+def test_deal_hands_from_a_subset_of_cards():
+    cards = FULL_MASK & ~DRAGON.mask & ~PHOENIX.mask
+    hands = deal_hands(np.random.default_rng(0), 50, cards, (10, 5))
+
+    assert hands.shape == (50, 2, 56)
+    assert (hands.sum(axis=2) == [10, 5]).all()
+    assert not hands[:, :, DRAGON.index].any()
+    assert not hands[:, :, PHOENIX.index].any()
+
+    with pytest.raises(ValueError):
+        deal_hands(np.random.default_rng(0), 1, DRAGON.mask, (2,))
+
+
+def test_predicates():
+    hands = np.zeros((2, NUM_PLAYERS, 56), dtype=bool)
+    hands[0, 1, [DRAGON.index, PHOENIX.index]] = True
+    hands[1, 1, DRAGON.index] = True
+
+    both = {DRAGON, PHOENIX}
+    assert holds_all(1, both)(hands).tolist() == [True, False]
+    assert holds_any(1, both)(hands).tolist() == [True, True]
+    assert holds_any(0, both)(hands).tolist() == [False, False]
+    assert holds_any_of(1, [{PHOENIX}, {Card(Color.JADE, 2)}])(hands).tolist() == [
+        True,
+        False,
+    ]
+
+
+def test_estimate_matches_closed_form():
+    play = {Card(Color.JADE, 2), Card(Color.STAR, 2)}
+    expected = get_probability_for_cards(FULL_MASK, HAND_SIZE, to_mask(play))
+
+    result = estimate(holds_all(0, play), max_trials=200_000, seed=0)
+
+    low, high = result.interval
+    assert result.trials == 200_000
+    assert low <= expected <= high
+
+
+def test_conditional_estimate():
+    result = estimate(
+        holds_all(0, {PHOENIX}),
+        given=holds_all(0, {DRAGON}),
+        max_trials=100_000,
+        seed=0,
+    )
+
+    assert 20_000 < result.trials < 30_000
+    assert result.probability == pytest.approx(13 / 55, abs=0.02)
+
+
+def test_estimate_stops_at_target_precision():
+    result = estimate(
+        holds_all(0, {DRAGON}),
+        target_half_width=0.01,
+        batch_size=1_000,
+        max_trials=1_000_000,
+        seed=0,
+    )
+
+    assert result.trials < 20_000
+    assert result.half_width <= 0.01
+
+
+def test_estimate_interval():
+    assert Estimate(0, 0).interval == (0.0, 1.0)
+    low, high = Estimate(50, 100).interval
+    assert low < 0.5 < high
+    assert Estimate(500, 1000).half_width < Estimate(50, 100).half_width
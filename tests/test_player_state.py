@@ -0,0 +1,33 @@
+from tichu.card import DRAGON, MAH_JONG, PHOENIX, Card, Color, to_mask
+from tichu.player_state import PlayerState
+
+
+def test_hand_mask_follows_assignment():
+    player_state = PlayerState([MAH_JONG, Card(Color.JADE, 5)])
+    assert player_state.hand_mask == to_mask([MAH_JONG, Card(Color.JADE, 5)])
+
+    player_state.hand = [DRAGON]
+    assert player_state.hand_mask == DRAGON.mask
+
+
+def test_add_and_remove_cards_update_the_mask():
+    player_state = PlayerState([MAH_JONG])
+
+    player_state.add_cards([PHOENIX, DRAGON])
+    assert player_state.hand == [MAH_JONG, PHOENIX, DRAGON]
+    assert player_state.hand_mask == to_mask([MAH_JONG, PHOENIX, DRAGON])
+
+    player_state.remove_cards(MAH_JONG.mask | DRAGON.mask)
+    assert player_state.hand == [PHOENIX]
+    assert player_state.hand_mask == PHOENIX.mask
+
+
+def test_copy_has_its_own_mask():
+    player_state = PlayerState([MAH_JONG, DRAGON])
+    copy = player_state.copy()
+
+    copy.remove_cards([DRAGON])
+
+    assert player_state.hand_mask == to_mask([MAH_JONG, DRAGON])
+    assert copy.hand_mask == MAH_JONG.mask
+    assert copy != player_state
@@ -0,0 +1,127 @@
+import itertools
+import math
+
+import pytest
+
+from tichu.card import DECK, FULL_MASK, Card, Color, MAH_JONG, PHOENIX, DRAGON, to_mask
+from tichu.combination import Combination, CombinationType
+from tichu.probabilities import (
+    ProbabilityEngine,
+    binomial,
+    get_probability_for_any_bomb,
+    get_probability_for_cards,
+    get_probability_for_combination,
+    get_probability_for_straight,
+)
+from tichu.tichu_state import TichuState
+from tichu.player_state import PlayerState
+
+BOMB_TYPES = (CombinationType.BOMB, CombinationType.STRAIGHT_BOMB)
+STRAIGHT_TYPES = (CombinationType.STRAIGHT, CombinationType.STRAIGHT_BOMB)
+
+POOLS = [
+    # Four of a kind and a straight bomb sharing a card.
+    [Card(color, 7) for color in list(Color)[:4]]
+    + [Card(Color.JADE, value) for value in (3, 4, 5, 6, 8)]
+    + [DRAGON, Card(Color.STAR, 12)],
+    # Straights with the Mah Jong and gaps the Phoenix can fill.
+    [MAH_JONG, PHOENIX, DRAGON]
+    + [Card(Color.STAR, value) for value in (2, 3, 5, 6, 9, 10, 12)]
+    + [Card(Color.SWORDS, 4), Card(Color.PAGODE, 11)],
+]
+
+
+def _hands(pool: list[Card], hand_size: int):
+    return [list(hand) for hand in itertools.combinations(pool, hand_size)]
+
+
+def _holds(hand: list[Card], predicate) -> bool:
+    return any(
+        predicate(Combination.from_cards(to_mask(play)), play)
+        for play in Combination.iter_plays(None, hand)
+    )
+
+
+def _get_straight_top(combination: Combination, play: set[Card]) -> int:
+    """Highest value the straight can end on, with the Phoenix placed on top."""
+    if PHOENIX not in play:
+        return int(combination.value)
+    lowest = min(card.value for card in play if card != PHOENIX)
+    return min(14, lowest + combination.length - 1)
+
+
+def test_binomial():
+    assert binomial(56, 14) == math.comb(56, 14)
+    assert binomial(5, 0) == 1
+    assert binomial(5, 6) == 0
+    assert binomial(5, -1) == 0
+
+
+def test_probability_for_cards_matches_combination_probability():
+    play = {Card(Color.JADE, 2), Card(Color.STAR, 2)}
+    assert get_probability_for_cards(FULL_MASK, 14, to_mask(play)) == pytest.approx(
+        get_probability_for_combination(set(DECK), 14, play)
+    )
+    assert get_probability_for_cards(FULL_MASK & ~DRAGON.mask, 14, DRAGON.mask) == 0
+
+
+@pytest.mark.parametrize("pool", POOLS)
+@pytest.mark.parametrize("hand_size", [5, 6])
+def test_any_bomb_matches_enumeration(pool: list[Card], hand_size: int):
+    hands = _hands(pool, hand_size)
+    expected = sum(
+        _holds(
+            hand,
+            lambda combination, play: combination.combination_type in BOMB_TYPES,
+        )
+        for hand in hands
+    ) / len(hands)
+
+    assert get_probability_for_any_bomb(to_mask(pool), hand_size) == pytest.approx(
+        expected
+    )
+
+
+@pytest.mark.parametrize("pool", POOLS)
+@pytest.mark.parametrize(
+    "hand_size, min_length, above_value", [(5, 5, 0), (6, 5, 6), (7, 6, 0), (7, 5, 9)]
+)
+def test_straight_matches_enumeration(
+    pool: list[Card], hand_size: int, min_length: int, above_value: int
+):
+    hands = _hands(pool, hand_size)
+    expected = sum(
+        _holds(
+            hand,
+            lambda combination, play: combination.combination_type in STRAIGHT_TYPES
+            and combination.length >= min_length
+            and _get_straight_top(combination, play) > above_value,
+        )
+        for hand in hands
+    ) / len(hands)
+
+    assert get_probability_for_straight(
+        to_mask(pool), hand_size, min_length, above_value
+    ) == pytest.approx(expected)
+
+
+def test_full_deck_bomb_probability():
+    assert get_probability_for_any_bomb(FULL_MASK, 14) == pytest.approx(
+        0.0508, abs=1e-3
+    )
+
+
+def test_probability_engine_uses_unseen_cards():
+    own_hand = [DRAGON] + [Card(Color.JADE, value) for value in range(2, 15)]
+    state = TichuState(
+        player_states=[PlayerState(hand=list(own_hand))]
+        + [PlayerState(hand=[Card(Color.STAR, 2)] * 14) for _ in range(3)]
+    )
+    engine = ProbabilityEngine(state, 0)
+
+    assert engine.unknown_cards == FULL_MASK & ~to_mask(own_hand)
+    assert engine.holds_dragon(1) == 0
+    assert engine.holds_cards(1, {PHOENIX}) == pytest.approx(14 / 42)
+    # Without jade cards no straight bomb is possible, only four of a kinds.
+    assert 0 < engine.holds_any_bomb(1) < get_probability_for_any_bomb(FULL_MASK, 14)
+    assert 0 < engine.holds_straight(2, 5, 10) < engine.holds_straight(2, 5, 0)
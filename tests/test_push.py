@@ -0,0 +1,77 @@
+import random
+
+from tichu import HAND_SIZE, NUM_PLAYERS
+from tichu.card import DECK, Card, Color, DOG, MAH_JONG, PHOENIX, DRAGON
+from tichu.hand_decomposition import get_min_plays
+from tichu.push import choose_push, get_bomb_cards
+
+
+def _sorted(cards: list[Card]) -> list[Card]:
+    return sorted(cards, key=lambda c: c.value)
+
+
+def test_get_bomb_cards():
+    four_of_a_kind = [Card(color, 9) for color in Color if color != Color.SPECIAL]
+    straight_bomb = [Card(Color.STAR, value) for value in range(2, 7)]
+    hand = four_of_a_kind + straight_bomb + [Card(Color.JADE, 2), DRAGON]
+
+    assert get_bomb_cards(hand) == set(four_of_a_kind + straight_bomb)
+
+
+def test_choose_push_is_a_valid_push():
+    rng = random.Random(0)
+    for _ in range(50):
+        hand = _sorted(rng.sample(DECK, HAND_SIZE))
+        push = choose_push(hand)
+
+        assert len(push) == NUM_PLAYERS - 1
+        assert len(set(push)) == NUM_PLAYERS - 1
+        assert all(0 <= idx < HAND_SIZE for idx in push)
+        left, _, right = (hand[idx] for idx in push)
+        assert {left, right}.isdisjoint({PHOENIX, DRAGON})
+
+
+def test_choose_push_keeps_bombs_and_gives_partner_the_best_card():
+    bomb = [Card(color, 3) for color in Color if color != Color.SPECIAL]
+    hand = _sorted(
+        bomb
+        + [MAH_JONG, DOG, DRAGON]
+        + [Card(Color.JADE, value) for value in (5, 7, 9, 11)]
+        + [Card(Color.STAR, 13), Card(Color.SWORDS, 14), Card(Color.PAGODE, 14)]
+    )
+    left, partner, right = (hand[idx] for idx in choose_push(hand))
+
+    assert not {left, partner, right} & set(bomb)
+    assert DRAGON != partner
+    assert partner.value > max(left.value, right.value)
+
+
+def test_choose_push_does_not_break_straights():
+    straight = [Card(Color.JADE, value) for value in range(2, 7)]
+    straight[2] = Card(Color.STAR, 4)
+    hand = _sorted(
+        straight
+        + [Card(Color.SWORDS, value) for value in (8, 10, 12)]
+        + [Card(Color.PAGODE, value) for value in (8, 10, 12)]
+        + [Card(Color.STAR, 9), Card(Color.STAR, 14), DRAGON]
+    )
+    pushed = {hand[idx] for idx in choose_push(hand)}
+
+    assert not pushed & set(straight)
+
+
+def test_choose_push_breaks_bombs_if_only_special_cards_are_free():
+    fours = [
+        Card(color, value)
+        for value in (2, 3)
+        for color in Color
+        if color != Color.SPECIAL
+    ]
+    hand = _sorted(
+        fours
+        + [Card(Color.JADE, value) for value in (4, 5, 6)]
+        + [DOG, PHOENIX, DRAGON]
+    )
+    left, _, right = (hand[idx] for idx in choose_push(hand))
+
+    assert {left, right}.isdisjoint({PHOENIX, DRAGON})
@@ -0,0 +1,65 @@
+import io
+import random
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.game_record import GameRecordWriter, iter_rounds
+from tichu.random_player import RandomPlayer
+from tichu.replay import RoundReplay, replay_rounds
+from tichu.tichu import Tichu
+
+
+def test_replay_rebuilds_every_state(record_match):
+    stream, rounds, scores = record_match(seed=5, max_rounds=3)
+
+    replays = list(replay_rounds(stream, keyframe_interval=4))
+
+    assert len(replays) == len(rounds)
+    for replay, states in zip(replays, rounds):
+        assert list(replay) == states
+        assert replay.final_state == states[-1]
+        assert replay.round_scores is not None
+    assert replays[-1].scores == scores
+
+
+def test_get_state_jumps_to_any_turn(record_match):
+    stream, rounds, _ = record_match(seed=1, max_rounds=1)
+    header, plays = next(iter_rounds(stream))
+    replay = RoundReplay(header, plays, keyframe_interval=5)
+
+    assert len(replay.keyframes) == len(plays) // 5 + 1
+    for turn in (len(plays), 0, 7, 5, 1):
+        assert replay.get_state(turn) == rounds[0][turn]
+    with pytest.raises(IndexError):
+        replay.get_state(len(plays) + 1)
+
+
+def test_cut_off_rounds_are_not_scored(record_match):
+    stream, rounds, _ = record_match(seed=2, max_rounds=1)
+    header, plays = next(iter_rounds(stream))
+
+    replay = RoundReplay(header, plays[:3], scores=[10, 20])
+
+    assert replay.round_scores is None
+    assert replay.scores == [10, 20]
+    assert replay.final_state == replay.get_state(3)
+
+
+def test_replay_does_not_depend_on_the_engine_generator():
+    random.seed(6)
+    stream = io.BytesIO()
+    game = Tichu(seed=6, listeners=[], recorder=GameRecordWriter(stream))
+    play_logs = []
+    for _ in range(2):
+        # Reusing the engine and drawing from its generator between deals
+        # must not change what the record replays.
+        game.new_game([RandomPlayer(f"Player {idx}") for idx in range(NUM_PLAYERS)])
+        game.random.random()
+        game.play_round()
+        play_logs.append(game.state.play_log)
+    stream.seek(0)
+
+    replays = list(replay_rounds(stream))
+
+    assert [replay.final_state.play_log for replay in replays] == play_logs
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from tichu.random_player import RandomPlayer
+from tichu.simulation import SimulationResult, simulate
+
+PLAYERS = [RandomPlayer] * 4
+
+
+def test_simulate_aggregates_matches():
+    result = simulate(PLAYERS, games=3, seed=1, max_rounds=5, workers=1)
+    assert result.games == 3
+    assert 3 <= result.rounds <= 15
+    assert sum(result.wins) + result.draws == 3
+    assert sum(result.win_rates) <= 1
+    assert all(0 <= rate <= 1 for rate in result.tichu_success_rates)
+    assert all(0 <= rate <= 1 for rate in result.grand_tichu_success_rates)
+
+
+def test_simulate_is_reproducible():
+    first = simulate(PLAYERS, games=2, seed=7, max_rounds=3, workers=1)
+    second = simulate(PLAYERS, games=2, seed=7, max_rounds=3, workers=1)
+    assert first == second
+
+
+def test_simulate_leaves_the_global_generator_alone():
+    random.seed(11)
+    expected = random.random()
+    random.seed(11)
+
+    simulate(PLAYERS, games=2, seed=7, max_rounds=3, workers=1)
+
+    assert random.random() == expected
+
+
+def test_simulate_in_process_pool_matches_serial_run():
+    serial = simulate(PLAYERS, games=4, seed=3, max_rounds=3, workers=1)
+    pooled = simulate(PLAYERS, games=4, seed=3, max_rounds=3, workers=2)
+    assert serial == pooled
+
+
+def test_simulate_requires_four_players():
+    with pytest.raises(ValueError):
+        simulate(PLAYERS[:3], games=1)
+
+
+def test_merge():
+    result = SimulationResult(games=1, rounds=2, wins=[1, 0], points=[100, 0])
+    result.merge(SimulationResult(games=1, rounds=3, wins=[0, 0], points=[50, 150]))
+    assert result.games == 2
+    assert result.draws == 1
+    assert result.win_rates == [0.5, 0.0]
+    assert result.average_score_per_round == [30.0, 30.0]
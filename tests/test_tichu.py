@@ -1,11 +1,15 @@
+import logging
+import random
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from tichu.card import Card, Color, DOG, MAH_JONG, PHOENIX, DRAGON
 from tichu.combination import Combination, CombinationType
+from tichu.events import EventType, TichuEvent, log_event
 from tichu.player import Player
 from tichu.random_player import RandomPlayer
+from tichu.zobrist import compute_key
 from tichu.tichu import (
     GRAND_TICHU_SCORE,
     HAND_SIZE,
@@ -13,6 +17,7 @@ from tichu.tichu import (
     TICHU_SCORE,
     InvalidPlayError,
     Tichu,
+    TichuHooks,
 )
 
 
@@ -128,7 +133,8 @@ class TestNextTurnTichu:
         """Test that Tichu cannot be called without a full hand."""
 
         player_idx = game.state.current_player_idx
-        game.state.get_player_state(player_idx).hand.pop()
+        player_state = game.state.get_player_state(player_idx)
+        player_state.remove_cards(player_state.hand[-1:])
 
         with (
             patch.object(game.current_player, "get_card_play", return_value="tichu"),
@@ -137,6 +143,14 @@ class TestNextTurnTichu:
             play = game.current_player.get_card_play(game.state)
             game.next_turn(player_idx, play)
 
+    def test_tichu_call_is_logged_for_the_caller(self, game: Tichu):
+        """Test that a Tichu call out of turn is logged for the calling player."""
+
+        caller_idx = (game.state.current_player_idx + 1) % NUM_PLAYERS
+        game.next_turn(caller_idx, "tichu")
+
+        assert game.state.play_log == [(caller_idx, "tichu")]
+
 
 class TestNextTurnPlayCard:
     """Tests for playing cards in next_turn."""
@@ -494,6 +508,24 @@ class TestNextTurnSpecialCards:
             play = game.current_player.get_card_play(game.state)
             game.next_turn(0, play)
 
+    @pytest.mark.parametrize(
+        "card_play",
+        [({MAH_JONG}, None), ({MAH_JONG}, 15), ({DRAGON}, None), ({DRAGON}, 2)],
+    )
+    def test_invalid_play_argument_leaves_state_unchanged(self, game: Tichu, card_play):
+        """Test that a Dragon or Mah Jong with an invalid argument changes nothing."""
+
+        game.state.current_player_idx = 0
+        game.state.get_player_state(0).hand = [MAH_JONG, DRAGON]
+        game.state.zobrist_key = compute_key(game.state)
+        snapshot = game.state.copy()
+
+        with pytest.raises(InvalidPlayError):
+            game.next_turn(0, card_play)
+
+        assert game.state == snapshot
+        assert game.state.zobrist_key == compute_key(game.state)
+
     def test_play_dragon_stack_selection_invalid(self, game: Tichu):
         """Test that playing dragon without recipient raises error."""
 
@@ -935,6 +967,25 @@ class TestPushCards:
         assert player_2_received
         assert player_3_received
 
+    def test_push_in_list_order(self, game: Tichu):
+        """Test that a list pushes to the left player, partner and right player in order."""
+
+        hand = game.state.get_player_state(0).hand
+        card_0, card_1, card_2 = hand[0], hand[1], hand[2]
+
+        with patch("tichu.random_player.RandomPlayer.get_push_play") as mock_get_push:
+            mock_get_push.side_effect = [
+                [2, 0, 1],
+                {10, 11, 12},
+                {10, 11, 12},
+                {10, 11, 12},
+            ]
+            game.push_cards()
+
+        assert card_2 in game.state.get_player_state(3).hand
+        assert card_0 in game.state.get_player_state(2).hand
+        assert card_1 in game.state.get_player_state(1).hand
+
     def test_sequential_push_from_all_players(self, game: Tichu):
         """Test that get_push is called sequentially for each player."""
 
@@ -944,3 +995,248 @@ class TestPushCards:
             call_sequence = list(mock_get_push.call_args_list)
 
         assert len(call_sequence) == 4
+
+
+class TestCardMaskPlays:
+    """Tests for plays encoded as card bitmasks."""
+
+    def test_play_pair_as_mask(self, game: Tichu):
+        """Test that a play can be given as a bitmask instead of a set of cards."""
+
+        game.state.current_player_idx = 0
+        game.state.get_player_state(0).hand = [
+            Card(Color.JADE, 9),
+            Card(Color.STAR, 9),
+            Card(Color.SWORDS, 12),
+        ]
+        play_mask = Card(Color.JADE, 9).mask | Card(Color.STAR, 9).mask
+
+        game.next_turn(0, (play_mask, None))
+
+        assert game.state.get_player_state(0).hand == [Card(Color.SWORDS, 12)]
+        assert game.state.current_combination == Combination(CombinationType.PAIR, 9)
+        assert len(game.state.card_stack) == 2
+
+    def test_mask_with_foreign_card_raises_error(self, game: Tichu):
+        """Test that a bitmask containing cards outside the hand is rejected."""
+
+        game.state.current_player_idx = 0
+        game.state.get_player_state(0).hand = [Card(Color.JADE, 9)]
+
+        with pytest.raises(InvalidPlayError):
+            game.next_turn(0, (Card(Color.STAR, 9).mask, None))
+
+        assert game.state.get_player_state(0).hand == [Card(Color.JADE, 9)]
+
+
+class TestPlayMatch:
+    """Tests for the play_round and play_match drivers."""
+
+    @pytest.fixture
+    def match(self) -> Tichu:
+        random.seed(0)
+        game_instance = Tichu(seed=42)
+        game_instance.new_game(
+            [RandomPlayer(f"Player {i}") for i in range(NUM_PLAYERS)]
+        )
+        return game_instance
+
+    def test_play_round_runs_to_end_of_round(self, match: Tichu):
+        """Test that a round is played out and its scores are returned."""
+
+        turns = []
+        rounds = []
+        hooks = TichuHooks(
+            on_turn_end=lambda game, player_idx, card_play: turns.append(player_idx),
+            on_round_end=lambda game, round_scores: rounds.append(round_scores),
+        )
+
+        round_scores = match.play_round(hooks)
+
+        assert match.end_of_round
+        assert match.state.current_round == 1
+        assert rounds == [round_scores]
+        assert match.state.scores == round_scores
+        assert len(turns) == len(match.state.play_log)
+
+    def test_play_match_stops_at_goal_score(self, match: Tichu):
+        """Test that the match ends once a team reaches the goal score."""
+
+        match.goal_score = 200
+        with patch(
+            "tichu.random_player.RandomPlayer.get_grand_tichu_play",
+            return_value="pass",
+        ):
+            scores = match.play_match()
+
+        assert match.match_over
+        assert max(scores) >= 200
+        assert scores[0] != scores[1]
+
+    def test_play_match_stops_at_max_rounds(self, match: Tichu):
+        """Test that max_rounds bounds the number of rounds played."""
+
+        match.goal_score = 10**6
+        match.play_match(max_rounds=2)
+
+        assert match.state.current_round == 2
+        assert not match.match_over
+
+    def test_invalid_plays_are_retried(self, match: Tichu):
+        """Test that an invalid play is reported and the player asked again."""
+
+        invalid_plays = []
+        hooks = TichuHooks(
+            on_invalid_play=lambda game, player_idx, card_play, e: invalid_plays.append(
+                card_play
+            )
+        )
+        get_card_play = RandomPlayer.get_card_play
+        attempts = iter([({DRAGON, DOG}, None)])
+
+        def first_play_invalid(player, game_state):
+            return next(attempts, None) or get_card_play(player, game_state)
+
+        with patch.object(RandomPlayer, "get_card_play", first_play_invalid):
+            match.play_round(hooks)
+
+        assert invalid_plays == [({DRAGON, DOG}, None)]
+        assert match.end_of_round
+
+    def test_invalid_plays_are_retried_on_an_unchanged_state(self, match: Tichu):
+        """Test that a rejected play is retried from the state before it."""
+
+        states = []
+        rejected_states = []
+        hooks = TichuHooks(
+            on_turn_start=lambda game: states.append(game.state.copy()),
+            on_invalid_play=lambda game, *_: rejected_states.append(game.state.copy()),
+        )
+        get_card_play = RandomPlayer.get_card_play
+        # The holder of the Mah Jong leads and first forgets the wish.
+        attempts = iter([({MAH_JONG}, None)])
+
+        def first_play_invalid(player, game_state):
+            return next(attempts, None) or get_card_play(player, game_state)
+
+        with patch.object(RandomPlayer, "get_card_play", first_play_invalid):
+            match.play_round(hooks)
+
+        assert rejected_states == states[:1]
+        assert match.end_of_round
+
+    def test_repeated_invalid_plays_raise_error(self, match: Tichu):
+        """Test that a player exceeding max_invalid_plays aborts the round."""
+
+        with patch.object(
+            RandomPlayer, "get_card_play", return_value=({DRAGON, DOG}, None)
+        ):
+            with pytest.raises(InvalidPlayError):
+                match.play_round(max_invalid_plays=2)
+
+
+class TestEvents:
+    """Tests for structured game events."""
+
+    def test_events_are_sent_to_listeners(self, game: Tichu):
+        """Test that plays and passes are reported to attached listeners."""
+
+        events = []
+        game.listeners = [lambda game, event: events.append(event)]
+        game.state.current_player_idx = 0
+        game.state.get_player_state(0).hand = [
+            Card(Color.JADE, 9),
+            Card(Color.SWORDS, 12),
+        ]
+
+        game.next_turn(0, ({Card(Color.JADE, 9)}, None))
+        game.next_turn(1, "pass")
+
+        assert events == [
+            TichuEvent(EventType.CARDS_PLAYED, 0, cards=Card(Color.JADE, 9).mask),
+            TichuEvent(EventType.PASSED, 1),
+        ]
+        assert events[0].format() == "JADE 9"
+        assert events[1].format("Player 1") == "Player 1 has passed."
+
+    def test_no_formatting_without_listeners(self, game: Tichu):
+        """Test that games have no listeners by default, so no event is built."""
+
+        assert game.listeners == []
+        game.state.current_player_idx = 0
+        game.state.get_player_state(0).hand = [
+            Card(Color.JADE, 9),
+            Card(Color.SWORDS, 12),
+        ]
+
+        with (
+            patch("tichu.tichu.TichuEvent") as event_class,
+            patch.object(Card, "__str__") as card_str,
+        ):
+            game.next_turn(0, ({Card(Color.JADE, 9)}, None))
+            game.next_turn(1, "pass")
+
+        event_class.assert_not_called()
+        card_str.assert_not_called()
+
+    def test_round_scores_are_logged(self, game: Tichu, caplog):
+        """Test that the log_event listener logs formatted messages."""
+
+        game.listeners = [log_event]
+        game.state.player_rankings = [0, 2]
+
+        with caplog.at_level(logging.INFO):
+            game.end_round_scoring()
+
+        assert "Team 0 scored 200 points this round. Total score: 200" in caplog.text
+
+
+class TestApplyUndoMove:
+    """Tests for state snapshots and move undo."""
+
+    def test_state_copy_is_independent(self, game: Tichu):
+        """Test that a copied state shares no mutable parts with the original."""
+
+        snapshot = game.state.copy()
+        assert snapshot == game.state
+
+        player_state = game.state.get_player_state(0)
+        player_state.remove_cards(player_state.hand[-1:])
+        game.state.get_player_state(1).has_passed = True
+        game.state.card_stack.append(DRAGON)
+        game.state.scores[0] = 100
+
+        assert snapshot != game.state
+        assert len(snapshot.get_player_state(0).hand) == HAND_SIZE
+        assert not snapshot.get_player_state(1).has_passed
+        assert snapshot.card_stack == []
+        assert snapshot.scores == [0, 0]
+
+    def test_undo_restores_state_over_a_round(self, game: Tichu):
+        """Test that every move of a random round can be undone exactly."""
+
+        random.seed(3)
+        while not game.end_of_round:
+            player_idx = game.state.current_player_idx
+            card_play = game.current_player.get_card_play(game.state)
+            snapshot = game.state.copy()
+            record = game.apply_move(player_idx, card_play)
+            after = game.state.copy()
+
+            game.undo_move(record)
+            assert game.state == snapshot
+
+            game.apply_move(player_idx, card_play)
+            assert game.state == after
+
+    def test_invalid_move_leaves_state_unchanged(self, game: Tichu):
+        """Test that a move failing halfway through is rolled back."""
+
+        game.state.current_player_idx = 0
+        game.state.get_player_state(0).hand = [DRAGON, Card(Color.JADE, 9)]
+        snapshot = game.state.copy()
+
+        with pytest.raises(InvalidPlayError):
+            game.apply_move(0, ({DRAGON}, None))
+
+        assert game.state == snapshot
@@ -0,0 +1,52 @@
+from tichu.transposition_table import TranspositionTable
+
+
+def test_store_and_get():
+    table = TranspositionTable(size_bits=4)
+    table.store(0x1234, depth=3, value=1.5)
+
+    assert table.get(0x1234, depth=3) == 1.5
+    assert table.get(0x1234, depth=2) == 1.5
+    assert table.get(0x1234, depth=4) is None
+    assert table.get(0x5678, depth=1) is None
+    assert (table.hits, table.misses) == (2, 2)
+    assert len(table) == 1
+
+
+def test_deeper_entries_are_kept_within_a_search():
+    table = TranspositionTable(size_bits=4)
+    table.store(0x10, depth=5, value=1.0)
+    table.store(0x20, depth=2, value=2.0)
+    table.store(0x10, depth=3, value=3.0)
+
+    assert table.get(0x10, depth=5) == 1.0
+    assert table.get(0x20, depth=1) is None
+
+
+def test_equal_or_deeper_results_replace_entries():
+    table = TranspositionTable(size_bits=4)
+    table.store(0x10, depth=2, value=1.0)
+    table.store(0x20, depth=2, value=2.0)
+
+    assert table.get(0x10, depth=1) is None
+    assert table.get(0x20, depth=2) == 2.0
+
+
+def test_entries_of_older_searches_are_replaced():
+    table = TranspositionTable(size_bits=4)
+    table.store(0x10, depth=5, value=1.0)
+    table.new_search()
+
+    assert table.get(0x10, depth=5) == 1.0
+    table.store(0x20, depth=1, value=2.0)
+    assert table.get(0x10, depth=1) is None
+    assert table.get(0x20, depth=1) == 2.0
+
+
+def test_clear():
+    table = TranspositionTable(size_bits=4)
+    table.store(0x10, depth=1, value=1.0)
+    table.clear()
+
+    assert len(table) == 0
+    assert table.get(0x10, depth=1) is None
@@ -0,0 +1,99 @@
+import random
+from unittest.mock import patch
+
+import pytest
+
+from tichu import NUM_PLAYERS
+from tichu.card import Card, Color
+from tichu.combination import Combination, CombinationType
+from tichu.random_player import RandomPlayer
+from tichu.tichu import Tichu
+from tichu.zobrist import compute_key, get_combination_key
+
+
+@pytest.fixture
+def game() -> Tichu:
+    random.seed(0)
+    game_instance = Tichu(seed=42, listeners=[])
+    game_instance.new_game([RandomPlayer(f"Player {i}") for i in range(NUM_PLAYERS)])
+    with patch(
+        "tichu.random_player.RandomPlayer.get_grand_tichu_play", return_value="pass"
+    ):
+        game_instance.start_new_round()
+    return game_instance
+
+
+def test_key_is_set_at_round_start(game: Tichu):
+    assert game.state.zobrist_key == compute_key(game.state)
+    assert game.state.zobrist_key != 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_key_matches_full_computation(seed: int):
+    random.seed(seed)
+    game = Tichu(seed=seed, listeners=[])
+    game.new_game([RandomPlayer(f"Player {i}") for i in range(NUM_PLAYERS)])
+    game.start_new_round()
+    while not game.end_of_round:
+        game.next_turn(
+            game.state.current_player_idx,
+            game.current_player.get_card_play(game.state),
+        )
+        assert game.state.zobrist_key == compute_key(game.state)
+
+
+def test_undo_restores_key(game: Tichu):
+    key = game.state.zobrist_key
+    player_idx = game.state.current_player_idx
+    record = game.apply_move(player_idx, game.current_player.get_card_play(game.state))
+    assert game.state.zobrist_key != key
+
+    game.undo_move(record)
+
+    assert game.state.zobrist_key == key
+
+
+def test_same_position_by_different_move_orders(game: Tichu):
+    hands = [
+        [Card(Color.JADE, 2), Card(Color.JADE, 3), Card(Color.STAR, 9)],
+        [Card(Color.STAR, 10)],
+        [Card(Color.SWORDS, 10)],
+        [Card(Color.PAGODE, 10)],
+    ]
+    for player_state, hand in zip(game.state.player_states, hands):
+        player_state.hand = list(hand)
+        player_state.card_stack.clear()
+    game.state.current_player_idx = 0
+    game.state.winning_player_idx = 0
+    game.state.current_combination = None
+    game.state.current_wish = None
+    game.state.zobrist_key = compute_key(game.state)
+    branch = game.state.copy()
+
+    def play_trick(card: Card):
+        game.next_turn(0, ({card}, None))
+        for player_idx in range(1, NUM_PLAYERS):
+            game.next_turn(player_idx, "pass")
+
+    play_trick(Card(Color.JADE, 2))
+    play_trick(Card(Color.JADE, 3))
+    key = game.state.zobrist_key
+    game.state = branch
+    play_trick(Card(Color.JADE, 3))
+    play_trick(Card(Color.JADE, 2))
+
+    assert game.state.zobrist_key == key
+    assert key == compute_key(game.state)
+
+
+def test_combination_keys_differ():
+    combinations = [
+        None,
+        Combination(CombinationType.SINGLE, 10),
+        Combination(CombinationType.SINGLE, 10.5),
+        Combination(CombinationType.PAIR, 10),
+        Combination(CombinationType.STRAIGHT, 10, 5),
+        Combination(CombinationType.STRAIGHT, 10, 6),
+    ]
+    keys = {get_combination_key(combination) for combination in combinations}
+    assert len(keys) == len(combinations)